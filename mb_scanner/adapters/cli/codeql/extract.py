@@ -2,12 +2,10 @@
 
 from pathlib import Path
 
-from joblib import Parallel, delayed
 import typer
 
-from mb_scanner.adapters.gateways.codeql.sarif import SarifExtractor, extract_code_for_project
+from mb_scanner.adapters.gateways.codeql.sarif import SarifExtractor, extract_code_for_projects
 from mb_scanner.adapters.repositories.sqlalchemy_project_repo import SqlAlchemyProjectRepository
-from mb_scanner.domain.entities import CodeExtractionJobResult
 from mb_scanner.infrastructure.config import settings
 from mb_scanner.infrastructure.db.session import SessionLocal
 
@@ -40,13 +38,9 @@ def extract_code(
 
     try:
         extractor = SarifExtractor(sarif_path=sarif_path, repository_path=repository_path)
-        extraction_output = extractor.extract_all()
+        total_results = extractor.extract_all_to_file(output)
 
-        output.parent.mkdir(parents=True, exist_ok=True)
-        with output.open("w", encoding="utf-8") as f:
-            f.write(extraction_output.model_dump_json(indent=2))
-
-        typer.echo(f"\nSuccessfully extracted code from {extraction_output.metadata.total_results} results")
+        typer.echo(f"\nSuccessfully extracted code from {total_results} results")
         typer.echo(f"  Output file: {output}")
 
     except FileNotFoundError as e:
@@ -89,15 +83,14 @@ def extract_code_batch(
 
         typer.echo(f"Found {len(project_names)} projects to process")
 
-        results_list: list[CodeExtractionJobResult] = Parallel(n_jobs=threads, verbose=10)(
-            delayed(extract_code_for_project)(
-                query_id=query_id,
-                project_name=project,
-                sarif_base_dir=sarif_base_dir,
-                repository_base_dir=settings.effective_codeql_clone_dir,
-                output_base_dir=output_dir,
-            )
-            for project in project_names
+        results_list = extract_code_for_projects(
+            query_id=query_id,
+            project_names=project_names,
+            sarif_base_dir=sarif_base_dir,
+            repository_base_dir=settings.effective_codeql_clone_dir,
+            output_base_dir=output_dir,
+            n_jobs=threads,
+            verbose=10,
         )
 
         success_count = sum(1 for r in results_list if r.status == "success")
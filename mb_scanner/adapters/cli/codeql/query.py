@@ -4,7 +4,8 @@ from pathlib import Path
 
 import typer
 
-from mb_scanner.adapters.gateways.codeql import CodeQLCLI, CodeQLDatabaseManager
+from mb_scanner.adapters.cli._utils import resolve_workers
+from mb_scanner.adapters.gateways.codeql import CodeQLCLI, CodeQLDatabaseManager, resolve_n_jobs
 from mb_scanner.adapters.gateways.codeql.analyzer import CodeQLResultAnalyzer
 from mb_scanner.adapters.repositories.sqlalchemy_project_repo import SqlAlchemyProjectRepository
 from mb_scanner.infrastructure.config import settings
@@ -16,12 +17,16 @@ def query(
     project_name: str = typer.Argument(..., help="プロジェクト名（owner/repo形式）"),
     query_files: list[Path] = typer.Option(..., "--query-files", "-q", help="クエリファイルのパス"),
     format: str | None = typer.Option(None, "--format", help="出力形式"),
-    threads: int | None = typer.Option(None, "--threads", help="使用するスレッド数"),
+    threads: int | None = typer.Option(
+        None, "--threads", help="使用するスレッド数（未指定時は設定値、0でCPUコア数ぶん）"
+    ),
     ram: int | None = typer.Option(None, "--ram", help="使用するRAM（MB）"),
 ) -> None:
     """指定したプロジェクトのCodeQLデータベースに対してクエリを実行する"""
     if format is None:
         format = settings.codeql_default_output_format
+    if threads is None:
+        threads = settings.codeql_default_threads
 
     typer.echo(f"Executing CodeQL query for: {project_name}")
     typer.echo(f"Query files: {', '.join(str(q) for q in query_files)}")
@@ -52,20 +57,51 @@ def query(
 
 
 def query_batch(
+    *,
     query_files: list[Path] = typer.Option(..., "--query-files", "-q", help="クエリファイルのパス"),
     max_projects: int | None = typer.Option(None, "--max-projects", help="最大プロジェクト数"),
     format: str | None = typer.Option(None, "--format", help="出力形式"),
-    threads: int | None = typer.Option(None, "--threads", help="使用するスレッド数"),
-    ram: int | None = typer.Option(None, "--ram", help="使用するRAM（MB）"),
+    threads: int | None = typer.Option(
+        None, "--threads", help="使用するスレッド数（未指定時は設定値、0でCPUコア数ぶん）"
+    ),
+    ram: int | None = typer.Option(
+        None, "--ram", help="使用するRAM（MB）の合計。並列実行時は各プロジェクトの処理に均等に割り当てる"
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        help=(
+            "同時に処理するプロジェクト数（-1で全CPUコア。--threads と合わせてCPUコア数を超えないよう制限され、"
+            "--ram は並列数で等分される）"
+        ),
+    ),
 ) -> None:
     """データベース上の全プロジェクトに対してクエリを一括実行する"""
     if format is None:
         format = settings.codeql_default_output_format
+    if threads is None:
+        threads = settings.codeql_default_threads
+
+    try:
+        requested_workers = resolve_workers(workers)
+    except ValueError as e:
+        typer.echo(f"Invalid --workers: {e}", err=True)
+        raise typer.Exit(code=1) from e
+    # 各 CodeQL プロセスも --threads ぶんのスレッドを使うため、合計がCPUコア数に収まるよう並列数を抑える
+    actual_workers = resolve_n_jobs(requested_workers, threads)
+    # 同様に、同時に動く CodeQL プロセスの RAM 合計が --ram に収まるよう1プロセスあたりの割り当てを等分する
+    ram_per_worker = max(1, ram // actual_workers) if ram is not None else None
 
     typer.echo("Starting batch CodeQL query execution")
     typer.echo(f"Query files: {', '.join(str(q) for q in query_files)}")
     typer.echo(f"Max projects: {max_projects or 'unlimited'}")
     typer.echo(f"Output directory: {settings.effective_codeql_output_dir}")
+    if actual_workers < requested_workers:
+        typer.echo(f"Workers: {actual_workers} (requested {requested_workers}, limited by --threads={threads})")
+    else:
+        typer.echo(f"Workers: {actual_workers}")
+    if ram is not None and actual_workers > 1:
+        typer.echo(f"RAM per worker: {ram_per_worker} MB (--ram={ram} split across {actual_workers} workers)")
 
     db = SessionLocal()
     try:
@@ -93,7 +129,8 @@ def query_batch(
             output_base_dir=settings.effective_codeql_output_dir,
             format=format,
             threads=threads,
-            ram=ram,
+            ram=ram_per_worker,
+            workers=actual_workers,
         )
 
         typer.echo("\n=== Batch Execution Summary ===")
@@ -1,12 +1,15 @@
 """GitHub関連のCLIコマンド"""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import cast
+from pathlib import Path
+from typing import Literal, cast
 
 from rich.console import Console
 from rich.table import Table
 import typer
 
+from mb_scanner.adapters.cli._utils import resolve_workers
 from mb_scanner.adapters.gateways.github import RepositoryCloner
 from mb_scanner.adapters.gateways.github.client import GitHubClient
 from mb_scanner.adapters.repositories.sqlalchemy_project_repo import SqlAlchemyProjectRepository
@@ -26,8 +29,8 @@ def rate_limit() -> None:
         $ mb-scanner github rate-limit
     """
     try:
-        client = GitHubClient()
-        info = client.get_rate_limit_info()
+        with GitHubClient() as client:
+            info = client.get_rate_limit_info()
 
         # ステータスを判定
         limit = cast(int, info["limit"])
@@ -69,10 +72,61 @@ def rate_limit() -> None:
         raise typer.Exit(code=1) from e
 
 
+def _clone_project(
+    cloner: RepositoryCloner,
+    full_name: str,
+    url: str,
+    clone_path: Path,
+    *,
+    force: bool,
+) -> tuple[str, Literal["success", "skipped", "failed"] | None, list[tuple[str, bool]]]:
+    """1プロジェクトをクローンする（並列実行用）
+
+    並列実行中に出力が混ざらないよう、表示するメッセージは返り値として呼び出し元に渡す。
+
+    Args:
+        cloner: RepositoryCloner
+        full_name: プロジェクト名（owner/repo形式）
+        url: リポジトリのURL
+        clone_path: クローン先のパス
+        force: 既存ディレクトリを削除して再クローンするか
+
+    Returns:
+        tuple: (プロジェクト名, 集計ステータス, [(メッセージ, エラー出力か)])
+    """
+    messages: list[tuple[str, bool]] = []
+    try:
+        # forceの場合は既存ディレクトリを削除
+        if force and clone_path.exists():
+            messages.append((f"  Removing existing clone: {clone_path}", False))
+            cleanup_directory(clone_path, ignore_errors=False)
+
+        # クローン前にディレクトリが存在するかチェック
+        existed_before = clone_path.exists()
+
+        # クローン
+        messages.append((f"  Cloning to: {clone_path}", False))
+        cloner.clone(url, clone_path, skip_if_exists=not force)
+
+        # クローン後の判定
+        if not existed_before and clone_path.exists():
+            messages.append(("  ✓ Successfully cloned", False))
+            return full_name, "success", messages
+        if existed_before:
+            messages.append(("  ⊘ Skipped (already exists)", False))
+            return full_name, "skipped", messages
+        return full_name, None, messages
+
+    except Exception as e:
+        messages.append((f"  ✗ Error: {e}", True))
+        return full_name, "failed", messages
+
+
 @github_app.command("clone")
 def clone(
     max_projects: int | None = typer.Option(None, help="最大プロジェクト数"),
     force: bool = typer.Option(False, "--force", "-f", help="既存リポジトリを削除して再クローン"),
+    workers: int = typer.Option(4, "--workers", help="同時に実行するクローン数（-1で全CPUコア）"),
 ) -> None:
     """DB上の全プロジェクトをクローンする
 
@@ -80,10 +134,18 @@ def clone(
         $ mb-scanner github clone
         $ mb-scanner github clone --max-projects 10
         $ mb-scanner github clone --force
+        $ mb-scanner github clone --workers 8
     """
+    try:
+        actual_workers = resolve_workers(workers)
+    except ValueError as e:
+        typer.echo(f"Invalid --workers: {e}", err=True)
+        raise typer.Exit(code=1) from e
+
     typer.echo("Starting repository cloning")
     typer.echo(f"Max projects: {max_projects or 'unlimited'}")
     typer.echo(f"Force re-clone: {force}")
+    typer.echo(f"Workers: {actual_workers}")
 
     # データベースセッションを作成
     db = SessionLocal()
@@ -115,37 +177,34 @@ def clone(
             "failed": 0,
         }
 
-        for _project_id, full_name, url in projects:
-            typer.echo(f"\nProcessing: {full_name}")
-
-            # クローン先のパスを決定
-            safe_name = full_name.replace("/", "-")
-            clone_path = clone_base_dir / safe_name
-
-            try:
-                # forceの場合は既存ディレクトリを削除
-                if force and clone_path.exists():
-                    typer.echo(f"  Removing existing clone: {clone_path}")
-                    cleanup_directory(clone_path, ignore_errors=False)
-
-                # クローン前にディレクトリが存在するかチェック
-                existed_before = clone_path.exists()
-
-                # クローン
-                typer.echo(f"  Cloning to: {clone_path}")
-                cloner.clone(url, clone_path, skip_if_exists=not force)
-
-                # クローン後の判定
-                if not existed_before and clone_path.exists():
-                    typer.echo("  ✓ Successfully cloned")
-                    stats["success"] += 1
-                elif existed_before:
-                    typer.echo("  ⊘ Skipped (already exists)")
-                    stats["skipped"] += 1
-
-            except Exception as e:
-                typer.echo(f"  ✗ Error: {e}", err=True)
-                stats["failed"] += 1
+        # クローン先は owner/repo の "/" を "-" に置換した名前のため、別リポジトリが同じディレクトリになりうる
+        # （例: a-b/c と a/b-c）。並列に同じディレクトリを削除・クローンしないよう、2件目以降は警告してスキップする
+        owner_by_path: dict[Path, str] = {}
+        for _project_id, full_name, _url in projects:
+            owner_by_path.setdefault(clone_base_dir / full_name.replace("/", "-"), full_name)
+
+        # git clone はネットワーク待ちが大半のため、スレッドで並列に実行する
+        # 結果は入力順に受け取り、プロジェクトごとのログをまとめて表示する
+        def clone_one(
+            project: tuple[int, str, str],
+        ) -> tuple[str, Literal["success", "skipped", "failed"] | None, list[tuple[str, bool]]]:
+            _project_id, full_name, url = project
+            clone_path = clone_base_dir / full_name.replace("/", "-")
+            owner = owner_by_path[clone_path]
+            if owner != full_name:
+                message = f"  ⊘ Skipped (clone directory {clone_path} is already used by {owner})"
+                return full_name, "skipped", [(message, True)]
+            return _clone_project(cloner, full_name, url, clone_path, force=force)
+
+        with ThreadPoolExecutor(max_workers=actual_workers) as executor:
+            outcomes = executor.map(clone_one, projects)
+
+            for full_name, status, messages in outcomes:
+                typer.echo(f"\nProcessing: {full_name}")
+                for message, is_error in messages:
+                    typer.echo(message, err=is_error)
+                if status is not None:
+                    stats[status] += 1
 
         # 結果を表示
         typer.echo("\n=== Cloning Summary ===")
@@ -110,21 +110,21 @@ def search(
         db = next(db_generator)
 
         try:
-            # 依存を構築してワークフローを実行
-            github_client = GitHubClient()
-            project_repo = SqlAlchemyProjectRepository(db)
-            workflow = SearchAndStoreWorkflow(
-                github_client=github_client,
-                project_repo=project_repo,
-            )
-            logger.info("Starting search and store workflow...")
-            typer.echo("検索を開始します...")
-
-            stats = workflow.execute(
-                criteria=criteria,
-                max_results=max_results,
-                update_if_exists=update,
-            )
+            # 依存を構築してワークフローを実行（GitHub クライアントは with を抜けた時点で閉じる）
+            with GitHubClient() as github_client:
+                project_repo = SqlAlchemyProjectRepository(db)
+                workflow = SearchAndStoreWorkflow(
+                    github_client=github_client,
+                    project_repo=project_repo,
+                )
+                logger.info("Starting search and store workflow...")
+                typer.echo("検索を開始します...")
+
+                stats = workflow.execute(
+                    criteria=criteria,
+                    max_results=max_results,
+                    update_if_exists=update,
+                )
 
             # 結果を表示
             typer.echo()
@@ -146,9 +146,6 @@ def search(
             else:
                 typer.echo(typer.style("✓ 完了しました！", fg=typer.colors.GREEN))
 
-            # クリーンアップ
-            workflow.close()
-
         finally:
             # データベースセッションをクローズ
             db.close()
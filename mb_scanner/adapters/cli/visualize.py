@@ -2,13 +2,10 @@
 
 from pathlib import Path
 
-from scipy import stats
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 import typer
 
-from mb_scanner.adapters.gateways.visualization.boxplot import create_boxplot_summary
-from mb_scanner.adapters.gateways.visualization.scatter_plot import create_hexbin_plot, create_scatter_plot
 from mb_scanner.adapters.repositories.sqlalchemy_project_repo import SqlAlchemyProjectRepository
 from mb_scanner.infrastructure.config import settings
 from mb_scanner.use_cases.visualization import VisualizationService
@@ -125,6 +122,12 @@ def scatter(
             --xlim-min 10 --xlim-max 10000000 \
             --ylim-min 1 --ylim-max 100000
     """
+    # matplotlib/scipy の読み込みは重いため、コマンド実行時まで遅延させる（CLI全体の起動を軽くする）
+    from mb_scanner.adapters.gateways.visualization.scatter_plot import (  # noqa: PLC0415
+        create_hexbin_plot,
+        create_scatter_plot,
+    )
+
     try:
         # データベース接続
         engine = create_engine(settings.database_url)
@@ -225,6 +228,8 @@ def correlation(
         mb-scanner visualize correlation \
             --query-result outputs/queries/detect_strict/summary/id_10_limit_1.json
     """
+    from scipy import stats  # noqa: PLC0415
+
     try:
         # データベース接続
         engine = create_engine(settings.database_url)
@@ -366,6 +371,8 @@ def boxplot(
             --output outputs/plots/boxplot_summary.png \
             --log-scale
     """
+    from mb_scanner.adapters.gateways.visualization.boxplot import create_boxplot_summary  # noqa: PLC0415
+
     try:
         typer.echo(f"Loading summary data from: {input_dir}")
         typer.echo(f"Y-axis scale: {'logarithmic' if log_scale else 'linear'}")
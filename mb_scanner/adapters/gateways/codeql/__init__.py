@@ -1,7 +1,8 @@
 from mb_scanner.adapters.gateways.codeql.command import CodeQLCLI
-from mb_scanner.adapters.gateways.codeql.database import CodeQLDatabaseManager
+from mb_scanner.adapters.gateways.codeql.database import CodeQLDatabaseManager, resolve_n_jobs
 
 __all__ = [
     "CodeQLCLI",
     "CodeQLDatabaseManager",
+    "resolve_n_jobs",
 ]
@@ -6,20 +6,43 @@
 from datetime import UTC, datetime
 import json
 import logging
+import os
 from pathlib import Path
+import re
+from typing import Any
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# SARIFを JSON パースせずに事前判定するためのバイトパターン
+_EMPTY_RESULTS_PATTERN = re.compile(rb'"results"\s*:\s*\[\s*\]')
+_NON_EMPTY_RUNS_PATTERN = re.compile(rb'"runs"\s*:\s*\[\s*\{')
+_JSON_OBJECT_START_PATTERN = re.compile(rb"\s*\{")
+
+
+def _result_rule_id(result: dict[str, Any]) -> str | None:
+    """SARIFの result から ruleId を取得する（ruleId が無い場合は rule.id を参照）"""
+    rule_id = result.get("ruleId")
+    if rule_id is None:
+        rule_id = result.get("rule", {}).get("id")
+    return rule_id
+
 
 class CodeQLResultAnalyzer:
     """CodeQL SARIF結果の分析クラス
 
     SARIF形式の結果ファイルから検出件数を取得したり、
     閾値によるフィルタリングを行ったりする機能を提供します。
+    同一インスタンス内では、ファイルの (パス, mtime, サイズ) をキーに件数をキャッシュし、
+    同じSARIFファイルの再パースを省略します。
     """
 
-    @staticmethod
-    def count_results(sarif_path: Path) -> int:
+    def __init__(self) -> None:
+        """CodeQLResultAnalyzerを初期化する"""
+        self._count_cache: dict[tuple[str, int, int], int] = {}
+
+    def count_results(self, sarif_path: Path) -> int:
         """SARIF結果ファイルから検出件数を取得
 
         Args:
@@ -36,14 +59,37 @@ class CodeQLResultAnalyzer:
             >>> analyzer = CodeQLResultAnalyzer()
             >>> count = analyzer.count_results(Path("results.sarif"))
         """
-        if not sarif_path.exists():
+        try:
+            st = sarif_path.stat()
+        except FileNotFoundError as e:
             error_msg = f"SARIF file does not exist: {sarif_path}"
             logger.error(error_msg)
-            raise FileNotFoundError(error_msg)
+            raise FileNotFoundError(error_msg) from e
+
+        # ファイルが再生成されれば mtime / サイズが変わるため、キャッシュは自動的に無効化される
+        cache_key = (str(sarif_path), st.st_mtime_ns, st.st_size)
+        cached = self._count_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        raw = sarif_path.read_bytes()
+
+        # 空でない runs 配列が無い JSON オブジェクトは、パースせずに不正なSARIFとして扱う
+        # （オブジェクトで始まらない内容は JSON として不正な可能性があるため、パースしてエラーを判別する）
+        if _JSON_OBJECT_START_PATTERN.match(raw) and not _NON_EMPTY_RUNS_PATTERN.search(raw):
+            error_msg = f"Invalid SARIF format (missing runs): {sarif_path}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        # 高速パス: "results" キーが1つだけで空配列なら、パースせずに0件と判定する
+        if raw.count(b'"results"') == 1 and raw.count(b'"runs"') == 1 and _EMPTY_RESULTS_PATTERN.search(raw):
+            logger.debug("Counted 0 results in %s (empty results fast path)", sarif_path)
+            self._count_cache[cache_key] = 0
+            return 0
 
         try:
-            with sarif_path.open() as f:
-                sarif_data = json.load(f)
+            # テキストモードのデコード層を経由せず、バイト列を一括でパースする
+            sarif_data = json.loads(raw)
 
             # SARIF形式の検証
             if "runs" not in sarif_data or not sarif_data["runs"]:
@@ -56,15 +102,80 @@ class CodeQLResultAnalyzer:
             count = len(results)
 
             logger.debug("Counted %d results in %s", count, sarif_path)
+            self._count_cache[cache_key] = count
             return count
 
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             error_msg = f"Invalid SARIF format (JSON decode error): {sarif_path}"
             logger.error(error_msg)
             raise ValueError(error_msg) from e
 
-    @staticmethod
+    def split_results_by_rule(self, sarif_path: Path, outputs: dict[str, Path]) -> dict[str, int]:
+        """複数クエリをまとめて実行したSARIFを、ruleIdごとのSARIFファイルに分割する
+
+        tool / rules などの run 情報はそのまま残し、results だけを各 ruleId のものに絞り込む。
+
+        Args:
+            sarif_path: 分割元のSARIFファイルのパス
+            outputs: ruleId（クエリの @id）と出力先SARIFパスの辞書
+
+        Returns:
+            dict[str, int]: ruleId と分割後の検出件数の辞書
+
+        Raises:
+            FileNotFoundError: SARIFファイルが存在しない場合
+            ValueError: SARIF形式が不正な場合
+
+        Examples:
+            >>> analyzer = CodeQLResultAnalyzer()
+            >>> counts = analyzer.split_results_by_rule(
+            ...     Path("combined.sarif"),
+            ...     {"js/id-10": Path("id_10/facebook-react.sarif")},
+            ... )
+        """
+        try:
+            sarif_data = json.loads(sarif_path.read_bytes())
+        except FileNotFoundError as e:
+            error_msg = f"SARIF file does not exist: {sarif_path}"
+            logger.error(error_msg)
+            raise FileNotFoundError(error_msg) from e
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            error_msg = f"Invalid SARIF format (JSON decode error): {sarif_path}"
+            logger.error(error_msg)
+            raise ValueError(error_msg) from e
+
+        runs = sarif_data.get("runs")
+        if not runs:
+            error_msg = f"Invalid SARIF format (missing runs): {sarif_path}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        # 各 run の results を1パスで ruleId ごとに振り分ける
+        split_runs: dict[str, list[dict[str, Any]]] = {rule_id: [] for rule_id in outputs}
+        for run in runs:
+            buckets: dict[str, list[Any]] = {rule_id: [] for rule_id in outputs}
+            for result in run.get("results", []):
+                rule_id = _result_rule_id(result)
+                if rule_id is None:
+                    continue
+                bucket = buckets.get(rule_id)
+                if bucket is not None:
+                    bucket.append(result)
+            for rule_id, bucket in buckets.items():
+                split_runs[rule_id].append({**run, "results": bucket})
+
+        counts: dict[str, int] = {}
+        for rule_id, output_path in outputs.items():
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_bytes(json.dumps({**sarif_data, "runs": split_runs[rule_id]}).encode())
+            # count_results と同様に最初の run の件数を数える
+            counts[rule_id] = len(split_runs[rule_id][0]["results"])
+
+        logger.debug("Split %s into %d SARIF files: %s", sarif_path, len(outputs), counts)
+        return counts
+
     def filter_projects_by_threshold(
+        self,
         results: dict[str, Path],
         threshold: int,
     ) -> list[str]:
@@ -85,22 +196,20 @@ class CodeQLResultAnalyzer:
             ... }
             >>> filtered = analyzer.filter_projects_by_threshold(results, threshold=10)
         """
-        analyzer = CodeQLResultAnalyzer()
-        filtered: list[str] = []
+        names = list(results)
+        counts = np.fromiter(
+            (self.count_results(results[name]) for name in names),
+            dtype=np.int64,
+            count=len(names),
+        )
 
-        for project_name, sarif_path in results.items():
-            count = analyzer.count_results(sarif_path)
-            if count >= threshold:
-                filtered.append(project_name)
-                logger.debug("Project %s has %d results (>= %d)", project_name, count, threshold)
-            else:
-                logger.debug("Project %s has %d results (< %d)", project_name, count, threshold)
+        # 比較はNumPyのブールマスクでまとめて行う
+        filtered = [names[i] for i in np.flatnonzero(counts >= threshold)]
 
         logger.info("Filtered %d projects with threshold %d", len(filtered), threshold)
         return filtered
 
-    @staticmethod
-    def get_summary(results: dict[str, Path]) -> dict[str, int]:
+    def get_summary(self, results: dict[str, Path]) -> dict[str, int]:
         """全プロジェクトの検出件数サマリーを取得
 
         Args:
@@ -119,14 +228,13 @@ class CodeQLResultAnalyzer:
             >>> print(summary)
             {'facebook/react': 42, 'microsoft/vscode': 15}
         """
-        analyzer = CodeQLResultAnalyzer()
-        summary = {project: analyzer.count_results(path) for project, path in results.items()}
+        summary = {project: self.count_results(path) for project, path in results.items()}
 
         logger.info("Generated summary for %d projects", len(summary))
         return summary
 
-    @staticmethod
     def get_summary_sorted(
+        self,
         results: dict[str, Path],
         reverse: bool = True,
     ) -> list[tuple[str, int]]:
@@ -149,11 +257,13 @@ class CodeQLResultAnalyzer:
             >>> print(sorted_summary)
             [('facebook/react', 42), ('microsoft/vscode', 15)]
         """
-        analyzer = CodeQLResultAnalyzer()
-        summary = analyzer.get_summary(results)
+        summary = self.get_summary(results)
+        names = list(summary)
+        counts = np.fromiter(summary.values(), dtype=np.int64, count=len(summary))
 
-        # 検出件数でソート
-        sorted_summary = sorted(summary.items(), key=lambda item: item[1], reverse=reverse)
+        # 検出件数でソート（同数の場合は元の順序を保つため、降順は符号反転した安定ソートで行う）
+        order: list[int] = np.argsort(-counts if reverse else counts, kind="stable").tolist()
+        sorted_summary = [(names[i], int(counts[i])) for i in order]
 
         logger.info("Sorted summary for %d projects (reverse=%s)", len(sorted_summary), reverse)
         return sorted_summary
@@ -193,9 +303,8 @@ class CodeQLResultAnalyzer:
         if threshold is not None:
             summary_data["threshold"] = threshold
 
-        # JSONファイルとして保存
-        with output_path.open("w") as f:
-            json.dump(summary_data, f, indent=2, ensure_ascii=False)
+        # 一度に文字列化してから1回の書き込みで保存する（json.dump の細切れ write を避ける）
+        output_path.write_bytes(json.dumps(summary_data, indent=2, ensure_ascii=False).encode())
 
         logger.info(
             "Saved summary for query %s to %s (%d projects, threshold=%s)",
@@ -205,8 +314,8 @@ class CodeQLResultAnalyzer:
             threshold,
         )
 
-    @staticmethod
     def generate_summary_from_directory(
+        self,
         query_dir: Path,
         threshold: int | None = None,
     ) -> dict[str, int]:
@@ -233,11 +342,15 @@ class CodeQLResultAnalyzer:
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
 
-        analyzer = CodeQLResultAnalyzer()
         summary: dict[str, int] = {}
 
-        # ディレクトリ内の全SARIFファイルを検索
-        sarif_files = sorted(query_dir.glob("*.sarif"))
+        # ディレクトリ内の全SARIFファイルを検索（Path.glob より軽量な os.scandir で、拡張子のみ判定する）
+        # glob と同様、ディレクトリでない・読めないパスは SARIF ファイルなしとして扱う
+        try:
+            with os.scandir(query_dir) as entries:
+                sarif_files = sorted(Path(entry.path) for entry in entries if entry.name.endswith(".sarif"))
+        except (NotADirectoryError, PermissionError):
+            sarif_files = []
 
         for sarif_path in sarif_files:
             # ファイル名からプロジェクト名を復元（facebook-react.sarif → facebook/react）
@@ -245,7 +358,7 @@ class CodeQLResultAnalyzer:
 
             # 結果件数をカウント
             try:
-                count = analyzer.count_results(sarif_path)
+                count = self.count_results(sarif_path)
 
                 # 閾値チェック
                 if threshold is None or count >= threshold:
@@ -161,6 +161,7 @@ class CodeQLCLI:
         ram: int | None = None,
         sarif_category: str | None = None,
         sarif_add_snippets: bool = True,
+        keep_full_cache: bool = False,
         timeout: int = 3600,
     ) -> None:
         """CodeQLデータベースを分析する
@@ -174,6 +175,8 @@ class CodeQLCLI:
             ram: 使用するRAM（MB、指定しない場合は自動）
             sarif_category: SARIF出力のカテゴリ（複数言語分析時に使用）
             sarif_add_snippets: コードスニペットを含めるか（デフォルト: True）
+            keep_full_cache: 評価後にディスクキャッシュを削減しないか（同じDBに続けてクエリを
+                実行する場合、ライブラリ述語の評価結果を次回に再利用できる）
             timeout: タイムアウト時間（秒、デフォルト: 3600秒）
 
         Raises:
@@ -229,6 +232,8 @@ class CodeQLCLI:
             cmd.append(f"--sarif-category={sarif_category}")
         if sarif_add_snippets:
             cmd.append("--sarif-add-snippets")
+        if keep_full_cache:
+            cmd.append("--keep-full-cache")
 
         logger.info(
             "Analyzing CodeQL database: %s (output=%s)",
@@ -4,6 +4,7 @@
 """
 
 import logging
+import os
 from pathlib import Path
 import shutil
 
@@ -14,6 +15,29 @@ from mb_scanner.adapters.gateways.codeql.command import CodeQLCLI
 logger = logging.getLogger(__name__)
 
 
+def resolve_n_jobs(n_jobs: int, threads_per_job: int | None) -> int:
+    """CodeQLプロセスのスレッド数を考慮して並列ジョブ数を決定する
+
+    各ジョブが ``--threads`` で複数スレッドを使う場合に、外側のプロセスプールと
+    合わせてCPUコア数を超えないよう並列数を抑える。
+
+    Args:
+        n_jobs: 要求された並列ジョブ数（-1で全CPU使用）
+        threads_per_job: 各ジョブの使用スレッド数（CodeQL の ``--threads`` と同じく、
+            0 はCPUコア数ぶん、負数 -N は N コアを残した数を表す）
+
+    Returns:
+        int: 実際に使用する並列ジョブ数（1以上）
+    """
+    cpu_count = os.cpu_count() or 1
+    resolved = cpu_count if n_jobs < 0 else max(1, n_jobs)
+    if threads_per_job is not None:
+        effective_threads = threads_per_job if threads_per_job > 0 else max(1, cpu_count + threads_per_job)
+        if effective_threads > 1:
+            resolved = min(resolved, max(1, cpu_count // effective_threads))
+    return resolved
+
+
 class CodeQLDatabaseManager:
     """CodeQLデータベースの管理クラス
 
@@ -188,7 +212,8 @@ class CodeQLDatabaseManager:
             base_output_dir: 結果の出力先ベースディレクトリ（未指定の場合は outputs/queries/）
             query_files: クエリファイル(.ql)のリスト
             format: 出力形式（デフォルト: sarifv2.1.0）
-            n_jobs: 並列ジョブ数（-1で全CPU使用）
+            n_jobs: 並列ジョブ数（-1で全CPU使用）。threads_per_job 指定時は
+                CPUコア数 // threads_per_job を上限とする
             threads_per_job: 各ジョブの使用スレッド数
             ram_per_job: 各ジョブの使用RAM（MB）
 
@@ -205,8 +230,11 @@ class CodeQLDatabaseManager:
         if base_output_dir is None:
             base_output_dir = Path("outputs/queries")
 
+        effective_n_jobs = resolve_n_jobs(n_jobs, threads_per_job)
+        logger.debug("Analyzing %d databases with %d jobs", len(project_full_names), effective_n_jobs)
+
         # 並列実行
-        result_paths: list[Path] = Parallel(n_jobs=n_jobs)(
+        result_paths: list[Path] = Parallel(n_jobs=effective_n_jobs)(
             delayed(self.analyze_database)(
                 project_name,
                 output_dir=base_output_dir / project_name.replace("/", "-"),
@@ -4,11 +4,18 @@ CodeQLのSARIF出力ファイルを解析し、検出されたコードの位置
 実際のリポジトリからコードスニペットを抽出する機能を提供します。
 """
 
+from collections.abc import Iterator
 from datetime import datetime
+from functools import lru_cache
 import logging
 from pathlib import Path
+import re
+import stat
+import sys
 from urllib.parse import unquote
 
+from joblib import Parallel, delayed
+
 from mb_scanner.domain.entities import (
     CodeExtractionItem,
     CodeExtractionJobResult,
@@ -20,6 +27,44 @@ from mb_scanner.domain.entities import (
 
 logger = logging.getLogger(__name__)
 
+# コード抽出の対象外とするビルド成果物ディレクトリ（リポジトリルートからの相対パスの先頭）
+_BUILD_ARTIFACT_PATTERN = re.compile(r"(?:build|dist|out|\.next|target|public/build|static/build)/")
+
+
+@lru_cache(maxsize=256)
+def _read_file_lines(file_path: Path, mtime_ns: int, size: int) -> tuple[str, ...]:
+    """ソースファイルを行単位で読み込む（同じファイルへの検出結果が続く場合の再読み込みを防ぐ）
+
+    mtime_ns と size はキャッシュキーとしてのみ使い、ファイルが更新された場合に古い内容を返さないようにする。
+
+    Args:
+        file_path: 読み込むファイルのパス
+        mtime_ns: ファイルの更新時刻（ナノ秒）
+        size: ファイルサイズ
+
+    Returns:
+        改行文字を含む各行のタプル
+    """
+    # UTF-8でデコードできない場合はエラーを無視してデコード
+    with file_path.open(encoding="utf-8", errors="replace") as f:
+        return tuple(f.readlines())
+
+
+def _decode_uri(uri: str) -> str:
+    """SARIFのURIをパーセントデコードする
+
+    大半のURIは "%" を含まないため、その場合は unquote を呼ばずにそのまま返す。
+
+    Args:
+        uri: artifactLocation.uri の値
+
+    Returns:
+        デコード済みのURI
+    """
+    if "%" not in uri:
+        return uri
+    return unquote(uri)
+
 
 class SarifExtractor:
     """SARIF解析とコード抽出のメインクラス
@@ -36,6 +81,8 @@ class SarifExtractor:
         """
         self.sarif_path = sarif_path
         self.repository_path = repository_path
+        # 相対パス → リポジトリ内の Path（同じファイルへの検出結果ごとに Path を組み立て直さない）
+        self._source_paths: dict[str, Path] = {}
 
     def parse_sarif(self) -> list[SarifFinding]:
         """SARIFファイルを解析して結果リストを取得
@@ -47,28 +94,45 @@ class SarifExtractor:
             FileNotFoundError: SARIFファイルが存在しない場合
             pydantic.ValidationError: SARIFファイルが不正な形式の場合
         """
-        if not self.sarif_path.exists():
-            raise FileNotFoundError(f"SARIF file not found: {self.sarif_path}")
+        return list(self._iter_findings())
 
-        # Pydanticモデルを使用してSARIFファイルを読み込み
-        with self.sarif_path.open("rb") as f:
-            sarif_data = SarifReport.model_validate_json(f.read())
+    def _iter_findings(self) -> Iterator[SarifFinding]:
+        """SARIFファイルを解析し、検出結果を1件ずつ返す
 
-        results: list[SarifFinding] = []
+        Yields:
+            SarifFinding: 位置情報を持つ検出結果
+
+        Raises:
+            FileNotFoundError: SARIFファイルが存在しない場合
+            pydantic.ValidationError: SARIFファイルが不正な形式の場合
+        """
+        # 存在確認を別に行わず、読み込み時の例外で判定する
+        try:
+            raw = self.sarif_path.read_bytes()
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"SARIF file not found: {self.sarif_path}") from e
+
+        # Pydanticモデルを使用してSARIFファイルを読み込み（バイト列をそのまま pydantic-core に渡す）
+        sarif_data = SarifReport.model_validate_json(raw)
+        # ジェネレータは抽出が終わるまでローカル変数を保持するため、元のバイト列は先に解放する
+        del raw
 
         if not sarif_data.runs:
             logger.warning("No runs found in SARIF file")
-            return results
+            return
 
         # 最初のrunのresultsを取得
         sarif_results = sarif_data.runs[0].results
 
+        # 同じファイルを指す検出結果が多いため、デコード済みのパス文字列を共有する
+        decoded_uris: dict[str, str] = {}
+
         for idx, result in enumerate(sarif_results):
             # メッセージの取得
             message_text = result.message.text
 
             # 深刻度の取得
-            severity = result.level or "warning"
+            severity = sys.intern(result.level or "warning")
 
             # 位置情報の取得
             if not result.locations:
@@ -76,43 +140,37 @@ class SarifExtractor:
                 continue
 
             physical_location = result.locations[0].physicalLocation
-            artifact_location = physical_location.artifactLocation
             region = physical_location.region
 
-            # ファイルパスの取得
-            file_uri = artifact_location.uri
-            # URLエンコードされている場合はデコード
-            file_uri = unquote(file_uri)
-
-            # 行・列情報の取得
+            # 行・列情報が無い結果は、パスのデコード前にスキップする
             if region is None:
                 logger.warning(f"Result {idx} has no region, skipping")
                 continue
 
+            # ファイルパスの取得（URLエンコードされている場合はデコード）
+            raw_uri = physical_location.artifactLocation.uri
+            file_uri = decoded_uris.get(raw_uri)
+            if file_uri is None:
+                file_uri = decoded_uris[raw_uri] = _decode_uri(raw_uri)
+
+            # 行情報の取得（endLineが省略されている場合はstartLineと同じ行とみなす: SARIF仕様）
             start_line = region.startLine
             end_line = region.endLine
-            start_column = region.startColumn
-            end_column = region.endColumn
-
-            # endLineが省略されている場合はstartLineと同じ行とみなす（SARIF仕様）
             if end_line is None:
                 end_line = start_line
 
-            sarif_finding = SarifFinding(
+            # 値は検証済みの SarifReport から取り出したものなので、結果ごとの再検証は行わない
+            yield SarifFinding.model_construct(
                 id=idx,
                 file_path=file_uri,
                 start_line=start_line,
                 end_line=end_line,
-                start_column=start_column,
-                end_column=end_column,
+                start_column=region.startColumn,
+                end_column=region.endColumn,
                 message=message_text,
                 severity=severity,
             )
 
-            results.append(sarif_finding)
-
-        return results
-
     def extract_code_snippet(self, result: SarifFinding) -> str:
         """位置情報から実際のコードスニペットを抽出
 
@@ -123,30 +181,23 @@ class SarifExtractor:
             コードスニペット（複数行の場合は改行で結合）
         """
         # ビルド成果物ディレクトリを除外
-        excluded_patterns = [
-            "build/",
-            "dist/",
-            "out/",
-            ".next/",
-            "target/",
-            "public/build/",
-            "static/build/",
-        ]
-        if any(result.file_path.startswith(pattern) for pattern in excluded_patterns):
+        if _BUILD_ARTIFACT_PATTERN.match(result.file_path):
             logger.debug(f"Skipping build artifact: {result.file_path}")
             return "[Build artifact - skipped]"
 
-        file_path = self.repository_path / result.file_path
+        file_path = self._source_paths.get(result.file_path)
+        if file_path is None:
+            file_path = self._source_paths[result.file_path] = self.repository_path / result.file_path
 
-        # ファイルの存在確認
-        if not file_path.exists():
+        # ファイルの存在確認（stat 結果は読み込みキャッシュのキーにも使う）
+        try:
+            st = file_path.stat()
+        except (OSError, ValueError):
             logger.warning(f"File not found: {file_path}")
             return "[File not found]"
 
         try:
-            # UTF-8でデコードできない場合はエラーを無視してデコード
-            with file_path.open(encoding="utf-8", errors="replace") as f:
-                lines = f.readlines()
+            lines = _read_file_lines(file_path, st.st_mtime_ns, st.st_size)
 
             # 行番号は1始まりなので、インデックスは0始まりに変換
             start_idx = result.start_line - 1
@@ -159,60 +210,92 @@ class SarifExtractor:
                 )
                 return "[Line out of range]"
 
-            # 該当行を抽出
-            snippet_lines = lines[start_idx:end_idx]
-
-            # 改行文字を除去して結合
-            snippet = "".join(line.rstrip("\n") for line in snippet_lines)
-            # 複数行の場合は改行で結合
-            if len(snippet_lines) > 1:
-                snippet = "\n".join(line.rstrip("\n") for line in snippet_lines)
-            else:
-                snippet = snippet_lines[0].rstrip("\n") if snippet_lines else ""
-
-            return snippet
+            # 該当行を抽出し、改行文字を除去して改行で結合（1行の場合はその行のみ）
+            return "\n".join(line.rstrip("\n") for line in lines[start_idx:end_idx])
 
         except Exception as e:
             logger.error(f"Error extracting code snippet from {file_path}: {e}")
             return f"[Error: {e}]"
 
+    def _build_extraction_item(self, result: SarifFinding) -> CodeExtractionItem:
+        """検出結果にコードスニペットを付与した CodeExtractionItem を作成する
+
+        Args:
+            result: SarifFinding オブジェクト
+
+        Returns:
+            CodeExtractionItem: コードスニペット付きの抽出結果
+        """
+        return CodeExtractionItem(
+            id=result.id,
+            file_path=result.file_path,
+            start_line=result.start_line,
+            end_line=result.end_line,
+            start_column=result.start_column,
+            end_column=result.end_column,
+            message=result.message,
+            severity=result.severity,
+            code_snippet=self.extract_code_snippet(result),
+        )
+
     def extract_all(self) -> CodeExtractionOutput:
         """全ての結果を抽出してCodeExtractionOutputで返す
 
         Returns:
             CodeExtractionOutput: メタデータと結果を含むPydanticモデル
         """
-        # SARIFファイルを解析
-        results = self.parse_sarif()
+        # 各結果にコードスニペットを追加（検出結果のリストを作らずに解析結果を直接処理する）
+        output_results = [self._build_extraction_item(result) for result in self._iter_findings()]
+
+        # 抽出が終わったファイル内容はキャッシュから解放する
+        _read_file_lines.cache_clear()
 
         # メタデータの生成
         metadata = CodeExtractionMetadata(
             sarif_path=str(self.sarif_path),
             repository_path=str(self.repository_path),
-            total_results=len(results),
+            total_results=len(output_results),
             extraction_date=datetime.now(),
         )
 
-        # 各結果にコードスニペットを追加
-        output_results: list[CodeExtractionItem] = []
-        for result in results:
-            code_snippet = self.extract_code_snippet(result)
-
-            item = CodeExtractionItem(
-                id=result.id,
-                file_path=result.file_path,
-                start_line=result.start_line,
-                end_line=result.end_line,
-                start_column=result.start_column,
-                end_column=result.end_column,
-                message=result.message,
-                severity=result.severity,
-                code_snippet=code_snippet,
-            )
+        return CodeExtractionOutput(metadata=metadata, results=output_results)
 
-            output_results.append(item)
+    def extract_all_to_file(self, output_path: Path) -> int:
+        """全ての結果を抽出し、1件ずつJSONファイルへ書き出す
 
-        return CodeExtractionOutput(metadata=metadata, results=output_results)
+        extract_all() の結果を model_dump_json(indent=2) で保存した場合と同じ内容を出力するが、
+        コードスニペット付きの結果をメモリに溜めずに書き出すため、検出件数が多くてもメモリ使用量が増えない。
+
+        Args:
+            output_path: 出力先JSONファイルのパス（親ディレクトリが無ければ作成する）
+
+        Returns:
+            int: 抽出した結果の件数
+        """
+        # メタデータを先頭に書くため、件数は検出結果（スニペットなし）の一覧から先に求める
+        findings = self.parse_sarif()
+        metadata = CodeExtractionMetadata(
+            sarif_path=str(self.sarif_path),
+            repository_path=str(self.repository_path),
+            total_results=len(findings),
+            extraction_date=datetime.now(),
+        )
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with output_path.open("w", encoding="utf-8") as f:
+            f.write('{\n  "metadata": ')
+            f.write(metadata.model_dump_json(indent=2).replace("\n", "\n  "))
+            f.write(',\n  "results": [')
+            for idx, result in enumerate(findings):
+                item = self._build_extraction_item(result)
+                f.write(",\n    " if idx else "\n    ")
+                f.write(item.model_dump_json(indent=2).replace("\n", "\n    "))
+            f.write("\n  ]\n}" if findings else "]\n}")
+
+        # 抽出が終わったファイル内容はキャッシュから解放する
+        _read_file_lines.cache_clear()
+
+        return len(findings)
 
 
 def extract_code_for_project(
@@ -248,8 +331,11 @@ def extract_code_for_project(
     output_path = output_base_dir / query_id / f"{fs_safe_name}_code.json"
 
     try:
-        # SARIFファイルの存在確認
-        if not sarif_path.exists():
+        # SARIFファイルの存在確認（exists() を経由せず、stat 1回の例外で判定する）
+        # exists() と同様、NotADirectoryError や PermissionError も「存在しない」として扱う
+        try:
+            sarif_path.stat()
+        except OSError:
             logger.warning(f"SARIF file not found for {project_name}: {sarif_path}")
             return CodeExtractionJobResult(
                 status="skipped",
@@ -259,8 +345,12 @@ def extract_code_for_project(
                 error=f"SARIF file not found: {sarif_path}",
             )
 
-        # リポジトリの存在確認
-        if not repository_path.exists():
+        # リポジトリの存在確認（ディレクトリであることも同じ stat 結果で確認する）
+        try:
+            repository_is_dir = stat.S_ISDIR(repository_path.stat().st_mode)
+        except OSError:
+            repository_is_dir = False
+        if not repository_is_dir:
             logger.warning(f"Repository not found for {project_name}: {repository_path}")
             return CodeExtractionJobResult(
                 status="skipped",
@@ -270,18 +360,9 @@ def extract_code_for_project(
                 error=f"Repository not found: {repository_path}",
             )
 
-        # コード抽出を実行
+        # コード抽出を実行し、結果を逐次JSONファイルに保存
         extractor = SarifExtractor(sarif_path=sarif_path, repository_path=repository_path)
-        extraction_output = extractor.extract_all()
-
-        # 出力ディレクトリを作成
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # JSONファイルに保存（Pydanticのmodel_dump_jsonを使用）
-        with output_path.open("w", encoding="utf-8") as f:
-            f.write(extraction_output.model_dump_json(indent=2))
-
-        result_count = extraction_output.metadata.total_results
+        result_count = extractor.extract_all_to_file(output_path)
         logger.info(f"Successfully extracted {result_count} results for {project_name}")
 
         return CodeExtractionJobResult(
@@ -301,3 +382,47 @@ def extract_code_for_project(
             result_count=None,
             error=str(e),
         )
+
+
+def extract_code_for_projects(
+    query_id: str,
+    project_names: list[str],
+    sarif_base_dir: Path,
+    repository_base_dir: Path,
+    output_base_dir: Path,
+    *,
+    n_jobs: int = -1,
+    verbose: int = 0,
+) -> list[CodeExtractionJobResult]:
+    """複数プロジェクトのコード抽出をプロセスプールで並列実行
+
+    各プロジェクトの処理は独立しており（SARIFの読み込みと出力ファイルの書き込みのみ）、
+    extract_code_for_project() をそのままワーカーで実行する。
+
+    Args:
+        query_id: クエリID
+        project_names: プロジェクト名のリスト
+        sarif_base_dir: SARIFファイルのベースディレクトリ
+        repository_base_dir: リポジトリのベースディレクトリ
+        output_base_dir: 出力先ベースディレクトリ
+        n_jobs: 並列ジョブ数（-1で全CPU使用）
+        verbose: joblib の進捗表示レベル
+
+    Returns:
+        list[CodeExtractionJobResult]: project_names と同じ順序の処理結果
+    """
+    if not project_names:
+        return []
+
+    # return_as を明示し、Parallel の戻り値を入力順のリストとして型付けする
+    results: list[CodeExtractionJobResult] = Parallel(n_jobs=n_jobs, verbose=verbose, return_as="list")(
+        delayed(extract_code_for_project)(
+            query_id=query_id,
+            project_name=project_name,
+            sarif_base_dir=sarif_base_dir,
+            repository_base_dir=repository_base_dir,
+            output_base_dir=output_base_dir,
+        )
+        for project_name in project_names
+    )
+    return results
@@ -6,24 +6,34 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from datetime import UTC, datetime
+from itertools import islice
 import logging
-from typing import cast
+from types import TracebackType
+from typing import TYPE_CHECKING, Self
 
 from github import Auth, Github, GithubException, RateLimitExceededException
-from github.Repository import RepositorySearchResult
 
 from mb_scanner.adapters.gateways.github.search import build_default_search_criteria
 from mb_scanner.domain.ports.github_gateway import GitHubRepositoryDTO, SearchCriteria
 from mb_scanner.infrastructure.config import settings
 
+if TYPE_CHECKING:
+    from github.Repository import Repository
+
 logger = logging.getLogger(__name__)
 
+# 検索APIの1ページあたりの最大件数（PyGithubの既定値30では、ページ取得のリクエスト数が約3倍になる）
+_SEARCH_PER_PAGE = 100
+
 
 class GitHubClient:
     """GitHub APIクライアント
 
     PyGithubをラップし、認証管理と検索機能を提供します。
+    内部の Github インスタンスは HTTP セッション（keep-alive 接続）を保持するため、
+    複数の検索では同じクライアントを使い回し、with 文または close() で閉じてください。
 
     Attributes:
         github: PyGithubのGithubクライアントインスタンス
@@ -46,7 +56,7 @@ class GitHubClient:
 
         # PyGithubクライアントを初期化
         auth = Auth.Token(self.token)
-        self.github = Github(auth=auth)
+        self.github = Github(auth=auth, per_page=_SEARCH_PER_PAGE)
 
         logger.info("GitHubClient initialized successfully")
 
@@ -54,38 +64,45 @@ class GitHubClient:
         self,
         criteria: SearchCriteria | None = None,
         max_results: int | None = None,
-    ) -> list[GitHubRepositoryDTO]:
+    ) -> Iterator[GitHubRepositoryDTO]:
         """検索条件に基づいてリポジトリを検索する
 
+        結果はページ取得に合わせて1件ずつ返すため、呼び出し側は全件の取得を待たずに処理を始められる。
+
         Args:
             criteria: 検索条件。指定されない場合は設定からデフォルト値を読み込みます。
             max_results: 取得する最大リポジトリ数（指定されない場合は全件取得）
 
         Returns:
-            list[GitHubRepositoryDTO]: 検索結果のリポジトリリスト
+            Iterator[GitHubRepositoryDTO]: 検索結果のリポジトリを順に返すイテレータ
 
         Raises:
-            RateLimitExceededException: APIレート制限を超えた場合
-            GithubException: GitHub API呼び出しでエラーが発生した場合
+            RateLimitExceededException: APIレート制限を超えた場合（反復中に発生）
+            GithubException: GitHub API呼び出しでエラーが発生した場合（反復中に発生）
         """
         # デフォルト検索条件を適用
         if criteria is None:
             criteria = build_default_search_criteria()
 
+        # 検索クエリを構築
+        query = criteria.to_query_string()
+        logger.info("Searching repositories with query: %s", query)
+
+        # PyGithubの検索結果は遅延評価のページ付きリストで、反復した時点でページが取得される
+        repositories = self.github.search_repositories(query=query)
+        return self._iter_repositories(repositories, max_results)
+
+    @staticmethod
+    def _iter_repositories(
+        repositories: Iterable[Repository],
+        max_results: int | None,
+    ) -> Iterator[GitHubRepositoryDTO]:
+        """PyGithubの検索結果を GitHubRepositoryDTO に変換しながら返す"""
+        fetched = 0
         try:
-            # 検索クエリを構築
-            query = criteria.to_query_string()
-            logger.info("Searching repositories with query: %s", query)
-
-            # PyGithubで検索実行
-            repositories = self.github.search_repositories(query=query)
-
-            # 結果を変換
-            results: list[GitHubRepositoryDTO] = []
-            repo_iterator = repositories[:max_results] if max_results is not None else repositories
-            for repo_item in repo_iterator:
+            # islice は max_results 件に達した時点で反復を止めるため、それ以降のページは取得されない
+            for repo in islice(repositories, max_results):
                 try:
-                    repo = cast(RepositorySearchResult, repo_item)
                     dto = GitHubRepositoryDTO(
                         full_name=repo.full_name,
                         html_url=repo.html_url,
@@ -93,16 +110,16 @@ class GitHubClient:
                         pushed_at=repo.pushed_at,
                         language=repo.language,
                         description=repo.description,
-                        topics=repo.get_topics(),
+                        # 検索結果のペイロードに含まれる topics を使う（get_topics() はリポジトリごとに追加のAPI呼び出しになる）
+                        topics=repo.topics,
                     )
-                    results.append(dto)
-                    logger.debug("Fetched repository: %s", dto.full_name)
                 except Exception as e:
-                    logger.warning("Failed to convert repository item %r: %s", repo_item, e)
+                    logger.warning("Failed to convert repository item %r: %s", repo, e)
                     continue
 
-            logger.info("Successfully fetched %d repositories", len(results))
-            return results
+                fetched += 1
+                logger.debug("Fetched repository: %s", dto.full_name)
+                yield dto
 
         except RateLimitExceededException as e:
             logger.error("GitHub API rate limit exceeded: %s", e)
@@ -114,6 +131,8 @@ class GitHubClient:
             logger.error("Unexpected error during repository search: %s", e)
             raise
 
+        logger.info("Successfully fetched %d repositories", fetched)
+
     def get_rate_limit_info(self) -> dict[str, int | float | datetime]:
         """APIレート制限の情報を取得し、待機に必要な情報も計算する
 
@@ -147,3 +166,16 @@ class GitHubClient:
         """GitHubクライアントを閉じる"""
         self.github.close()
         logger.info("GitHubClient closed")
+
+    def __enter__(self) -> Self:
+        """コンテキストマネージャとしてクライアントを返す"""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """コンテキスト終了時にクライアントを閉じる"""
+        self.close()
@@ -67,10 +67,12 @@ class RepositoryCloner:
         destination.parent.mkdir(parents=True, exist_ok=True)
 
         # git cloneコマンドを構築
+        # --depth は --single-branch を含意する。--no-tags でタグの参照・オブジェクトの取得も省く
         cmd = [
             "git",
             "clone",
             f"--depth={depth}",
+            "--no-tags",
             repository_url,
             str(destination),
         ]
@@ -82,11 +84,11 @@ class RepositoryCloner:
                 "https://github.com/",
                 f"https://{self.github_token}@github.com/",
             )
-            cmd[3] = authenticated_url
+            cmd[-2] = authenticated_url
             logger.debug("Using authenticated URL for cloning")
 
         logger.info("Cloning repository: %s -> %s", repository_url, destination)
-        logger.debug("Clone command: git clone --depth=%d <url> %s", depth, destination)
+        logger.debug("Clone command: git clone --depth=%d --no-tags <url> %s", depth, destination)
 
         try:
             result = subprocess.run(
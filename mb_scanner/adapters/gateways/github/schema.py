@@ -42,6 +42,8 @@ class GitHubRepository(BaseModel):
     def from_pygithub(cls, repo: RepositorySearchResult) -> GitHubRepository:
         """PyGithubのRepositoryオブジェクトからGitHubRepositoryを作成する
 
+        topics は検索APIのレスポンスに含まれる値を使い、get_topics() による追加のAPI呼び出しを行わない。
+
         Args:
             repo: github.Repository.Repository オブジェクト
 
@@ -55,5 +57,5 @@ class GitHubRepository(BaseModel):
             pushed_at=repo.pushed_at,
             language=repo.language,
             description=repo.description,
-            topics=repo.get_topics(),
+            topics=repo.topics,
         )
@@ -16,10 +16,13 @@ def build_default_search_criteria() -> SearchCriteria:
     - スター数
     - 最終コミット
 
+    設定値は Settings 側で SearchCriteria と同じ制約（ge=0 / ge=1）により検証済みのため、
+    再検証せずに model_construct で構築する。
+
     Returns:
         SearchCriteria: デフォルトの検索条件
     """
-    return SearchCriteria(
+    return SearchCriteria.model_construct(
         language=settings.github_search_default_language,
         min_stars=settings.github_search_default_min_stars,
         max_days_since_commit=settings.github_search_default_max_days_since_commit,
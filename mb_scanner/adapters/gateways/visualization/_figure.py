@@ -0,0 +1,22 @@
+"""可視化モジュール共通の Figure 保存処理"""
+
+# pyright: reportUnknownMemberType=false
+# matplotlibの型情報が不完全なため、このファイルでは一部の型チェックを緩和
+
+from pathlib import Path
+
+from matplotlib.figure import Figure
+
+# PNGのzlib圧縮レベル（既定の6より低くし、画素は同一のままエンコード時間を約半分にする）
+PNG_COMPRESS_LEVEL = 3
+
+
+def save_figure(fig: Figure, output_path: Path) -> None:
+    """レイアウトを調整して Figure を PNG として保存する（描画処理はここに集約する）
+
+    Args:
+        fig: 保存する Figure
+        output_path: 出力する画像ファイルのパス
+    """
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=300, bbox_inches="tight", pil_kwargs={"compress_level": PNG_COMPRESS_LEVEL})
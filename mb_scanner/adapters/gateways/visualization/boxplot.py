@@ -11,7 +11,9 @@ import json
 from pathlib import Path
 import warnings
 
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+
+from mb_scanner.adapters.gateways.visualization._figure import save_figure
 
 
 def load_summary_data(json_file: Path) -> dict[str, int | list[int]]:
@@ -29,16 +31,20 @@ def load_summary_data(json_file: Path) -> dict[str, int | list[int]]:
     Raises:
         FileNotFoundError: ファイルが存在しない場合
     """
-    if not json_file.exists():
-        raise FileNotFoundError(f"File not found: {json_file}")
+    # テキストモードのデコード層を経由せず、バイト列を一括で読み込んでパースする
+    try:
+        raw = json_file.read_bytes()
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"File not found: {json_file}") from e
 
-    with json_file.open("r") as f:
-        data = json.load(f)
+    # object_pairs_hook=list でオブジェクトを (key, value) の列のまま受け取り、
+    # 値しか使わない results についてキー→値の中間辞書を作らない
+    data = dict(json.loads(raw, object_pairs_hook=list))
 
     return {
         "query_id": data["query_id"],
         "total_projects": data["total_projects"],
-        "values": list(data["results"].values()),
+        "values": [value for _, value in data["results"]],
     }
 
 
@@ -98,7 +104,9 @@ def create_boxplot_summary(
 
     # 図のサイズを設定（横長）
     fig_width = max(12, len(data_list) * 2.5)
-    _fig, ax = plt.subplots(figsize=(fig_width, 6))
+    # pyplot のグローバル状態を使わず、Figure を直接生成する
+    fig = Figure(figsize=(fig_width, 6))
+    ax = fig.subplots()
 
     # 箱ひげ図を作成
     bp = ax.boxplot(data_list, patch_artist=True)
@@ -123,12 +131,8 @@ def create_boxplot_summary(
     # グリッドを追加
     ax.grid(True, alpha=0.3, axis="y")
 
-    # レイアウト調整
-    plt.tight_layout()
-
     # 出力ディレクトリを作成
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # 画像を保存
-    plt.savefig(output_path, dpi=300, bbox_inches="tight")
-    plt.close()
+    # レイアウトを調整して画像を保存
+    save_figure(fig, output_path)
@@ -8,10 +8,65 @@
 
 from pathlib import Path
 
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import numpy as np
 from scipy import stats
 
+from mb_scanner.adapters.gateways.visualization._figure import save_figure
+
+
+def _regression_line(
+    x_data: np.ndarray,
+    y_data: np.ndarray,
+    *,
+    log_scale_x: bool,
+    log_scale_y: bool,
+    xlim: tuple[float, float] | None,
+) -> tuple[np.ndarray, np.ndarray] | None:
+    """最小二乗法による回帰直線の両端点を求める
+
+    回帰は軸と同じスケール（対数軸なら log10）で行うため、描画上も直線になる。端点の2点だけで十分。
+    傾き・切片は閉形式で計算する。
+
+    Args:
+        x_data: X軸の値の1次元配列（2点以上）
+        y_data: Y軸の値の1次元配列
+        log_scale_x: x軸が対数軸かどうか
+        log_scale_y: y軸が対数軸かどうか
+        xlim: x軸の範囲 (min, max)。指定時はその範囲、Noneの場合はデータの範囲に直線を引く
+
+    Returns:
+        tuple[np.ndarray, np.ndarray] | None: 元のスケールでの端点 (x_line, y_line)。
+        x がすべて同じ値で傾きが定まらない場合は None
+    """
+    # 対数変換（必要に応じて）
+    x_calc = np.log10(x_data) if log_scale_x else x_data
+    y_calc = np.log10(y_data) if log_scale_y else y_data
+
+    # 線形回帰: slope = Σ(x-x̄)(y-ȳ) / Σ(x-x̄)², intercept = ȳ - slope·x̄
+    x_mean = x_calc.mean()
+    x_dev = x_calc - x_mean
+    sxx = np.dot(x_dev, x_dev)
+    if sxx == 0:
+        return None
+    y_mean = y_calc.mean()
+    slope = np.dot(x_dev, y_calc - y_mean) / sxx
+    intercept = y_mean - slope * x_mean
+
+    # 回帰直線の描画範囲を決定（xlimが設定されている場合はその範囲、なければデータの範囲）
+    if xlim is not None:
+        x_line = np.log10(xlim) if log_scale_x else np.array(xlim, dtype=np.float64)
+    else:
+        x_line = np.array([x_calc.min(), x_calc.max()])
+    y_line = slope * x_line + intercept
+
+    # 元のスケールに戻す（対数軸の場合）
+    if log_scale_x:
+        x_line = 10**x_line
+    if log_scale_y:
+        y_line = 10**y_line
+    return x_line, y_line
+
 
 def create_scatter_plot(
     data: list[tuple[int, int, str]],
@@ -44,65 +99,42 @@ def create_scatter_plot(
     # 出力ディレクトリが存在しない場合は作成
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # データを分解
-    x_data = [item[0] for item in data]
-    y_data = [item[1] for item in data]
+    # データを分解（NumPy配列への変換は1回だけ行い、描画・回帰・相関で共有する）
+    n = len(data)
+    x_data = np.fromiter((item[0] for item in data), dtype=np.int64, count=n)
+    y_data = np.fromiter((item[1] for item in data), dtype=np.int64, count=n)
 
-    # 散布図を作成
-    plt.figure(figsize=(10, 6))
-    plt.scatter(x_data, y_data, alpha=0.6, edgecolors="w", linewidth=0.5)
+    # 散布図を作成（pyplot のグローバル状態を使わず、Figure を直接生成する）
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    ax.scatter(x_data, y_data, alpha=0.6, edgecolors="w", linewidth=0.5)
 
     # x軸を対数軸に設定（オプション）
     if log_scale_x:
-        plt.xscale("log")
+        ax.set_xscale("log")
 
     # y軸を対数軸に設定（オプション）
     if log_scale_y:
-        plt.yscale("log")
+        ax.set_yscale("log")
 
     # グラフの装飾
-    plt.title(title, fontsize=14, fontweight="bold")
-    plt.xlabel(xlabel, fontsize=12)
-    plt.ylabel(ylabel, fontsize=12)
-    plt.grid(True, alpha=0.3)
+    ax.set_title(title, fontsize=14, fontweight="bold")
+    ax.set_xlabel(xlabel, fontsize=12)
+    ax.set_ylabel(ylabel, fontsize=12)
+    ax.grid(True, alpha=0.3)
 
     # 軸範囲の設定
     if xlim is not None:
-        plt.xlim(xlim)
+        ax.set_xlim(xlim)
     if ylim is not None:
-        plt.ylim(ylim)
+        ax.set_ylim(ylim)
 
     # 回帰直線を計算・表示（オプション）
     if show_regression and len(data) >= 2:
-        # 対数変換（必要に応じて）
-        x_calc = np.log10(x_data) if log_scale_x else np.array(x_data)
-        y_calc = np.log10(y_data) if log_scale_y else np.array(y_data)
-
-        # 線形回帰
-        result = stats.linregress(x_calc, y_calc)
-        slope = result.slope
-        intercept = result.intercept
-
-        # 回帰直線の描画範囲を決定（xlimが設定されている場合はその範囲、なければデータの範囲）
-        if xlim is not None:
-            x_min_line = np.log10(xlim[0]) if log_scale_x else xlim[0]
-            x_max_line = np.log10(xlim[1]) if log_scale_x else xlim[1]
-        else:
-            x_min_line = min(x_calc)
-            x_max_line = max(x_calc)
-
-        # 回帰直線の計算
-        x_line = np.linspace(x_min_line, x_max_line, 100)
-        y_line = slope * x_line + intercept
-
-        # 元のスケールに戻す（対数軸の場合）
-        if log_scale_x:
-            x_line = 10**x_line
-        if log_scale_y:
-            y_line = 10**y_line
-
-        # 回帰直線を描画
-        plt.plot(x_line, y_line, "r--", linewidth=2, alpha=0.8, label="Regression line")
+        # x がすべて同じ値なら傾きが定まらないため、直線は描画しない
+        line = _regression_line(x_data, y_data, log_scale_x=log_scale_x, log_scale_y=log_scale_y, xlim=xlim)
+        if line is not None:
+            ax.plot(*line, "r--", linewidth=2, alpha=0.8, label="Regression line")
 
     # スピアマンの順位相関係数を計算・表示（オプション）
     if show_correlation and len(data) >= 2:
@@ -111,11 +143,11 @@ def create_scatter_plot(
         pvalue = result.pvalue
         # グラフの右上に相関係数を表示
         correlation_text = f"Spearman's ρ = {correlation:.3f}\np-value = {pvalue:.3e}"
-        plt.text(
+        ax.text(
             0.95,
             0.95,
             correlation_text,
-            transform=plt.gca().transAxes,
+            transform=ax.transAxes,
             fontsize=10,
             verticalalignment="top",
             horizontalalignment="right",
@@ -123,9 +155,7 @@ def create_scatter_plot(
         )
 
     # レイアウトを調整して保存
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches="tight")
-    plt.close()
+    save_figure(fig, output_path)
 
 
 def create_hexbin_plot(
@@ -166,22 +196,87 @@ def create_hexbin_plot(
     if not data:
         raise ValueError("データが空です")
 
+    # データを分解（NumPy配列への変換は1回だけ行い、描画・回帰・相関で共有する）
+    n = len(data)
+    x_data = np.fromiter((item[0] for item in data), dtype=np.int64, count=n)
+    y_data = np.fromiter((item[1] for item in data), dtype=np.int64, count=n)
+
+    create_hexbin_plot_from_arrays(
+        x_data,
+        y_data,
+        output_path,
+        title=title,
+        xlabel=xlabel,
+        ylabel=ylabel,
+        log_scale_x=log_scale_x,
+        log_scale_y=log_scale_y,
+        gridsize=gridsize,
+        cmap=cmap,
+        show_correlation=show_correlation,
+        show_regression=show_regression,
+        xlim=xlim,
+        ylim=ylim,
+    )
+
+
+def create_hexbin_plot_from_arrays(
+    x_data: np.ndarray,
+    y_data: np.ndarray,
+    output_path: Path,
+    *,
+    title: str = "CodeQL Detection vs JS Lines",
+    xlabel: str = "JavaScript Lines Count",
+    ylabel: str = "Detection Count",
+    log_scale_x: bool = False,
+    log_scale_y: bool = False,
+    gridsize: int = 20,
+    cmap: str = "YlOrRd",
+    show_correlation: bool = False,
+    show_regression: bool = False,
+    xlim: tuple[float, float] | None = None,
+    ylim: tuple[float, float] | None = None,
+) -> None:
+    """x・y を別々の配列で受け取り、hexbinプロット（六角形ビニング）を作成して保存する
+
+    create_hexbin_plot() のタプルのリストを経由せず、NumPy配列を作成済みの呼び出し元から直接描画できる。
+
+    Args:
+        x_data: X軸の値（js_lines_count）の1次元配列
+        y_data: Y軸の値（detection_count）の1次元配列
+        output_path: 出力ファイルパス
+        title: グラフのタイトル
+        xlabel: X軸ラベル
+        ylabel: Y軸ラベル
+        log_scale_x: x軸を対数軸にするかどうか（デフォルト: False）
+        log_scale_y: y軸を対数軸にするかどうか（デフォルト: False）
+        gridsize: 六角形グリッドのサイズ（デフォルト: 20）
+        cmap: カラーマップ名（デフォルト: 'YlOrRd'）
+        show_correlation: スピアマンの順位相関係数を表示するかどうか（デフォルト: False）
+        show_regression: 回帰直線を表示するかどうか（デフォルト: False）
+        xlim: x軸の範囲 (min, max)。Noneの場合は自動設定
+        ylim: y軸の範囲 (min, max)。Noneの場合は自動設定
+
+    Raises:
+        ValueError: データが空の場合、または x と y の長さが異なる場合
+    """
+    if len(x_data) == 0:
+        raise ValueError("データが空です")
+    if len(x_data) != len(y_data):
+        raise ValueError("x_data と y_data の長さが一致しません")
+
     # 出力ディレクトリが存在しない場合は作成
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # データを分解
-    x_data = [item[0] for item in data]
-    y_data = [item[1] for item in data]
-
-    # hexbinプロットを作成
-    plt.figure(figsize=(10, 6))
+    # hexbinプロットを作成（pyplot のグローバル状態を使わず、Figure を直接生成する）
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
 
     # x軸とy軸のスケール設定
     xscale = "log" if log_scale_x else "linear"
     yscale = "log" if log_scale_y else "linear"
 
     # hexbinプロットを描画
-    hexbin = plt.hexbin(
+    hexbin = ax.hexbin(
         x_data,
         y_data,
         gridsize=gridsize,
@@ -194,53 +289,28 @@ def create_hexbin_plot(
     )
 
     # カラーバーを追加
-    cbar = plt.colorbar(hexbin)
+    cbar = fig.colorbar(hexbin, ax=ax)
     cbar.set_label("Count", fontsize=12)
 
     # 回帰直線を計算・表示（オプション）
-    if show_regression and len(data) >= 2:
-        # 対数変換（必要に応じて）
-        x_calc = np.log10(x_data) if log_scale_x else np.array(x_data)
-        y_calc = np.log10(y_data) if log_scale_y else np.array(y_data)
-
-        # 線形回帰
-        result = stats.linregress(x_calc, y_calc)
-        slope = result.slope
-        intercept = result.intercept
-
-        # 回帰直線の描画範囲を決定（xlimが設定されている場合はその範囲、なければデータの範囲）
-        if xlim is not None:
-            x_min_line = np.log10(xlim[0]) if log_scale_x else xlim[0]
-            x_max_line = np.log10(xlim[1]) if log_scale_x else xlim[1]
-        else:
-            x_min_line = min(x_calc)
-            x_max_line = max(x_calc)
-
-        # 回帰直線の計算
-        x_line = np.linspace(x_min_line, x_max_line, 100)
-        y_line = slope * x_line + intercept
-
-        # 元のスケールに戻す（対数軸の場合）
-        if log_scale_x:
-            x_line = 10**x_line
-        if log_scale_y:
-            y_line = 10**y_line
-
-        # 回帰直線を描画
-        plt.plot(x_line, y_line, "r--", linewidth=2, alpha=0.8, label="Regression line")
+    if show_regression and len(x_data) >= 2:
+        # x がすべて同じ値なら傾きが定まらないため、直線は描画しない
+        line = _regression_line(x_data, y_data, log_scale_x=log_scale_x, log_scale_y=log_scale_y, xlim=xlim)
+        if line is not None:
+            ax.plot(*line, "r--", linewidth=2, alpha=0.8, label="Regression line")
 
     # スピアマンの順位相関係数を計算・表示（オプション）
-    if show_correlation and len(data) >= 2:
+    if show_correlation and len(x_data) >= 2:
         result = stats.spearmanr(x_data, y_data)
         correlation = result.statistic
         pvalue = result.pvalue
         # グラフの右上に相関係数を表示
         correlation_text = f"Spearman's ρ = {correlation:.3f}\np-value = {pvalue:.3e}"
-        plt.text(
+        ax.text(
             0.95,
             0.95,
             correlation_text,
-            transform=plt.gca().transAxes,
+            transform=ax.transAxes,
             fontsize=10,
             verticalalignment="top",
             horizontalalignment="right",
@@ -248,18 +318,16 @@ def create_hexbin_plot(
         )
 
     # グラフの装飾
-    plt.title(title, fontsize=14, fontweight="bold")
-    plt.xlabel(xlabel, fontsize=12)
-    plt.ylabel(ylabel, fontsize=12)
-    plt.grid(True, alpha=0.3)
+    ax.set_title(title, fontsize=14, fontweight="bold")
+    ax.set_xlabel(xlabel, fontsize=12)
+    ax.set_ylabel(ylabel, fontsize=12)
+    ax.grid(True, alpha=0.3)
 
     # 軸範囲の設定
     if xlim is not None:
-        plt.xlim(xlim)
+        ax.set_xlim(xlim)
     if ylim is not None:
-        plt.ylim(ylim)
+        ax.set_ylim(ylim)
 
     # レイアウトを調整して保存
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches="tight")
-    plt.close()
+    save_figure(fig, output_path)
@@ -1,12 +1,23 @@
 """ProjectRepository の SQLAlchemy 実装"""
 
+from collections.abc import Callable
 from datetime import UTC, datetime
 
 from sqlalchemy.orm import Session
 
 from mb_scanner.adapters.repositories.sqlalchemy_topic_repo import SqlAlchemyTopicRepository
 from mb_scanner.domain.entities.project import Project, Topic
-from mb_scanner.infrastructure.orm.tables import ProjectORM, TopicORM
+from mb_scanner.infrastructure.orm.tables import ProjectORM
+
+
+def _as_stored_datetime(value: datetime | None) -> datetime | None:
+    """DB から読み戻した場合と同じ naive な datetime に揃える
+
+    DateTime 列はタイムゾーン情報を変換せずに落として保存するため、書き込み直後の tz-aware な値も同様に扱う。
+    """
+    if value is None or value.tzinfo is None:
+        return value
+    return value.replace(tzinfo=None)
 
 
 class SqlAlchemyProjectRepository:
@@ -18,26 +29,53 @@ class SqlAlchemyProjectRepository:
 
     @staticmethod
     def _to_domain(orm: ProjectORM) -> Project:
-        """ORM モデルからドメインエンティティに変換"""
+        """ORM モデルからドメインエンティティに変換
+
+        保存直後（refresh 前）の ORM でも get_* と同じ値になるよう、日時は naive に揃える。
+        """
         return Project(
             id=orm.id,
             full_name=orm.full_name,
             url=orm.url,
             stars=orm.stars,
-            last_commit_date=orm.last_commit_date,
+            last_commit_date=_as_stored_datetime(orm.last_commit_date),
             language=orm.language,
             description=orm.description,
-            fetched_at=orm.fetched_at,
+            fetched_at=_as_stored_datetime(orm.fetched_at),
             js_lines_count=orm.js_lines_count,
             topics=[Topic(id=t.id, name=t.name) for t in orm.topics],
         )
 
+    def _commit_and_convert(self, apply_changes: Callable[[], ProjectORM]) -> Project:
+        """変更を適用・確定し、保存後のドメインエンティティを返す
+
+        commit 後は属性が失効して refresh で再読込が走るため、ID が採番された flush 直後に変換してから commit する。
+        topic の取得・作成も flush を伴うため、変更の適用から commit までを同じ try で扱い、
+        失敗した場合はセッションをロールバックしてから例外を送出する。
+        """
+        try:
+            orm = apply_changes()
+            self.db.flush()
+            project = self._to_domain(orm)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return project
+
     def get_project_by_full_name(self, full_name: str) -> Project | None:
         orm = self.db.query(ProjectORM).filter(ProjectORM.full_name == full_name).first()
         if orm is None:
             return None
         return self._to_domain(orm)
 
+    def existing_full_names(self, full_names: list[str]) -> set[str]:
+        """与えられた full_name のうち、DB に既に存在するものを1回の `IN` 検索で返す"""
+        if not full_names:
+            return set()
+        rows = self.db.query(ProjectORM.full_name).filter(ProjectORM.full_name.in_(full_names))
+        return {row.full_name for row in rows}
+
     def get_all_projects(self) -> list[Project]:
         return [self._to_domain(orm) for orm in self.db.query(ProjectORM).all()]
 
@@ -63,7 +101,10 @@ class SqlAlchemyProjectRepository:
         existing = self.db.query(ProjectORM).filter(ProjectORM.full_name == full_name).first()
 
         if existing:
-            if update_if_exists:
+            if not update_if_exists:
+                return self._to_domain(existing)
+
+            def update_existing() -> ProjectORM:
                 existing.url = url
                 existing.stars = stars
                 existing.language = language
@@ -72,29 +113,85 @@ class SqlAlchemyProjectRepository:
                 existing.fetched_at = datetime.now(UTC)
 
                 if topics:
-                    existing.topics = self._get_or_create_topic_orms(topics)
-
-                self.db.commit()
-                self.db.refresh(existing)
-            return self._to_domain(existing)
-
-        new_orm = ProjectORM(
-            full_name=full_name,
-            url=url,
-            stars=stars,
-            language=language,
-            description=description,
-            last_commit_date=last_commit_date,
-            fetched_at=datetime.now(UTC),
-        )
-
-        if topics:
-            new_orm.topics = self._get_or_create_topic_orms(topics)
-
-        self.db.add(new_orm)
-        self.db.commit()
-        self.db.refresh(new_orm)
-        return self._to_domain(new_orm)
+                    existing.topics = self.topic_repo.get_or_create_topic_orms(topics)
+                return existing
+
+            return self._commit_and_convert(update_existing)
+
+        def add_new() -> ProjectORM:
+            new_orm = ProjectORM(
+                full_name=full_name,
+                url=url,
+                stars=stars,
+                language=language,
+                description=description,
+                last_commit_date=last_commit_date,
+                fetched_at=datetime.now(UTC),
+            )
+
+            if topics:
+                new_orm.topics = self.topic_repo.get_or_create_topic_orms(topics)
+
+            self.db.add(new_orm)
+            return new_orm
+
+        return self._commit_and_convert(add_new)
+
+    def save_projects(self, projects: list[Project], *, check_existing: bool = True) -> list[Project]:
+        """新規プロジェクトをまとめて保存する
+
+        既存の full_name は1回の `IN` 検索で判定してスキップし、残りを add_all と1回の commit で保存する。
+        呼び出し側で既存判定を済ませている場合は check_existing=False でこの検索を省略できる。
+        入力内で full_name が重複する場合は先に現れたものだけを保存する。
+        戻り値は新規に保存したプロジェクトのみ（入力順）。
+        保存に失敗した場合はセッションをロールバックしてから例外を送出する。
+        """
+        if not projects:
+            return []
+
+        seen: set[str] = set()
+        if check_existing:
+            seen = self.existing_full_names([project.full_name for project in projects])
+        new_projects: list[Project] = []
+        for project in projects:
+            if project.full_name not in seen:
+                seen.add(project.full_name)
+                new_projects.append(project)
+        if not new_projects:
+            return []
+
+        # topic の作成も flush を伴うため、ここから commit までを同じ try で扱う
+        try:
+            # 全プロジェクトの topic をまとめて取得・作成する
+            topic_names = list(dict.fromkeys(topic.name for project in new_projects for topic in project.topics))
+            topic_by_name = dict(zip(topic_names, self.topic_repo.get_or_create_topic_orms(topic_names), strict=True))
+
+            fetched_at = datetime.now(UTC)
+            new_orms = [
+                ProjectORM(
+                    full_name=project.full_name,
+                    url=project.url,
+                    stars=project.stars,
+                    language=project.language,
+                    description=project.description,
+                    last_commit_date=project.last_commit_date,
+                    fetched_at=project.fetched_at or fetched_at,
+                    js_lines_count=project.js_lines_count,
+                    topics=[topic_by_name[name] for name in dict.fromkeys(topic.name for topic in project.topics)],
+                )
+                for project in new_projects
+            ]
+            self.db.add_all(new_orms)
+
+            # commit 後は属性が失効して再読込が走るため、ID が採番された flush 直後に変換しておく
+            self.db.flush()
+            saved = [self._to_domain(orm) for orm in new_orms]
+            self.db.commit()
+        except Exception:
+            # 失敗したトランザクションを残すと、同じセッションでの以降の操作がすべて失敗する
+            self.db.rollback()
+            raise
+        return saved
 
     def update_js_lines_count(self, project_id: int, js_lines_count: int) -> None:
         if js_lines_count < 0:
@@ -108,15 +205,3 @@ class SqlAlchemyProjectRepository:
 
         project.js_lines_count = js_lines_count
         self.db.commit()
-
-    def _get_or_create_topic_orms(self, topic_names: list[str]) -> list[TopicORM]:
-        """Topic 名のリストから ORM オブジェクトを取得または作成する"""
-        result: list[TopicORM] = []
-        for name in topic_names:
-            orm = self.db.query(TopicORM).filter(TopicORM.name == name).first()
-            if not orm:
-                orm = TopicORM(name=name)
-                self.db.add(orm)
-            result.append(orm)
-        self.db.flush()
-        return result
@@ -29,12 +29,24 @@ class SqlAlchemyTopicRepository:
         return self.db.query(TopicORM).count()
 
     def get_or_create_topics(self, topic_names: list[str]) -> list[Topic]:
-        orms: list[TopicORM] = []
-        for name in topic_names:
-            orm = self.db.query(TopicORM).filter(TopicORM.name == name).first()
-            if not orm:
-                orm = TopicORM(name=name)
-                self.db.add(orm)
-            orms.append(orm)
-        self.db.flush()
-        return [self._to_domain(orm) for orm in orms]
+        return [self._to_domain(orm) for orm in self.get_or_create_topic_orms(topic_names)]
+
+    def get_or_create_topic_orms(self, topic_names: list[str]) -> list[TopicORM]:
+        """Topic 名のリストから ORM オブジェクトを取得または作成する
+
+        既存の topic は1回の `IN` 検索でまとめて取得し、存在しないものだけを一括で追加する。
+        戻り値は `topic_names` と同じ順序・同じ長さになる（重複名は同じオブジェクトを指す）。
+        """
+        if not topic_names:
+            return []
+
+        unique_names = list(dict.fromkeys(topic_names))
+        by_name = {orm.name: orm for orm in self.db.query(TopicORM).filter(TopicORM.name.in_(unique_names))}
+
+        missing = [TopicORM(name=name) for name in unique_names if name not in by_name]
+        if missing:
+            self.db.add_all(missing)
+            self.db.flush()
+            by_name.update((orm.name, orm) for orm in missing)
+
+        return [by_name[name] for name in topic_names]
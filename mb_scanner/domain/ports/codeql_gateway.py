@@ -18,6 +18,7 @@ class CodeQLCLIPort(Protocol):
         ram: int | None = None,
         sarif_category: str | None = None,
         sarif_add_snippets: bool = True,
+        keep_full_cache: bool = False,
     ) -> None: ...
 
 
@@ -42,3 +43,5 @@ class CodeQLResultAnalyzerPort(Protocol):
     """CodeQL 結果分析の契約"""
 
     def count_results(self, sarif_path: Path) -> int: ...
+
+    def split_results_by_rule(self, sarif_path: Path, outputs: dict[str, Path]) -> dict[str, int]: ...
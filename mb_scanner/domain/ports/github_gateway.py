@@ -1,14 +1,18 @@
 """GitHub API ゲートウェイの契約定義"""
 
+from collections.abc import Iterable
 from datetime import UTC, datetime, timedelta
+from functools import cached_property
 from typing import Protocol
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SearchCriteria(BaseModel):
     """GitHub検索条件を表すPydanticモデル
 
+    日付に依存しないクエリの部分は初回参照時に一度だけ構築してキャッシュするため、インスタンスは不変とする。
+
     Attributes:
         language: 検索対象の主要言語
         min_stars: 最小スター数
@@ -19,24 +23,26 @@ class SearchCriteria(BaseModel):
     min_stars: int = Field(..., ge=0, description="最小スター数")
     max_days_since_commit: int = Field(..., ge=1, description="最終コミットからの最大日数")
 
+    model_config = ConfigDict(frozen=True)
+
+    @cached_property
+    def _query_prefix(self) -> str:
+        """日付に依存しないクエリ部分（初回参照時に構築してキャッシュ）"""
+        return f"language:{self.language.lower()} stars:>={self.min_stars}"
+
     def to_query_string(self) -> str:
         """検索条件をGitHub検索クエリ文字列に変換する
 
         例: "language:javascript stars:>=100 pushed:>2024-01-01"
 
+        pushed の基準日は呼び出しごとに現在日付から計算するため、同じ検索条件を使い回しても古くならない。
+
         Returns:
             str: GitHub API用の検索クエリ文字列
         """
-        cutoff_date = datetime.now(UTC) - timedelta(days=self.max_days_since_commit)
-        date_str = cutoff_date.strftime("%Y-%m-%d")
-
-        query_parts = [
-            f"language:{self.language.lower()}",
-            f"stars:>={self.min_stars}",
-            f"pushed:>{date_str}",
-        ]
-
-        return " ".join(query_parts)
+        # 日単位の差分なので日付（date）だけで計算し、strftime を経由せず ISO 形式（YYYY-MM-DD）で得る
+        cutoff_date = datetime.now(UTC).date() - timedelta(days=self.max_days_since_commit)
+        return f"{self._query_prefix} pushed:>{cutoff_date.isoformat()}"
 
 
 class GitHubRepositoryDTO(BaseModel):
@@ -58,6 +64,6 @@ class GitHubGateway(Protocol):
         self,
         criteria: SearchCriteria,
         max_results: int | None = None,
-    ) -> list[GitHubRepositoryDTO]: ...
+    ) -> Iterable[GitHubRepositoryDTO]: ...
 
     def close(self) -> None: ...
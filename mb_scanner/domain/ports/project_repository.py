@@ -11,6 +11,8 @@ class ProjectRepository(Protocol):
 
     def get_project_by_full_name(self, full_name: str) -> Project | None: ...
 
+    def existing_full_names(self, full_names: list[str]) -> set[str]: ...
+
     def get_all_projects(self) -> list[Project]: ...
 
     def count_projects(self) -> int: ...
@@ -30,4 +32,6 @@ class ProjectRepository(Protocol):
         update_if_exists: bool = False,
     ) -> Project: ...
 
+    def save_projects(self, projects: list[Project], *, check_existing: bool = True) -> list[Project]: ...
+
     def update_js_lines_count(self, project_id: int, js_lines_count: int) -> None: ...
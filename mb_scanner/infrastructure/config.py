@@ -74,6 +74,10 @@ class Settings(BaseSettings):
         default="sarifv2.1.0",
         description="CodeQLクエリ実行結果のデフォルト出力フォーマット",
     )
+    codeql_default_threads: int = Field(
+        default=0,
+        description="CodeQLクエリ実行時のデフォルトスレッド数（0でCPUコア数ぶん。CodeQL CLI 自体の既定は1）",
+    )
 
     # 可視化関連設定
     total_projects_count: int = Field(
@@ -43,8 +43,9 @@ class TopicORM(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False, index=True)
 
+    # topic 側から projects を辿る処理はないため、topic 読込時に関連プロジェクトまで連鎖して読み込まない
     projects: Mapped[list["ProjectORM"]] = relationship(
-        "ProjectORM", secondary="project_topics", back_populates="topics", lazy="selectin"
+        "ProjectORM", secondary="project_topics", back_populates="topics", lazy="select"
     )
 
     def __repr__(self) -> str:
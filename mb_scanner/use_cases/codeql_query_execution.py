@@ -3,14 +3,22 @@
 このモジュールでは、CodeQLクエリの実行を統合したワークフローを提供します。
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 import logging
 from pathlib import Path
+import re
 from typing import Literal, TypedDict
 
 from mb_scanner.domain.ports.codeql_gateway import CodeQLCLIPort, CodeQLDatabaseManagerPort, CodeQLResultAnalyzerPort
 
 logger = logging.getLogger(__name__)
 
+# クエリ先頭のメタデータコメント（QLDoc）。前に置かれた空白と // コメントは読み飛ばす
+_QUERY_METADATA_PATTERN = re.compile(r"\A(?:\s|//[^\n]*)*/\*\*(.*?)\*/", re.DOTALL)
+# メタデータコメントの行頭にある @id（SARIF の ruleId になる）
+_QUERY_ID_PATTERN = re.compile(r"^\s*\*?\s*@id\s+(\S+)", re.MULTILINE)
+
 
 class QueryResult(TypedDict):
     """個別クエリの実行結果
@@ -48,6 +56,38 @@ QueryExecutionResult = QueryExecutionSuccessResult | QueryExecutionErrorResult
 """
 
 
+def _find_missing_query_file(query_files: list[Path]) -> Path | None:
+    """存在しない最初のクエリファイルを返す（全て存在する場合は None）"""
+    return next((query_file for query_file in query_files if not query_file.exists()), None)
+
+
+def _combinable_rule_ids(query_files: list[Path]) -> list[str] | None:
+    """全クエリを1回の analyze にまとめられる場合、各クエリの @id を返す
+
+    まとめて実行したSARIFの結果は ruleId（= クエリの @id）でしか元のクエリに対応付けられないため、
+    クエリが1つだけの場合や、@id が欠けている・重複している場合は None を返す。
+    """
+    if len(query_files) < 2:
+        return None
+
+    rule_ids: list[str] = []
+    for query_file in query_files:
+        rule_id = _query_rule_id(query_file)
+        if rule_id is None or rule_id in rule_ids:
+            return None
+        rule_ids.append(rule_id)
+    return rule_ids
+
+
+def _query_rule_id(query_file: Path) -> str | None:
+    """クエリ先頭のメタデータコメントから @id を取得する（文字列や後続のコメント中の @id は対象外）"""
+    metadata = _QUERY_METADATA_PATTERN.match(query_file.read_text(encoding="utf-8", errors="replace"))
+    if metadata is None:
+        return None
+    match = _QUERY_ID_PATTERN.search(metadata.group(1))
+    return match.group(1) if match else None
+
+
 class CodeQLQueryExecutionWorkflow:
     """CodeQLクエリ実行ワークフロー
 
@@ -70,6 +110,10 @@ class CodeQLQueryExecutionWorkflow:
         self.codeql_cli = codeql_cli
         self.db_manager = db_manager
         self.result_analyzer = result_analyzer
+        # 存在を確認済みのDBパス（同じプロジェクトを再度実行する際のファイルシステム確認を省く）
+        self._db_path_cache: dict[str, Path] = {}
+        # クエリファイルの組ごとの @id 読み取り結果（バッチ内で同じクエリを読み直さない）
+        self._rule_ids_cache: dict[tuple[Path, ...], list[str] | None] = {}
 
     def execute_query_for_project(
         self,
@@ -82,14 +126,17 @@ class CodeQLQueryExecutionWorkflow:
         ram: int | None = None,
         sarif_category: str | None = None,
         sarif_add_snippets: bool = True,
+        query_files_validated: bool = False,
     ) -> QueryExecutionResult:
         """単一プロジェクトに対してクエリを実行（各クエリファイルごとに別々のSARIFを出力）
 
         フロー:
         1. データベースの存在確認
         2. クエリファイルの検証
-        3. 各クエリファイルごとにクエリ実行
-        4. 結果のカウント（オプション）
+        3. クエリ実行
+           - 全クエリに重複しない @id があれば1回の analyze にまとめ、結果を ruleId で分割する
+           - それ以外は1クエリずつ実行する（最後のクエリ以外はディスクキャッシュを保持）
+        4. 結果のカウント
 
         Args:
             project_full_name: プロジェクト名（owner/repo）
@@ -100,6 +147,7 @@ class CodeQLQueryExecutionWorkflow:
             ram: 使用するRAM（MB）
             sarif_category: SARIFカテゴリ
             sarif_add_snippets: コードスニペットを含めるか
+            query_files_validated: 呼び出し元でクエリファイルの存在を確認済みの場合 True（2. を省略）
 
         Returns:
             QueryExecutionResult: 実行結果
@@ -111,7 +159,8 @@ class CodeQLQueryExecutionWorkflow:
 
         try:
             # 1. データベースの存在確認
-            if not self.db_manager.database_exists(project_full_name):
+            db_path = self._find_database(project_full_name)
+            if db_path is None:
                 error_msg = f"Database does not exist for project: {project_full_name}"
                 logger.error(error_msg)
                 return {
@@ -119,46 +168,67 @@ class CodeQLQueryExecutionWorkflow:
                     "error": error_msg,
                 }
 
-            db_path = self.db_manager.get_database_path(project_full_name)
             logger.info("Database found: %s", db_path)
 
             # 2. クエリファイルの検証
-            for query_file in query_files:
-                if not query_file.exists():
-                    error_msg = f"Query file does not exist: {query_file}"
-                    logger.error(error_msg)
-                    return {
-                        "status": "error",
-                        "error": error_msg,
-                    }
-
-            # 3. 各クエリファイルごとにクエリ実行
-            results: list[QueryResult] = []
-            safe_project_name = project_full_name.replace("/", "-")
-
-            for query_file in query_files:
-                query_name = query_file.stem  # id_10.ql -> id_10
-                output_path = output_base_dir / query_name / f"{safe_project_name}.sarif"
+            missing_query_file = None if query_files_validated else _find_missing_query_file(query_files)
+            if missing_query_file is not None:
+                error_msg = f"Query file does not exist: {missing_query_file}"
+                logger.error(error_msg)
+                return {
+                    "status": "error",
+                    "error": error_msg,
+                }
 
-                # 出力先ディレクトリを作成
+            # 3. クエリ実行（出力先はクエリごとに outputs/<クエリ名>/<プロジェクト>.sarif）
+            safe_project_name = project_full_name.replace("/", "-")
+            output_paths = [
+                output_base_dir / query_file.stem / f"{safe_project_name}.sarif"  # id_10.ql -> id_10/
+                for query_file in query_files
+            ]
+            for output_path in output_paths:
                 output_path.parent.mkdir(parents=True, exist_ok=True)
 
-                logger.info("Executing query %s for: %s", query_file.name, project_full_name)
-
-                self.codeql_cli.analyze_database(
-                    database_path=db_path,
-                    output_path=output_path,
-                    query_files=[query_file],  # 1つずつ実行
-                    format=format,
-                    threads=threads,
-                    ram=ram,
-                    sarif_category=sarif_category,
-                    sarif_add_snippets=sarif_add_snippets,
-                )
+            analyze = partial(
+                self.codeql_cli.analyze_database,
+                database_path=db_path,
+                format=format,
+                threads=threads,
+                ram=ram,
+                sarif_category=sarif_category,
+                sarif_add_snippets=sarif_add_snippets,
+            )
 
-                # 結果のカウント
-                result_count = self.result_analyzer.count_results(output_path)
+            result_counts: list[int] = []
+            rule_ids = self._rule_ids_for(query_files)
+            if rule_ids is not None:
+                # 全クエリを1回の analyze で評価し（JVM起動・DB読み込み・共通述語の評価を1回に抑える）、
+                # 結果を ruleId ごとに各クエリのSARIFへ分割する
+                logger.info("Executing %d queries in one run for: %s", len(query_files), project_full_name)
+                combined_path = output_base_dir / f"{safe_project_name}.combined.sarif"
+                analyze(output_path=combined_path, query_files=query_files)
+                try:
+                    counts_by_rule = self.result_analyzer.split_results_by_rule(
+                        combined_path, dict(zip(rule_ids, output_paths, strict=True))
+                    )
+                finally:
+                    combined_path.unlink(missing_ok=True)
+                result_counts = [counts_by_rule[rule_id] for rule_id in rule_ids]
+            else:
+                last_index = len(query_files) - 1
+                for index, (query_file, output_path) in enumerate(zip(query_files, output_paths, strict=True)):
+                    logger.info("Executing query %s for: %s", query_file.name, project_full_name)
+                    analyze(
+                        output_path=output_path,
+                        query_files=[query_file],  # 1つずつ実行
+                        # 後続クエリがある間はキャッシュを残し、共通のライブラリ述語を再評価させない
+                        keep_full_cache=index < last_index,
+                    )
+                    result_counts.append(self.result_analyzer.count_results(output_path))
 
+            # 4. 結果の集計
+            results: list[QueryResult] = []
+            for query_file, output_path, result_count in zip(query_files, output_paths, result_counts, strict=True):
                 results.append(
                     QueryResult(
                         query_file=query_file.name,
@@ -166,7 +236,6 @@ class CodeQLQueryExecutionWorkflow:
                         result_count=result_count,
                     )
                 )
-
                 logger.info(
                     "Successfully executed query %s for %s: %d results found",
                     query_file.name,
@@ -187,6 +256,24 @@ class CodeQLQueryExecutionWorkflow:
                 "error": str(e),
             }
 
+    def _find_database(self, project_full_name: str) -> Path | None:
+        """プロジェクトのDBパスを返す（存在しない場合は None）
+
+        見つかったパスだけをキャッシュし、未作成のDBは後から作成されても検出できるようにする。
+        """
+        db_path = self._db_path_cache.get(project_full_name)
+        if db_path is None and self.db_manager.database_exists(project_full_name):
+            db_path = self.db_manager.get_database_path(project_full_name)
+            self._db_path_cache[project_full_name] = db_path
+        return db_path
+
+    def _rule_ids_for(self, query_files: list[Path]) -> list[str] | None:
+        """_combinable_rule_ids の結果をクエリファイルの組ごとにキャッシュして返す"""
+        key = tuple(query_files)
+        if key not in self._rule_ids_cache:
+            self._rule_ids_cache[key] = _combinable_rule_ids(query_files)
+        return self._rule_ids_cache[key]
+
     def execute_queries_batch(
         self,
         projects: list[str],
@@ -196,16 +283,23 @@ class CodeQLQueryExecutionWorkflow:
         format: str = "sarifv2.1.0",
         threads: int | None = None,
         ram: int | None = None,
+        workers: int = 1,
     ) -> dict[str, int]:
         """複数プロジェクトに対してクエリを一括実行
 
+        プロジェクト間は独立しているため、``workers`` 個のスレッドで並列に処理する。
+        実処理は CodeQL CLI のサブプロセスなので、スレッドでも GIL に律速されない。
+        ``workers`` と ``ram`` はそのまま使うため、``threads`` と合わせたCPUコア数の上限や
+        RAM の等分は呼び出し側（CLI）で適用する。
+
         Args:
             projects: プロジェクト名のリスト（例: ["facebook/react", "microsoft/vscode"]）
             query_files: クエリファイルのリスト
             output_base_dir: 結果の出力先ベースディレクトリ
             format: 出力フォーマット
             threads: 使用するスレッド数
-            ram: 使用するRAM（MB）
+            ram: 1プロジェクトの処理で使用するRAM（MB）
+            workers: 同時に処理するプロジェクト数（1 で逐次実行）
 
         Returns:
             dict: 統計情報
@@ -221,23 +315,37 @@ class CodeQLQueryExecutionWorkflow:
             "failed": 0,
         }
 
-        for project_name in projects:
-            logger.info("Processing project: %s", project_name)
-
-            result = self.execute_query_for_project(
-                project_full_name=project_name,
-                query_files=query_files,
-                output_base_dir=output_base_dir,
-                format=format,
-                threads=threads,
-                ram=ram,
-            )
-
-            # 統計情報を更新
-            if result["status"] == "success":
-                stats["success"] += 1
-            else:
-                stats["failed"] += 1
+        # クエリファイルは全プロジェクトで共通なので、存在確認はここで1回だけ行う
+        missing_query_file = _find_missing_query_file(query_files)
+        if missing_query_file is not None:
+            logger.error("Query file does not exist: %s", missing_query_file)
+            stats["failed"] = len(projects)
+            return stats
+
+        # DBパス順に処理し、隣接するDBへのディスクアクセスをまとめる
+        ordered_projects = sorted(projects, key=lambda name: str(self.db_manager.get_database_path(name)))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    self.execute_query_for_project,
+                    project_full_name=project_name,
+                    query_files=query_files,
+                    output_base_dir=output_base_dir,
+                    format=format,
+                    threads=threads,
+                    ram=ram,
+                    query_files_validated=True,
+                )
+                for project_name in ordered_projects
+            ]
+
+            # 統計情報の更新は呼び出し元スレッドでのみ行う
+            for future in as_completed(futures):
+                if future.result()["status"] == "success":
+                    stats["success"] += 1
+                else:
+                    stats["failed"] += 1
 
         logger.info("Batch execution completed. Stats: %s", stats)
         return stats
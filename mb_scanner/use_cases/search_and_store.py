@@ -4,13 +4,40 @@
 データベースに保存するワークフローを提供します。
 """
 
+from collections.abc import Iterable, Iterator
+from itertools import islice
 import logging
 
+from mb_scanner.domain.entities.project import Project, Topic
 from mb_scanner.domain.ports.github_gateway import GitHubGateway, GitHubRepositoryDTO, SearchCriteria
 from mb_scanner.domain.ports.project_repository import ProjectRepository
 
 logger = logging.getLogger(__name__)
 
+# 検索結果を保存する単位（GitHub検索の1ページ分。ページ取得とDB保存を交互に進める）
+_SAVE_CHUNK_SIZE = 100
+
+
+def _unique_by_full_name(repositories: Iterable[GitHubRepositoryDTO]) -> Iterator[GitHubRepositoryDTO]:
+    """full_name が重複するリポジトリを除き、最初に現れたものだけを順に返す
+
+    検索結果はページ単位で取得されるため、ページ取得の間に順位が入れ替わると同じリポジトリが
+    複数のページに現れることがある。
+
+    Args:
+        repositories: 検索結果のリポジトリ
+
+    Yields:
+        GitHubRepositoryDTO: 重複を除いたリポジトリ
+    """
+    seen: set[str] = set()
+    for repo in repositories:
+        if repo.full_name in seen:
+            logger.debug("Skipped duplicate search result: %s", repo.full_name)
+            continue
+        seen.add(repo.full_name)
+        yield repo
+
 
 class SearchAndStoreWorkflow:
     """GitHub検索とDB保存を統合するワークフロークラス
@@ -49,7 +76,7 @@ class SearchAndStoreWorkflow:
 
         Returns:
             dict[str, int]: 実行結果の統計情報
-                - total: 検索結果の総数
+                - total: 検索結果の総数（full_name の重複は除く）
                 - saved: 保存に成功した数
                 - updated: 更新した数
                 - skipped: スキップした数（既存）
@@ -70,32 +97,20 @@ class SearchAndStoreWorkflow:
         }
 
         try:
-            # GitHub APIで検索実行
-            repositories = self.github_client.search_repositories(
-                criteria=criteria,
-                max_results=max_results,
+            # GitHub APIで検索実行（結果はページ取得に合わせて逐次届く）
+            # ページをまたいで重複した結果は、DB に問い合わせる前に取り除く
+            repositories = _unique_by_full_name(
+                self.github_client.search_repositories(
+                    criteria=criteria,
+                    max_results=max_results,
+                )
             )
-            stats["total"] = len(repositories)
-
-            logger.info("Found %d repositories, starting to save...", stats["total"])
 
-            # 各リポジトリをデータベースに保存
-            for repo in repositories:
-                try:
-                    result = self._save_repository(repo, update_if_exists=update_if_exists)
-
-                    # 統計情報を更新
-                    if result == "new":
-                        stats["saved"] += 1
-                    elif result == "updated":
-                        stats["updated"] += 1
-                    elif result == "skipped":
-                        stats["skipped"] += 1
-
-                except Exception as e:
-                    logger.error("Failed to save repository %s: %s", repo.full_name, e)
-                    stats["failed"] += 1
-                    continue
+            # 全件を待たずに、チャンク単位で保存しながら読み進める
+            while chunk := list(islice(repositories, _SAVE_CHUNK_SIZE)):
+                stats["total"] += len(chunk)
+                logger.info("Fetched %d repositories (total %d), saving...", len(chunk), stats["total"])
+                self._store_chunk(chunk, stats, update_if_exists=update_if_exists)
 
             logger.info("Workflow completed. Stats: %s", stats)
             return stats
@@ -104,30 +119,101 @@ class SearchAndStoreWorkflow:
             logger.error("Workflow failed: %s", e)
             raise
 
-    def _save_repository(
+    def _store_chunk(
         self,
-        repo: GitHubRepositoryDTO,
+        repositories: list[GitHubRepositoryDTO],
+        stats: dict[str, int],
         *,
         update_if_exists: bool,
-    ) -> str:
-        """リポジトリをデータベースに保存する
+    ) -> None:
+        """検索結果の1チャンクをデータベースに保存し、統計情報を更新する
 
         Args:
-            repo: GitHubRepositoryDTOオブジェクト
+            repositories: 保存するリポジトリのリスト
+            stats: 更新する統計情報
             update_if_exists: 既存プロジェクトを更新するか
+        """
+        # 既存プロジェクトの判定は1回の問い合わせで済ませる
+        existing_names = self.project_repo.existing_full_names([repo.full_name for repo in repositories])
+
+        # 既存プロジェクトは個別に更新/スキップし、新規プロジェクトは後でまとめて保存する
+        new_projects: list[Project] = []
+        for repo in repositories:
+            try:
+                if repo.full_name not in existing_names:
+                    new_projects.append(self._to_project(repo))
+                elif update_if_exists:
+                    self._update_repository(repo)
+                    stats["updated"] += 1
+                else:
+                    logger.debug("Skipped existing project: %s", repo.full_name)
+                    stats["skipped"] += 1
+
+            except Exception as e:
+                logger.error("Failed to save repository %s: %s", repo.full_name, e)
+                stats["failed"] += 1
+                continue
+
+        # 新規プロジェクトは1回の add_all / commit で保存する（既存判定は上で済んでいる）
+        if new_projects:
+            try:
+                saved_projects = self.project_repo.save_projects(new_projects, check_existing=False)
+            except Exception as e:
+                # 1件の不正データでチャンク全体を失敗扱いにしないよう、1件ずつ保存し直す
+                logger.warning(
+                    "Failed to save %d new repositories in bulk, retrying one by one: %s", len(new_projects), e
+                )
+                self._save_one_by_one(new_projects, stats)
+            else:
+                stats["saved"] += len(saved_projects)
+                logger.debug("Saved %d new projects", len(saved_projects))
+
+    def _save_one_by_one(self, projects: list[Project], stats: dict[str, int]) -> None:
+        """新規プロジェクトを1件ずつ保存し、統計情報を更新する
+
+        一括保存に失敗したチャンクの再試行に使う。失敗したプロジェクトだけを failed に数える。
+
+        Args:
+            projects: 保存するプロジェクトのリスト
+            stats: 更新する統計情報
+        """
+        for project in projects:
+            try:
+                # 一括保存の失敗後なので、他の処理が保存済みのものは既存としてスキップさせる
+                if self.project_repo.save_projects([project]):
+                    stats["saved"] += 1
+                else:
+                    stats["skipped"] += 1
+            except Exception as e:
+                logger.error("Failed to save repository %s: %s", project.full_name, e)
+                stats["failed"] += 1
+
+    @staticmethod
+    def _to_project(repo: GitHubRepositoryDTO) -> Project:
+        """GitHubRepositoryDTO から保存用のドメインエンティティを作成する
+
+        Args:
+            repo: GitHubRepositoryDTOオブジェクト
 
         Returns:
-            str: "new" (新規保存), "updated" (更新), "skipped" (スキップ) のいずれか
+            Project: 未保存のプロジェクト（id・fetched_at は保存時に設定される）
         """
-        # 既存のプロジェクトをチェック
-        existing_project = self.project_repo.get_project_by_full_name(repo.full_name)
+        return Project(
+            full_name=repo.full_name,
+            url=repo.html_url,
+            stars=repo.stargazers_count,
+            language=repo.language,
+            description=repo.description,
+            last_commit_date=repo.pushed_at,
+            topics=[Topic(name=name) for name in repo.topics],
+        )
 
-        # 既存プロジェクトがあり、更新フラグがFalseなら、スキップ
-        if existing_project and not update_if_exists:
-            logger.debug("Skipped existing project: %s", repo.full_name)
-            return "skipped"
+    def _update_repository(self, repo: GitHubRepositoryDTO) -> None:
+        """既存プロジェクトをリポジトリの最新情報で更新する
 
-        # ProjectRepositoryを使って保存
+        Args:
+            repo: GitHubRepositoryDTOオブジェクト
+        """
         self.project_repo.save_project(
             full_name=repo.full_name,
             url=repo.html_url,
@@ -136,16 +222,9 @@ class SearchAndStoreWorkflow:
             description=repo.description,
             last_commit_date=repo.pushed_at,
             topics=repo.topics,
-            update_if_exists=update_if_exists,
+            update_if_exists=True,
         )
-
-        # 既存プロジェクトがあれば更新、なければ新規保存
-        if existing_project:
-            logger.debug("Updated project: %s", repo.full_name)
-            return "updated"
-
-        logger.debug("Saved new project: %s", repo.full_name)
-        return "new"
+        logger.debug("Updated project: %s", repo.full_name)
 
     def close(self) -> None:
         """リソースをクリーンアップする"""
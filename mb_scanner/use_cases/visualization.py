@@ -38,12 +38,15 @@ class VisualizationService:
             FileNotFoundError: ファイルが存在しない場合
             pydantic.ValidationError: JSONのパースに失敗した場合
         """
-        if not json_path.exists():
+        # 存在確認の stat を別に行わず、読み込み時の例外で判定する
+        try:
+            raw = json_path.read_bytes()
+        except FileNotFoundError as e:
             msg = f"File not found: {json_path}"
-            raise FileNotFoundError(msg)
+            raise FileNotFoundError(msg) from e
 
-        with json_path.open("rb") as f:
-            return QuerySummary.model_validate_json(f.read())
+        # Pydantic の JSON パーサでバイト列から直接検証する（dict を経由しない）
+        return QuerySummary.model_validate_json(raw)
 
     def get_scatter_data(self, json_path: Path) -> list[tuple[int, int, str]]:
         """散布図用のデータを取得する
@@ -7,6 +7,7 @@ from unittest.mock import patch
 from typer.testing import CliRunner
 
 from mb_scanner.adapters.cli.codeql import codeql_app
+from mb_scanner.domain.entities.project import Project
 
 runner = CliRunner()
 
@@ -143,3 +144,72 @@ class TestCodeQLSummaryCommand:
 
         summary_path = query_dir / "summary.json"
         assert summary_path.exists()
+
+
+class TestCodeQLQueryBatchCommand:
+    """mb-scanner codeql query-batchコマンドのテスト"""
+
+    def test_query_batch_limits_workers_by_threads(self, tmp_path: Path) -> None:
+        """--workers と --threads の積がCPUコア数を超えないよう並列数が抑えられることを確認"""
+        # Arrange
+        query_file = tmp_path / "id_10.ql"
+        query_file.touch()
+
+        with (
+            patch("mb_scanner.adapters.cli.codeql.query.settings") as mock_settings,
+            patch("mb_scanner.adapters.cli.codeql.query.SessionLocal"),
+            patch("mb_scanner.adapters.cli.codeql.query.SqlAlchemyProjectRepository") as mock_repo_cls,
+            patch("mb_scanner.adapters.cli.codeql.query.CodeQLQueryExecutionWorkflow") as mock_workflow_cls,
+            patch("mb_scanner.adapters.gateways.codeql.database.os.cpu_count", return_value=8),
+        ):
+            mock_settings.effective_codeql_output_dir = tmp_path / "outputs"
+            mock_repo_cls.return_value.get_all_projects.return_value = [
+                Project(full_name="facebook/react", url="https://github.com/facebook/react")
+            ]
+            mock_workflow_cls.return_value.execute_queries_batch.return_value = {"total": 1, "success": 1, "failed": 0}
+
+            # Act
+            result = runner.invoke(
+                codeql_app,
+                ["query-batch", "-q", str(query_file), "--workers", "8", "--threads", "4"],
+            )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        assert "Workers: 2 (requested 8, limited by --threads=4)" in result.output
+        kwargs = mock_workflow_cls.return_value.execute_queries_batch.call_args.kwargs
+        assert kwargs["workers"] == 2
+        assert kwargs["threads"] == 4
+
+    def test_query_batch_splits_ram_across_workers(self, tmp_path: Path) -> None:
+        """--ram が並列数で等分され、同時実行する CodeQL の RAM 合計が --ram に収まることを確認"""
+        # Arrange
+        query_file = tmp_path / "id_10.ql"
+        query_file.touch()
+
+        with (
+            patch("mb_scanner.adapters.cli.codeql.query.settings") as mock_settings,
+            patch("mb_scanner.adapters.cli.codeql.query.SessionLocal"),
+            patch("mb_scanner.adapters.cli.codeql.query.SqlAlchemyProjectRepository") as mock_repo_cls,
+            patch("mb_scanner.adapters.cli.codeql.query.CodeQLQueryExecutionWorkflow") as mock_workflow_cls,
+            patch("mb_scanner.adapters.gateways.codeql.database.os.cpu_count", return_value=8),
+        ):
+            mock_settings.effective_codeql_output_dir = tmp_path / "outputs"
+            mock_repo_cls.return_value.get_all_projects.return_value = [
+                Project(full_name="facebook/react", url="https://github.com/facebook/react")
+            ]
+            mock_workflow_cls.return_value.execute_queries_batch.return_value = {"total": 1, "success": 1, "failed": 0}
+
+            # Act
+            result = runner.invoke(
+                codeql_app,
+                ["query-batch", "-q", str(query_file), "--workers", "4", "--threads", "2", "--ram", "16000"],
+            )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        assert "RAM per worker: 4000 MB (--ram=16000 split across 4 workers)" in result.output
+        kwargs = mock_workflow_cls.return_value.execute_queries_batch.call_args.kwargs
+        assert kwargs["workers"] == 4
+        assert kwargs["ram"] == 4000
+        assert kwargs["ram"] * kwargs["workers"] <= 16000
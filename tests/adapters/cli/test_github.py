@@ -19,7 +19,7 @@ class TestGitHubRateLimitCommand:
         """正常なレート制限状態のテスト"""
         # モックの設定
         mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
+        mock_client_class.return_value.__enter__.return_value = mock_client
 
         reset_time = datetime.now(UTC) + timedelta(hours=1)
         mock_client.get_rate_limit_info.return_value = {
@@ -38,13 +38,14 @@ class TestGitHubRateLimitCommand:
         assert "5000 requests/hour" in result.stdout
         assert "4500 requests" in result.stdout
         assert "✓ OK" in result.stdout
+        mock_client_class.return_value.__exit__.assert_called_once()
 
     @patch("mb_scanner.adapters.cli.github.GitHubClient")
     def test_rate_limit_warning(self, mock_client_class: MagicMock) -> None:
         """残りが少ない状態のテスト"""
         # モックの設定
         mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
+        mock_client_class.return_value.__enter__.return_value = mock_client
 
         reset_time = datetime.now(UTC) + timedelta(hours=1)
         mock_client.get_rate_limit_info.return_value = {
@@ -67,7 +68,7 @@ class TestGitHubRateLimitCommand:
         """レート制限超過のテスト"""
         # モックの設定
         mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
+        mock_client_class.return_value.__enter__.return_value = mock_client
 
         reset_time = datetime.now(UTC) + timedelta(minutes=30)
         mock_client.get_rate_limit_info.return_value = {
@@ -91,7 +92,7 @@ class TestGitHubRateLimitCommand:
         """エラーハンドリングのテスト"""
         # モックの設定
         mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
+        mock_client_class.return_value.__enter__.return_value = mock_client
         mock_client.get_rate_limit_info.side_effect = Exception("API Error")
 
         # コマンド実行
@@ -265,3 +266,79 @@ class TestGitHubCloneCommand:
         # Assert
         assert result.exit_code == 0
         assert "No projects found" in result.stdout
+
+    def test_clone_command_parallel_workers(self, tmp_path: Path) -> None:
+        """--workersで並列実行しても、結果が入力順に表示され集計されることを確認"""
+
+        # 1件目のみ失敗させ、それ以外はディレクトリを作成する
+        def clone_or_fail(url, destination, **kwargs):
+            if "facebook" in url:
+                raise RuntimeError("clone failed")
+            destination.mkdir(parents=True, exist_ok=True)
+            return destination
+
+        projects = [
+            (1, "facebook/react", "https://github.com/facebook/react.git"),
+            (2, "microsoft/vscode", "https://github.com/microsoft/vscode.git"),
+            (3, "nodejs/node", "https://github.com/nodejs/node.git"),
+        ]
+
+        with (
+            patch("mb_scanner.adapters.cli.github.SessionLocal"),
+            patch("mb_scanner.adapters.cli.github.SqlAlchemyProjectRepository") as mock_project_service,
+            patch("mb_scanner.adapters.cli.github.RepositoryCloner") as mock_cloner_class,
+            patch("mb_scanner.adapters.cli.github.settings") as mock_settings,
+        ):
+            mock_project_service.return_value.get_all_project_urls.return_value = projects
+            mock_cloner_class.return_value.clone.side_effect = clone_or_fail
+            mock_settings.github_token = "test_token"
+            mock_settings.effective_codeql_clone_dir = tmp_path / "clones"
+
+            result = runner.invoke(app, ["github", "clone", "--workers", "3"])
+
+        assert result.exit_code == 0
+        assert "Success: 2" in result.stdout
+        assert "Failed: 1" in result.stdout
+        # 表示順は入力順のまま
+        positions = [result.stdout.index(f"Processing: {name}") for _, name, _ in projects]
+        assert positions == sorted(positions)
+
+    def test_clone_command_skips_conflicting_clone_directories(self, tmp_path: Path) -> None:
+        """別リポジトリが同じクローン先になる場合、2件目以降はクローンせずスキップされることを確認"""
+        projects = [
+            (1, "a-b/c", "https://github.com/a-b/c.git"),
+            (2, "a/b-c", "https://github.com/a/b-c.git"),
+        ]
+
+        def clone(url, destination, **kwargs):
+            destination.mkdir(parents=True, exist_ok=True)
+            return destination
+
+        with (
+            patch("mb_scanner.adapters.cli.github.SessionLocal"),
+            patch("mb_scanner.adapters.cli.github.SqlAlchemyProjectRepository") as mock_project_service,
+            patch("mb_scanner.adapters.cli.github.RepositoryCloner") as mock_cloner_class,
+            patch("mb_scanner.adapters.cli.github.settings") as mock_settings,
+        ):
+            mock_project_service.return_value.get_all_project_urls.return_value = projects
+            mock_cloner_class.return_value.clone.side_effect = clone
+            mock_settings.github_token = "test_token"
+            mock_settings.effective_codeql_clone_dir = tmp_path / "clones"
+
+            result = runner.invoke(app, ["github", "clone", "--force", "--workers", "2"])
+
+        assert result.exit_code == 0
+        mock_cloner_class.return_value.clone.assert_called_once()
+        assert mock_cloner_class.return_value.clone.call_args.args[0] == "https://github.com/a-b/c.git"
+        assert "Success: 1" in result.stdout
+        assert "Skipped: 1" in result.stdout
+        assert "already used by a-b/c" in result.output
+
+    def test_clone_command_invalid_workers(self) -> None:
+        """不正な--workersは終了コード1で拒否されることを確認"""
+        with patch("mb_scanner.adapters.cli.github.SessionLocal") as mock_session:
+            result = runner.invoke(app, ["github", "clone", "--workers", "0"])
+
+        assert result.exit_code == 1
+        assert "Invalid --workers" in result.output
+        mock_session.assert_not_called()
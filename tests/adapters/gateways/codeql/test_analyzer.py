@@ -2,7 +2,9 @@
 
 from datetime import datetime
 import json
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -59,6 +61,28 @@ class TestCodeQLResultAnalyzer:
 
         assert count == 0
 
+    def test_count_results_zero_fast_path_skips_json_parse(self, tmp_path: Path) -> None:
+        """空のresults配列のみを含むSARIFはJSONパースせずに0件と判定されることを確認"""
+        sarif_path = tmp_path / "results.sarif"
+        sarif_path.write_text('{"version": "2.1.0", "runs": [ {"tool": {}, "results" : [ ] } ]}')
+
+        analyzer = CodeQLResultAnalyzer()
+        with patch("mb_scanner.adapters.gateways.codeql.analyzer.json.loads") as mock_loads:
+            count = analyzer.count_results(sarif_path)
+
+        assert count == 0
+        mock_loads.assert_not_called()
+
+    def test_count_results_empty_results_without_runs_is_invalid(self, tmp_path: Path) -> None:
+        """空のresultsがあってもrunsが無ければ高速パスを通らずValueErrorになることを確認"""
+        sarif_path = tmp_path / "results.sarif"
+        sarif_path.write_text('{"version": "2.1.0", "results": []}')
+
+        analyzer = CodeQLResultAnalyzer()
+
+        with pytest.raises(ValueError, match="Invalid SARIF format"):
+            analyzer.count_results(sarif_path)
+
     def test_count_results_file_not_found(self, tmp_path: Path) -> None:
         """存在しないSARIFファイルを指定した場合にFileNotFoundErrorが発生することを確認"""
         sarif_path = tmp_path / "nonexistent.sarif"
@@ -75,6 +99,16 @@ class TestCodeQLResultAnalyzer:
 
         analyzer = CodeQLResultAnalyzer()
 
+        with pytest.raises(ValueError, match=r"Invalid SARIF format \(JSON decode error\)"):
+            analyzer.count_results(sarif_path)
+
+    def test_count_results_invalid_encoding(self, tmp_path: Path) -> None:
+        """UTF-8 として不正なバイト列の場合にValueErrorが発生することを確認"""
+        sarif_path = tmp_path / "invalid_encoding.sarif"
+        sarif_path.write_bytes(b'{"runs": [{"results": ["\xff"]}]}')
+
+        analyzer = CodeQLResultAnalyzer()
+
         with pytest.raises(ValueError, match="Invalid SARIF format"):
             analyzer.count_results(sarif_path)
 
@@ -86,9 +120,94 @@ class TestCodeQLResultAnalyzer:
 
         analyzer = CodeQLResultAnalyzer()
 
-        with pytest.raises(ValueError, match="Invalid SARIF format"):
+        with pytest.raises(ValueError, match=r"Invalid SARIF format \(missing runs\)"):
+            analyzer.count_results(sarif_path)
+
+    def test_count_results_uses_cache_for_unchanged_file(self, tmp_path: Path) -> None:
+        """mtime・サイズが同じファイルは再パースせずキャッシュ値を返すことを確認"""
+        sarif_path = tmp_path / "results.sarif"
+        sarif_path.write_text(json.dumps({"runs": [{"results": [{"ruleId": "a"}]}]}))
+        st = sarif_path.stat()
+
+        analyzer = CodeQLResultAnalyzer()
+        assert analyzer.count_results(sarif_path) == 1
+
+        # 同じサイズ・同じ mtime のまま中身だけ壊す → キャッシュが使われればパースされない
+        sarif_path.write_text("x" * st.st_size)
+        os.utime(sarif_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert analyzer.count_results(sarif_path) == 1
+
+    def test_count_results_cache_invalidated_on_change(self, tmp_path: Path) -> None:
+        """ファイルが更新された場合はキャッシュを使わずに再カウントすることを確認"""
+        sarif_path = tmp_path / "results.sarif"
+        sarif_path.write_text(json.dumps({"runs": [{"results": [{"ruleId": "a"}]}]}))
+
+        analyzer = CodeQLResultAnalyzer()
+        assert analyzer.count_results(sarif_path) == 1
+
+        sarif_path.write_text(json.dumps({"runs": [{"results": [{"ruleId": "a"}, {"ruleId": "b"}]}]}))
+
+        assert analyzer.count_results(sarif_path) == 2
+
+    def test_count_results_empty_runs_rejected_without_json_parse(self, tmp_path: Path) -> None:
+        """runsが空配列の場合はJSONパースせずにValueErrorになることを確認"""
+        sarif_path = tmp_path / "empty_runs.sarif"
+        sarif_path.write_text(json.dumps({"version": "2.1.0", "runs": []}))
+
+        analyzer = CodeQLResultAnalyzer()
+        with (
+            patch("mb_scanner.adapters.gateways.codeql.analyzer.json.loads") as mock_loads,
+            pytest.raises(ValueError, match="missing runs"),
+        ):
             analyzer.count_results(sarif_path)
 
+        mock_loads.assert_not_called()
+
+    def test_split_results_by_rule(self, tmp_path: Path) -> None:
+        """まとめて実行したSARIFが ruleId ごとのSARIFに分割されることを確認"""
+        combined_path = tmp_path / "combined.sarif"
+        sarif_data = {
+            "version": "2.1.0",
+            "runs": [
+                {
+                    "tool": {"driver": {"name": "CodeQL", "rules": [{"id": "js/id-10"}, {"id": "js/id-20"}]}},
+                    "results": [
+                        {"ruleId": "js/id-10", "message": {"text": "Issue 1"}},
+                        {"rule": {"id": "js/id-20", "index": 1}, "message": {"text": "Issue 2"}},
+                        {"ruleId": "js/id-10", "message": {"text": "Issue 3"}},
+                        {"ruleId": "js/other", "message": {"text": "Issue 4"}},
+                        {"message": {"text": "Issue without rule"}},
+                    ],
+                }
+            ],
+        }
+        combined_path.write_text(json.dumps(sarif_data))
+        outputs = {
+            "js/id-10": tmp_path / "id_10" / "facebook-react.sarif",
+            "js/id-20": tmp_path / "id_20" / "facebook-react.sarif",
+        }
+
+        analyzer = CodeQLResultAnalyzer()
+        counts = analyzer.split_results_by_rule(combined_path, outputs)
+
+        assert counts == {"js/id-10": 2, "js/id-20": 1}
+        # 分割後のファイルも通常のSARIFとして件数を数えられ、run 情報は保持される
+        assert analyzer.count_results(outputs["js/id-10"]) == 2
+        assert analyzer.count_results(outputs["js/id-20"]) == 1
+        split_data = json.loads(outputs["js/id-20"].read_text())
+        assert split_data["runs"][0]["tool"] == sarif_data["runs"][0]["tool"]
+        assert [r["message"]["text"] for r in split_data["runs"][0]["results"]] == ["Issue 2"]
+
+    def test_split_results_by_rule_invalid_format(self, tmp_path: Path) -> None:
+        """不正なSARIFの場合にValueErrorが発生することを確認"""
+        combined_path = tmp_path / "combined.sarif"
+        combined_path.write_text(json.dumps({"version": "2.1.0"}))
+
+        analyzer = CodeQLResultAnalyzer()
+        with pytest.raises(ValueError, match="missing runs"):
+            analyzer.split_results_by_rule(combined_path, {"js/id-10": tmp_path / "out.sarif"})
+
     def test_filter_projects_by_threshold(self, tmp_path: Path) -> None:
         """閾値以上のプロジェクトが正しくフィルタリングされることを確認"""
         # 3つのSARIFファイルを作成（検出件数: 5, 10, 15）
@@ -207,6 +326,27 @@ class TestCodeQLResultAnalyzer:
             ("project-b", 15),
         ]
 
+    def test_get_summary_sorted_keeps_input_order_for_ties(self, tmp_path: Path) -> None:
+        """同じ検出件数のプロジェクトは入力順を保ってソートされることを確認"""
+        results_dict: dict[str, Path] = {}
+        for project_name, count in [("project-a", 5), ("project-b", 10), ("project-c", 5)]:
+            sarif_path = tmp_path / f"{project_name}.sarif"
+            sarif_path.write_text(json.dumps({"runs": [{"results": [{"ruleId": "r"}] * count}]}))
+            results_dict[project_name] = sarif_path
+
+        analyzer = CodeQLResultAnalyzer()
+
+        assert analyzer.get_summary_sorted(results_dict, reverse=True) == [
+            ("project-b", 10),
+            ("project-a", 5),
+            ("project-c", 5),
+        ]
+        assert analyzer.get_summary_sorted(results_dict, reverse=False) == [
+            ("project-a", 5),
+            ("project-c", 5),
+            ("project-b", 10),
+        ]
+
     def test_save_summary_json_without_threshold(self, tmp_path: Path) -> None:
         """閾値なしでサマリーJSONが正しく保存されることを確認"""
         # Arrange
@@ -360,6 +500,19 @@ class TestCodeQLResultAnalyzer:
         # Assert
         assert summary == {}
 
+    def test_generate_summary_from_directory_path_is_file(self, tmp_path: Path) -> None:
+        """ディレクトリではなくファイルが渡された場合に空の辞書が返ることを確認"""
+        # Arrange
+        file_path = tmp_path / "not_a_dir.sarif"
+        file_path.write_text("{}")
+
+        # Act
+        analyzer = CodeQLResultAnalyzer()
+        summary = analyzer.generate_summary_from_directory(file_path)
+
+        # Assert
+        assert summary == {}
+
     def test_generate_summary_from_directory_nonexistent(self, tmp_path: Path) -> None:
         """ディレクトリが存在しない場合にFileNotFoundErrorが発生することを確認"""
         # Arrange
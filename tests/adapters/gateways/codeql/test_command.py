@@ -1,5 +1,6 @@
 """CodeQLCLIクラスのテスト"""
 
+from collections.abc import Generator
 from pathlib import Path
 import subprocess
 from unittest.mock import MagicMock, patch
@@ -9,94 +10,110 @@ import pytest
 from mb_scanner.adapters.gateways.codeql.command import CodeQLCLI
 
 
-class TestCodeQLCLI:
-    """CodeQLCLIクラスのテスト"""
+@pytest.fixture
+def mock_subprocess_run() -> Generator[MagicMock]:
+    """成功を返す subprocess.run のモックを提供するフィクスチャ"""
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(stdout="", stderr="", returncode=0)
+        yield mock_run
 
-    def test_analyze_database_success(self, tmp_path: Path) -> None:
-        """正常にデータベースを分析できることを確認"""
-        cli = CodeQLCLI()
-        db_path = tmp_path / "test-db"
-        db_path.mkdir()
-        output_path = tmp_path / "results.sarif"
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout="Analysis successful",
-                stderr="",
-                returncode=0,
-            )
 
-            cli.analyze_database(
-                database_path=db_path,
-                output_path=output_path,
-            )
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    """作成済みのテスト用DBディレクトリを提供するフィクスチャ"""
+    path = tmp_path / "test-db"
+    path.mkdir()
+    return path
+
 
-            # subprocess.runが正しく呼ばれたことを確認
-            mock_run.assert_called_once()
-            args = mock_run.call_args[0][0]
+@pytest.fixture
+def output_path(tmp_path: Path) -> Path:
+    """SARIF出力先パスを提供するフィクスチャ"""
+    return tmp_path / "results.sarif"
 
-            # コマンドの基本構造を確認
-            assert args[0] == "codeql"
-            assert args[1] == "database"
-            assert args[2] == "analyze"
-            assert str(db_path) in args
-            assert "--format=sarifv2.1.0" in args
-            assert f"--output={output_path}" in args
-            assert "--sarif-add-snippets" in args
 
-    def test_analyze_database_with_query_files(self, tmp_path: Path) -> None:
+class TestCodeQLCLI:
+    """CodeQLCLIクラスのテスト"""
+
+    def test_analyze_database_success(self, mock_subprocess_run: MagicMock, db_path: Path, output_path: Path) -> None:
+        """正常にデータベースを分析できることを確認"""
+        cli = CodeQLCLI()
+        mock_subprocess_run.return_value.stdout = "Analysis successful"
+
+        cli.analyze_database(
+            database_path=db_path,
+            output_path=output_path,
+        )
+
+        # subprocess.runが正しく呼ばれたことを確認
+        mock_subprocess_run.assert_called_once()
+        args = mock_subprocess_run.call_args[0][0]
+
+        # コマンドの基本構造を確認
+        assert args[0] == "codeql"
+        assert args[1] == "database"
+        assert args[2] == "analyze"
+        assert str(db_path) in args
+        assert "--format=sarifv2.1.0" in args
+        assert f"--output={output_path}" in args
+        assert "--sarif-add-snippets" in args
+
+    def test_analyze_database_with_query_files(
+        self, tmp_path: Path, mock_subprocess_run: MagicMock, db_path: Path, output_path: Path
+    ) -> None:
         """クエリファイルを指定して分析できることを確認"""
         cli = CodeQLCLI()
-        db_path = tmp_path / "test-db"
-        db_path.mkdir()
-        output_path = tmp_path / "results.sarif"
         query_file1 = tmp_path / "query1.ql"
         query_file2 = tmp_path / "query2.ql"
         query_file1.touch()
         query_file2.touch()
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(stdout="", stderr="", returncode=0)
-
-            cli.analyze_database(
-                database_path=db_path,
-                output_path=output_path,
-                query_files=[query_file1, query_file2],
-            )
+        cli.analyze_database(
+            database_path=db_path,
+            output_path=output_path,
+            query_files=[query_file1, query_file2],
+        )
 
-            args = mock_run.call_args[0][0]
-            # クエリファイルがコマンドに含まれていることを確認
-            assert str(query_file1) in args
-            assert str(query_file2) in args
+        args = mock_subprocess_run.call_args[0][0]
+        # クエリファイルがコマンドに含まれていることを確認
+        assert str(query_file1) in args
+        assert str(query_file2) in args
 
-    def test_analyze_database_with_options(self, tmp_path: Path) -> None:
+    def test_analyze_database_with_options(
+        self, mock_subprocess_run: MagicMock, db_path: Path, output_path: Path
+    ) -> None:
         """threads, ram, sarif_categoryなどのオプションが正しく反映されることを確認"""
         cli = CodeQLCLI()
-        db_path = tmp_path / "test-db"
-        db_path.mkdir()
-        output_path = tmp_path / "results.sarif"
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(stdout="", stderr="", returncode=0)
+        cli.analyze_database(
+            database_path=db_path,
+            output_path=output_path,
+            threads=4,
+            ram=2048,
+            sarif_category="javascript",
+        )
+
+        args = mock_subprocess_run.call_args[0][0]
+        assert "--threads=4" in args
+        assert "--ram=2048" in args
+        assert "--sarif-category=javascript" in args
+
+    def test_analyze_database_keep_full_cache(
+        self, mock_subprocess_run: MagicMock, db_path: Path, output_path: Path
+    ) -> None:
+        """引数 keep_full_cache=True の場合のみ --keep-full-cache が付与されることを確認"""
+        cli = CodeQLCLI()
 
-            cli.analyze_database(
-                database_path=db_path,
-                output_path=output_path,
-                threads=4,
-                ram=2048,
-                sarif_category="javascript",
-            )
+        cli.analyze_database(database_path=db_path, output_path=output_path)
+        assert "--keep-full-cache" not in mock_subprocess_run.call_args[0][0]
 
-            args = mock_run.call_args[0][0]
-            assert "--threads=4" in args
-            assert "--ram=2048" in args
-            assert "--sarif-category=javascript" in args
+        cli.analyze_database(database_path=db_path, output_path=output_path, keep_full_cache=True)
+        assert "--keep-full-cache" in mock_subprocess_run.call_args[0][0]
 
-    def test_analyze_database_not_found(self, tmp_path: Path) -> None:
+    def test_analyze_database_not_found(self, tmp_path: Path, output_path: Path) -> None:
         """存在しないデータベースパスを指定した場合にFileNotFoundErrorが発生することを確認"""
         cli = CodeQLCLI()
         db_path = tmp_path / "nonexistent-db"
-        output_path = tmp_path / "results.sarif"
 
         with pytest.raises(FileNotFoundError, match="Database does not exist"):
             cli.analyze_database(
@@ -104,12 +121,9 @@ class TestCodeQLCLI:
                 output_path=output_path,
             )
 
-    def test_analyze_database_query_file_not_found(self, tmp_path: Path) -> None:
+    def test_analyze_database_query_file_not_found(self, tmp_path: Path, db_path: Path, output_path: Path) -> None:
         """存在しないクエリファイルを指定した場合にFileNotFoundErrorが発生することを確認"""
         cli = CodeQLCLI()
-        db_path = tmp_path / "test-db"
-        db_path.mkdir()
-        output_path = tmp_path / "results.sarif"
         nonexistent_query = tmp_path / "nonexistent.ql"
 
         with pytest.raises(FileNotFoundError, match="Query file does not exist"):
@@ -119,61 +133,47 @@ class TestCodeQLCLI:
                 query_files=[nonexistent_query],
             )
 
-    def test_analyze_database_failure(self, tmp_path: Path) -> None:
+    def test_analyze_database_failure(self, mock_subprocess_run: MagicMock, db_path: Path, output_path: Path) -> None:
         """分析に失敗した場合にCalledProcessErrorが発生することを確認"""
         cli = CodeQLCLI()
-        db_path = tmp_path / "test-db"
-        db_path.mkdir()
-        output_path = tmp_path / "results.sarif"
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.CalledProcessError(
-                returncode=1,
-                cmd=["codeql", "database", "analyze"],
-                stderr="Analysis failed",
-            )
+        mock_subprocess_run.side_effect = subprocess.CalledProcessError(
+            returncode=1,
+            cmd=["codeql", "database", "analyze"],
+            stderr="Analysis failed",
+        )
 
-            with pytest.raises(subprocess.CalledProcessError):
-                cli.analyze_database(
-                    database_path=db_path,
-                    output_path=output_path,
-                )
+        with pytest.raises(subprocess.CalledProcessError):
+            cli.analyze_database(
+                database_path=db_path,
+                output_path=output_path,
+            )
 
-    def test_analyze_database_timeout(self, tmp_path: Path) -> None:
+    def test_analyze_database_timeout(self, mock_subprocess_run: MagicMock, db_path: Path, output_path: Path) -> None:
         """タイムアウトした場合にTimeoutExpiredが発生することを確認"""
         cli = CodeQLCLI()
-        db_path = tmp_path / "test-db"
-        db_path.mkdir()
-        output_path = tmp_path / "results.sarif"
+        mock_subprocess_run.side_effect = subprocess.TimeoutExpired(
+            cmd=["codeql", "database", "analyze"],
+            timeout=10,
+        )
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.TimeoutExpired(
-                cmd=["codeql", "database", "analyze"],
+        with pytest.raises(subprocess.TimeoutExpired):
+            cli.analyze_database(
+                database_path=db_path,
+                output_path=output_path,
                 timeout=10,
             )
 
-            with pytest.raises(subprocess.TimeoutExpired):
-                cli.analyze_database(
-                    database_path=db_path,
-                    output_path=output_path,
-                    timeout=10,
-                )
-
-    def test_analyze_database_without_snippets(self, tmp_path: Path) -> None:
+    def test_analyze_database_without_snippets(
+        self, mock_subprocess_run: MagicMock, db_path: Path, output_path: Path
+    ) -> None:
         """sarif_add_snippets=Falseの場合、スニペットオプションが含まれないことを確認"""
         cli = CodeQLCLI()
-        db_path = tmp_path / "test-db"
-        db_path.mkdir()
-        output_path = tmp_path / "results.sarif"
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(stdout="", stderr="", returncode=0)
 
-            cli.analyze_database(
-                database_path=db_path,
-                output_path=output_path,
-                sarif_add_snippets=False,
-            )
+        cli.analyze_database(
+            database_path=db_path,
+            output_path=output_path,
+            sarif_add_snippets=False,
+        )
 
-            args = mock_run.call_args[0][0]
-            assert "--sarif-add-snippets" not in args
+        args = mock_subprocess_run.call_args[0][0]
+        assert "--sarif-add-snippets" not in args
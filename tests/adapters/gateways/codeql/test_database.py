@@ -6,7 +6,7 @@ from unittest.mock import patch
 import pytest
 
 from mb_scanner.adapters.gateways.codeql.command import CodeQLCLI
-from mb_scanner.adapters.gateways.codeql.database import CodeQLDatabaseManager
+from mb_scanner.adapters.gateways.codeql.database import CodeQLDatabaseManager, resolve_n_jobs
 
 
 class TestCodeQLDatabaseManager:
@@ -197,3 +197,28 @@ class TestCodeQLDatabaseManager:
 
             call_kwargs = mock_analyze.call_args[1]
             assert call_kwargs["query_files"] == [query_file]
+
+
+class TestResolveNJobs:
+    """resolve_n_jobs のテスト"""
+
+    @pytest.mark.parametrize(
+        ("n_jobs", "threads_per_job", "expected"),
+        [
+            (-1, None, 8),
+            (4, None, 4),
+            (0, None, 1),
+            (-1, 4, 2),
+            (8, 4, 2),
+            (1, 4, 1),
+            (-1, 16, 1),
+            (-1, 1, 8),
+            (-1, 0, 1),
+            (4, 0, 1),
+            (-1, -4, 2),
+            (-1, -7, 8),
+        ],
+    )
+    def test_clamps_to_cpu_budget(self, n_jobs: int, threads_per_job: int | None, expected: int) -> None:
+        with patch("mb_scanner.adapters.gateways.codeql.database.os.cpu_count", return_value=8):
+            assert resolve_n_jobs(n_jobs, threads_per_job) == expected
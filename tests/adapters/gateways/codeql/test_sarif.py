@@ -1,12 +1,20 @@
 """SARIF解析とコード抽出機能のテスト"""
 
+from datetime import datetime
 import json
 from pathlib import Path
 import shutil
+from unittest.mock import patch
 
 import pytest
 
-from mb_scanner.adapters.gateways.codeql.sarif import SarifExtractor, extract_code_for_project
+from mb_scanner.adapters.gateways.codeql.sarif import (
+    SarifExtractor,
+    _decode_uri,
+    _read_file_lines,
+    extract_code_for_project,
+    extract_code_for_projects,
+)
 from mb_scanner.domain.entities import SarifFinding
 
 # フィクスチャのパス
@@ -58,6 +66,27 @@ class TestSarifFinding:
         assert result.end_column is None
 
 
+class TestDecodeUri:
+    """_decode_uri のテスト"""
+
+    @pytest.mark.parametrize(
+        ("uri", "expected"),
+        [
+            ("src/example.js", "src/example.js"),
+            ("src/my%20file.js", "src/my file.js"),
+            ("dir%E5%93%94/test.js", "dir哔/test.js"),
+            ("src/100%.js", "src/100%.js"),
+        ],
+    )
+    def test_decode_uri(self, uri: str, expected: str) -> None:
+        assert _decode_uri(uri) == expected
+
+    def test_decode_uri_returns_same_object_without_percent(self) -> None:
+        """パーセント記号を含まないURIはデコードせずそのまま返すことを確認"""
+        uri = "src/example.js"
+        assert _decode_uri(uri) is uri
+
+
 class TestSarifExtractor:
     """SarifExtractor クラスのテスト"""
 
@@ -118,6 +147,14 @@ class TestSarifExtractor:
         assert result3.message == "Detection without endLine (single line)."
         assert result3.severity == "warning"
 
+    def test_parse_sarif_findings_match_validated_models(self):
+        """検証を省略して構築した結果が、通常の検証済みモデルと一致することを確認"""
+        extractor = SarifExtractor(sarif_path=SAMPLE_SARIF, repository_path=SAMPLE_REPO)
+
+        for finding in extractor.parse_sarif():
+            assert SarifFinding.model_validate(finding.model_dump()) == finding
+            assert finding.model_fields_set == set(SarifFinding.model_fields)
+
     def test_parse_sarif_empty_results(self):
         """検出結果が0件のSARIFファイルの処理をテスト"""
         extractor = SarifExtractor(sarif_path=EMPTY_SARIF, repository_path=SAMPLE_REPO)
@@ -205,6 +242,46 @@ class TestSarifExtractor:
         ]
         assert snippet == "\n".join(expected_lines)
 
+    def test_extract_code_snippet_reads_same_file_once(self):
+        """同じファイルへの複数の検出結果ではファイルを1回だけ読み込むことを確認"""
+        extractor = SarifExtractor(sarif_path=SAMPLE_SARIF, repository_path=SAMPLE_REPO)
+        _read_file_lines.cache_clear()
+
+        for start_line in (1, 2, 3):
+            result = SarifFinding(
+                id=0,
+                file_path="src/example.js",
+                start_line=start_line,
+                end_line=start_line,
+                message="Test",
+                severity="warning",
+            )
+            extractor.extract_code_snippet(result)
+
+        cache_info = _read_file_lines.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 2
+
+    def test_extract_code_snippet_reflects_file_update(self, tmp_path):
+        """ファイルが更新された場合は新しい内容からスニペットを抽出することを確認"""
+        source = tmp_path / "src.js"
+        source.write_text("const a = 1;\n")
+        extractor = SarifExtractor(sarif_path=SAMPLE_SARIF, repository_path=tmp_path)
+        result = SarifFinding(
+            id=0,
+            file_path="src.js",
+            start_line=1,
+            end_line=1,
+            message="Test",
+            severity="warning",
+        )
+
+        assert extractor.extract_code_snippet(result) == "const a = 1;"
+
+        source.write_text("const bb = 2;\n")
+
+        assert extractor.extract_code_snippet(result) == "const bb = 2;"
+
     def test_extract_code_snippet_file_not_found(self):
         """存在しないファイルの処理をテスト"""
         extractor = SarifExtractor(sarif_path=SAMPLE_SARIF, repository_path=SAMPLE_REPO)
@@ -285,6 +362,36 @@ class TestSarifExtractor:
         # URLデコードされたパスが取得されることを確認
         assert results[0].file_path == "backup/067-bilibili哔哩哔哩/test.js"
 
+    def test_parse_sarif_shares_file_path_strings(self, tmp_path):
+        """同じファイルを指す検出結果でパス文字列が共有されることをテスト"""
+        location = {
+            "physicalLocation": {
+                "artifactLocation": {"uri": "src/%E3%83%86%E3%82%B9%E3%83%88.js"},
+                "region": {"startLine": 1, "endLine": 1},
+            }
+        }
+        sarif_data = {
+            "version": "2.1.0",
+            "runs": [
+                {
+                    "tool": {"driver": {"name": "CodeQL"}},
+                    "results": [
+                        {"ruleId": "test/rule", "message": {"text": "a"}, "locations": [location]},
+                        {"ruleId": "test/rule", "message": {"text": "b"}, "locations": [location]},
+                    ],
+                }
+            ],
+        }
+        sarif_path = tmp_path / "test.sarif"
+        sarif_path.write_text(json.dumps(sarif_data))
+
+        results = SarifExtractor(sarif_path=sarif_path, repository_path=tmp_path).parse_sarif()
+
+        assert len(results) == 2
+        assert results[0].file_path == "src/テスト.js"
+        assert results[0].file_path is results[1].file_path
+        assert results[0].severity == "warning"
+
     def test_extract_code_snippet_build_artifact_skipped(self):
         """ビルド成果物がスキップされることをテスト"""
         extractor = SarifExtractor(sarif_path=SAMPLE_SARIF, repository_path=SAMPLE_REPO)
@@ -313,6 +420,21 @@ class TestSarifExtractor:
             snippet = extractor.extract_code_snippet(result)
             assert snippet == "[Build artifact - skipped]", f"Failed for path: {path}"
 
+    @pytest.mark.parametrize("path", ["builder/main.js", "src/build/main.js", "distribution.js", "public/index.js"])
+    def test_extract_code_snippet_non_build_artifact_not_skipped(self, path):
+        """ビルド成果物ディレクトリと前方一致しないだけのパスはスキップされないことを確認"""
+        extractor = SarifExtractor(sarif_path=SAMPLE_SARIF, repository_path=SAMPLE_REPO)
+        result = SarifFinding(
+            id=0,
+            file_path=path,
+            start_line=1,
+            end_line=1,
+            message="Test",
+            severity="warning",
+        )
+
+        assert extractor.extract_code_snippet(result) == "[File not found]"
+
     def test_extract_all_integration(self):
         """統合テスト：実際のSARIFファイルとリポジトリを使用"""
         extractor = SarifExtractor(sarif_path=SAMPLE_SARIF, repository_path=SAMPLE_REPO)
@@ -368,6 +490,21 @@ class TestSarifExtractor:
         # タイムスタンプの検証（datetimeオブジェクト）
         assert metadata.extraction_date is not None
 
+    @pytest.mark.parametrize("sarif_path", [SAMPLE_SARIF, EMPTY_SARIF])
+    def test_extract_all_to_file_matches_extract_all(self, tmp_path, sarif_path):
+        """逐次書き出しの出力が extract_all() の model_dump_json(indent=2) と一致することを確認"""
+        fixed_now = datetime(2026, 1, 1, 12, 0, 0)
+        output_path = tmp_path / "nested" / "output.json"
+        extractor = SarifExtractor(sarif_path=sarif_path, repository_path=SAMPLE_REPO)
+
+        with patch("mb_scanner.adapters.gateways.codeql.sarif.datetime") as mock_datetime:
+            mock_datetime.now.return_value = fixed_now
+            count = extractor.extract_all_to_file(output_path)
+            expected = extractor.extract_all()
+
+        assert count == expected.metadata.total_results
+        assert output_path.read_text(encoding="utf-8") == expected.model_dump_json(indent=2)
+
 
 class TestExtractCodeForProject:
     """extract_code_for_project 関数のテスト"""
@@ -475,6 +612,71 @@ class TestExtractCodeForProject:
         assert result.error is not None
         assert "Repository not found" in result.error
 
+    def test_extract_code_for_project_repository_is_file(self, tmp_path):
+        """リポジトリのパスがディレクトリでない場合はスキップされることを確認"""
+        query_id = "test_query"
+        project_name = "test-project"
+
+        sarif_dir = tmp_path / "sarif" / query_id
+        sarif_dir.mkdir(parents=True)
+        shutil.copy(SAMPLE_SARIF, sarif_dir / f"{project_name}.sarif")
+
+        repos_dir = tmp_path / "repos"
+        repos_dir.mkdir()
+        (repos_dir / project_name).write_text("not a directory")
+
+        result = extract_code_for_project(
+            query_id=query_id,
+            project_name=project_name,
+            sarif_base_dir=tmp_path / "sarif",
+            repository_base_dir=repos_dir,
+            output_base_dir=tmp_path / "output",
+        )
+
+        assert result.status == "skipped"
+        assert result.error is not None
+        assert "Repository not found" in result.error
+
+    def test_extract_code_for_project_base_dirs_are_files(self, tmp_path):
+        """ベースディレクトリがファイルの場合（NotADirectoryError）もスキップされることを確認"""
+        query_id = "test_query"
+        project_name = "test-project"
+
+        # SARIFのベースディレクトリがファイル
+        sarif_base = tmp_path / "sarif"
+        sarif_base.write_text("not a directory")
+
+        result = extract_code_for_project(
+            query_id=query_id,
+            project_name=project_name,
+            sarif_base_dir=sarif_base,
+            repository_base_dir=tmp_path / "repos",
+            output_base_dir=tmp_path / "output",
+        )
+
+        assert result.status == "skipped"
+        assert result.error is not None
+        assert "SARIF file not found" in result.error
+
+        # リポジトリのベースディレクトリがファイル
+        sarif_dir = tmp_path / "sarif2" / query_id
+        sarif_dir.mkdir(parents=True)
+        shutil.copy(SAMPLE_SARIF, sarif_dir / f"{project_name}.sarif")
+        repos_base = tmp_path / "repos"
+        repos_base.write_text("not a directory")
+
+        result = extract_code_for_project(
+            query_id=query_id,
+            project_name=project_name,
+            sarif_base_dir=tmp_path / "sarif2",
+            repository_base_dir=repos_base,
+            output_base_dir=tmp_path / "output",
+        )
+
+        assert result.status == "skipped"
+        assert result.error is not None
+        assert "Repository not found" in result.error
+
     def test_extract_code_for_project_creates_output_directory(self, tmp_path):
         """出力ディレクトリが自動的に作成されることを確認"""
         query_id = "test_query"
@@ -510,3 +712,37 @@ class TestExtractCodeForProject:
         output_file = Path(result.output_path)
         assert output_file.parent.exists()
         assert output_file.exists()
+
+    def test_extract_code_for_projects_preserves_order(self, tmp_path):
+        """複数プロジェクトの結果が入力順で返されることを確認"""
+        query_id = "test_query"
+        sarif_dir = tmp_path / "sarif" / query_id
+        sarif_dir.mkdir(parents=True)
+        shutil.copy(SAMPLE_SARIF, sarif_dir / "test-project.sarif")
+
+        repo_dir = tmp_path / "repos" / "test-project"
+        shutil.copytree(SAMPLE_REPO, repo_dir)
+
+        results = extract_code_for_projects(
+            query_id=query_id,
+            project_names=["test-project", "missing-project"],
+            sarif_base_dir=tmp_path / "sarif",
+            repository_base_dir=tmp_path / "repos",
+            output_base_dir=tmp_path / "output",
+            n_jobs=1,
+        )
+
+        assert [r.project for r in results] == ["test-project", "missing-project"]
+        assert [r.status for r in results] == ["success", "skipped"]
+
+    def test_extract_code_for_projects_empty(self, tmp_path):
+        """プロジェクトが空の場合は空リストを返すことを確認"""
+        results = extract_code_for_projects(
+            query_id="test_query",
+            project_names=[],
+            sarif_base_dir=tmp_path / "sarif",
+            repository_base_dir=tmp_path / "repos",
+            output_base_dir=tmp_path / "output",
+        )
+
+        assert results == []
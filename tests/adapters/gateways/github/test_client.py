@@ -3,6 +3,7 @@
 from datetime import UTC, datetime
 from unittest.mock import Mock, patch
 
+from github import GithubException
 import pytest
 
 from mb_scanner.adapters.gateways.github.client import GitHubClient
@@ -38,7 +39,7 @@ def test_github_client_search_repositories():
     mock_repo1.pushed_at = datetime(2024, 1, 1, tzinfo=UTC)
     mock_repo1.language = "JavaScript"
     mock_repo1.description = "A declarative JavaScript library"
-    mock_repo1.get_topics.return_value = ["react", "javascript"]
+    mock_repo1.topics = ["react", "javascript"]
 
     mock_repo2 = Mock()
     mock_repo2.full_name = "vuejs/vue"
@@ -47,31 +48,29 @@ def test_github_client_search_repositories():
     mock_repo2.pushed_at = datetime(2024, 2, 1, tzinfo=UTC)
     mock_repo2.language = "JavaScript"
     mock_repo2.description = "Progressive JavaScript framework"
-    mock_repo2.get_topics.return_value = ["vue", "javascript"]
+    mock_repo2.topics = ["vue", "javascript"]
 
     # GitHubClientをモック
-    with (
-        patch("mb_scanner.adapters.gateways.github.client.Github") as mock_github_class,
-        patch("mb_scanner.adapters.gateways.github.client.cast") as mock_cast,
-    ):
+    with patch("mb_scanner.adapters.gateways.github.client.Github") as mock_github_class:
         mock_github_instance = Mock()
         mock_github_class.return_value = mock_github_instance
         mock_github_instance.search_repositories.return_value = [mock_repo1, mock_repo2]
 
-        # castはそのまま渡すように設定
-        mock_cast.side_effect = lambda _, x: x
-
         client = GitHubClient(token="test_token")
         criteria = SearchCriteria(language="JavaScript", min_stars=100, max_days_since_commit=365)
 
         # Act
-        results = client.search_repositories(criteria, max_results=10)
+        results = list(client.search_repositories(criteria, max_results=10))
 
     # Assert
     assert len(results) == 2
     assert results[0].full_name == "facebook/react"
     assert results[1].full_name == "vuejs/vue"
+    assert results[0].topics == ["react", "javascript"]
     mock_github_instance.search_repositories.assert_called_once()
+    # topics は検索結果から取得し、リポジトリごとの追加API呼び出しは行わない
+    mock_repo1.get_topics.assert_not_called()
+    mock_repo2.get_topics.assert_not_called()
 
 
 def test_github_client_search_repositories_with_max_results():
@@ -86,25 +85,19 @@ def test_github_client_search_repositories_with_max_results():
         mock_repo.pushed_at = datetime(2024, 1, 1, tzinfo=UTC)
         mock_repo.language = "JavaScript"
         mock_repo.description = "Test repo"
-        mock_repo.get_topics.return_value = []
+        mock_repo.topics = []
         mock_repos.append(mock_repo)
 
-    with (
-        patch("mb_scanner.adapters.gateways.github.client.Github") as mock_github_class,
-        patch("mb_scanner.adapters.gateways.github.client.cast") as mock_cast,
-    ):
+    with patch("mb_scanner.adapters.gateways.github.client.Github") as mock_github_class:
         mock_github_instance = Mock()
         mock_github_class.return_value = mock_github_instance
         mock_github_instance.search_repositories.return_value = mock_repos
 
-        # castはそのまま渡すように設定
-        mock_cast.side_effect = lambda _, x: x
-
         client = GitHubClient(token="test_token")
         criteria = SearchCriteria(language="JavaScript", min_stars=100, max_days_since_commit=365)
 
         # Act
-        results = client.search_repositories(criteria, max_results=50)
+        results = list(client.search_repositories(criteria, max_results=50))
 
     # Assert
     assert len(results) == 50  # max_resultsで制限される
@@ -129,6 +122,39 @@ def test_github_client_search_repositories_github_exception():
             client.search_repositories(criteria)
 
 
+def test_github_client_search_repositories_is_lazy():
+    """検索結果が反復に合わせて取得され、反復中のAPIエラーが呼び出し側に伝わることを確認する"""
+
+    # Arrange: 1件返した後にAPIエラーになるページ付きリストを模擬する
+    def paginated():
+        mock_repo = Mock()
+        mock_repo.full_name = "user/repo"
+        mock_repo.html_url = "https://github.com/user/repo"
+        mock_repo.stargazers_count = 100
+        mock_repo.pushed_at = None
+        mock_repo.language = "JavaScript"
+        mock_repo.description = None
+        mock_repo.topics = []
+        yield mock_repo
+        raise GithubException(403, {"message": "rate limited"}, None)
+
+    with patch("mb_scanner.adapters.gateways.github.client.Github") as mock_github_class:
+        mock_github_instance = Mock()
+        mock_github_class.return_value = mock_github_instance
+        mock_github_instance.search_repositories.return_value = paginated()
+
+        client = GitHubClient(token="test_token")
+        criteria = SearchCriteria(language="JavaScript", min_stars=100, max_days_since_commit=365)
+
+        # Act
+        results = client.search_repositories(criteria)
+
+        # Assert: 最初の1件は取得でき、次のページ取得でエラーになる
+        assert next(results).full_name == "user/repo"
+        with pytest.raises(GithubException):
+            next(results)
+
+
 def test_github_client_get_rate_limit_info():
     """GitHubClientがレート制限情報を正しく取得できることを確認する"""
     # Arrange
@@ -188,20 +214,16 @@ def test_github_client_search_repositories_with_default_criteria():
     mock_repo.pushed_at = datetime(2024, 1, 1, tzinfo=UTC)
     mock_repo.language = "Python"
     mock_repo.description = "Test repo"
-    mock_repo.get_topics.return_value = ["python"]
+    mock_repo.topics = ["python"]
 
     with (
         patch("mb_scanner.adapters.gateways.github.client.Github") as mock_github_class,
-        patch("mb_scanner.adapters.gateways.github.client.cast") as mock_cast,
         patch("mb_scanner.adapters.gateways.github.client.build_default_search_criteria") as mock_build_default,
     ):
         mock_github_instance = Mock()
         mock_github_class.return_value = mock_github_instance
         mock_github_instance.search_repositories.return_value = [mock_repo]
 
-        # castはそのまま渡すように設定
-        mock_cast.side_effect = lambda _, x: x
-
         # デフォルト検索条件を設定
         default_criteria = SearchCriteria(
             language="Python",
@@ -213,7 +235,7 @@ def test_github_client_search_repositories_with_default_criteria():
         client = GitHubClient(token="test_token")
 
         # Act: criteriaを指定せずに呼び出す
-        results = client.search_repositories(max_results=10)
+        results = list(client.search_repositories(max_results=10))
 
     # Assert
     assert len(results) == 1
@@ -223,3 +245,24 @@ def test_github_client_search_repositories_with_default_criteria():
     # デフォルト条件のクエリが使われたことを確認
     expected_query = default_criteria.to_query_string()
     mock_github_instance.search_repositories.assert_called_once_with(query=expected_query)
+
+
+def test_github_client_context_manager_closes():
+    """コンテキストマネージャの終了時にGitHubClientがクローズされることを確認する"""
+    with patch("mb_scanner.adapters.gateways.github.client.Github") as mock_github_class:
+        mock_github_instance = Mock()
+        mock_github_class.return_value = mock_github_instance
+
+        with GitHubClient(token="test_token") as client:
+            assert client.github is mock_github_instance
+            mock_github_instance.close.assert_not_called()
+
+    mock_github_instance.close.assert_called_once()
+
+
+def test_github_client_uses_max_search_page_size():
+    """検索のページ取得回数を減らすため、1ページ100件で初期化されることを確認する"""
+    with patch("mb_scanner.adapters.gateways.github.client.Github") as mock_github_class:
+        GitHubClient(token="test_token")
+
+    assert mock_github_class.call_args.kwargs["per_page"] == 100
@@ -66,7 +66,7 @@ def test_github_repository_from_pygithub():
     mock_repo.pushed_at = datetime(2024, 1, 1, tzinfo=UTC)
     mock_repo.language = "JavaScript"
     mock_repo.description = "A declarative, efficient, and flexible JavaScript library"
-    mock_repo.get_topics.return_value = ["react", "javascript", "ui"]
+    mock_repo.topics = ["react", "javascript", "ui"]
 
     # Act
     repo = GitHubRepository.from_pygithub(mock_repo)
@@ -79,7 +79,7 @@ def test_github_repository_from_pygithub():
     assert repo.language == "JavaScript"
     assert repo.description == "A declarative, efficient, and flexible JavaScript library"
     assert repo.topics == ["react", "javascript", "ui"]
-    mock_repo.get_topics.assert_called_once()
+    mock_repo.get_topics.assert_not_called()
 
 
 def test_github_repository_stargazers_count_validation():
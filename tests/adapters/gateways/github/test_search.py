@@ -128,3 +128,26 @@ def test_build_default_search_criteria_query_string():
     assert "language:javascript" in query
     assert "stars:>=100" in query
     assert "pushed:>" in query
+
+
+def test_search_criteria_query_string_cutoff_is_not_cached():
+    """日付に依存しない部分はキャッシュしつつ、pushed の基準日は呼び出しごとに再計算されることを確認する"""
+    criteria = SearchCriteria(language="JavaScript", min_stars=100, max_days_since_commit=365)
+
+    with patch("mb_scanner.domain.ports.github_gateway.datetime") as mock_datetime:
+        mock_datetime.now.return_value = datetime(2025, 1, 1, tzinfo=UTC)
+        first = criteria.to_query_string()
+        mock_datetime.now.return_value = datetime(2025, 1, 2, tzinfo=UTC)
+        second = criteria.to_query_string()
+
+    assert first == "language:javascript stars:>=100 pushed:>2024-01-02"
+    assert second == "language:javascript stars:>=100 pushed:>2024-01-03"
+    assert criteria.model_dump() == {"language": "JavaScript", "min_stars": 100, "max_days_since_commit": 365}
+
+
+def test_search_criteria_is_frozen():
+    """キャッシュの整合性のため、検索条件が変更不可であることを確認する"""
+    criteria = SearchCriteria(language="JavaScript", min_stars=100, max_days_since_commit=365)
+
+    with pytest.raises(ValueError):  # Pydantic ValidationError
+        criteria.min_stars = 200
@@ -3,9 +3,9 @@
 import json
 from pathlib import Path
 
-import matplotlib.pyplot as plt
 import pytest
 
+from mb_scanner.adapters.gateways.visualization import boxplot as boxplot_module
 from mb_scanner.adapters.gateways.visualization.boxplot import (
     create_boxplot_summary,
     load_summary_data,
@@ -28,8 +28,7 @@ class TestLoadSummaryData:
             },
         }
         json_file = tmp_path / "test.json"
-        with json_file.open("w") as f:
-            json.dump(test_data, f)
+        json_file.write_text(json.dumps(test_data))
 
         # データを読み込み
         result = load_summary_data(json_file)
@@ -47,8 +46,7 @@ class TestLoadSummaryData:
             "results": {},
         }
         json_file = tmp_path / "empty.json"
-        with json_file.open("w") as f:
-            json.dump(test_data, f)
+        json_file.write_text(json.dumps(test_data))
 
         result = load_summary_data(json_file)
 
@@ -64,39 +62,79 @@ class TestLoadSummaryData:
             load_summary_data(non_existent_file)
 
 
-class TestCreateBoxplotSummary:
-    """create_boxplot_summary関数のテスト"""
+def _write_png_sentinel(_fig: object, output_path: Path) -> None:
+    """描画を行わず、PNGシグネチャのみを書き込む（出力先の扱いだけを確認するテスト用）"""
+    output_path.write_bytes(b"\x89PNG\r\n\x1a\n")
 
-    def test_create_boxplot_summary_success(self, tmp_path: Path) -> None:
-        """正常な箱ひげ図生成テスト"""
-        # テスト用のディレクトリとJSONファイルを作成
-        input_dir = tmp_path / "summary"
-        input_dir.mkdir()
 
-        test_files = [
-            (
-                "id_10_limit_1.json",
-                {"query_id": "id_10", "total_projects": 3, "results": {"p1": 10, "p2": 20, "p3": 5}},
-            ),
-            ("id_11_limit_1.json", {"query_id": "id_11", "total_projects": 2, "results": {"p1": 15, "p2": 25}}),
-        ]
+def _write_summary_files(input_dir: Path, files: list[tuple[str, dict[str, object]]]) -> Path:
+    """サマリーJSONファイル群を作成し、そのディレクトリを返す"""
+    input_dir.mkdir(parents=True, exist_ok=True)
+    for filename, data in files:
+        (input_dir / filename).write_text(json.dumps(data))
+    return input_dir
+
+
+# 入力ディレクトリの種類ごとのサマリーJSON（summary_dir フィクスチャのパラメータで選択する）
+SUMMARY_FILES: dict[str, list[tuple[str, dict[str, object]]]] = {
+    "two_queries": [
+        ("id_10_limit_1.json", {"query_id": "id_10", "total_projects": 3, "results": {"p1": 10, "p2": 20, "p3": 5}}),
+        ("id_11_limit_1.json", {"query_id": "id_11", "total_projects": 2, "results": {"p1": 15, "p2": 25}}),
+    ],
+    "three_queries": [
+        ("id_10_limit_1.json", {"query_id": "id_10", "total_projects": 2, "results": {"p1": 10, "p2": 20}}),
+        ("id_18_limit_1.json", {"query_id": "id_18", "total_projects": 2, "results": {"p1": 30, "p2": 40}}),
+        ("id_222_limit_1.json", {"query_id": "id_222", "total_projects": 2, "results": {"p1": 50, "p2": 60}}),
+    ],
+    "single": [
+        ("single.json", {"query_id": "id_10", "total_projects": 3, "results": {"p1": 10, "p2": 20, "p3": 5}}),
+    ],
+    "single_wide_range": [
+        ("test.json", {"query_id": "id_10", "total_projects": 3, "results": {"p1": 10, "p2": 100, "p3": 1000}}),
+    ],
+}
+
+
+@pytest.fixture(scope="module")
+def summary_dir(request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """パラメータで指定した種類のサマリーJSONを格納したディレクトリ（種類ごとに1回だけ作成）"""
+    files_key: str = request.param
+    return _write_summary_files(tmp_path_factory.mktemp(files_key), SUMMARY_FILES[files_key])
+
 
-        for filename, data in test_files:
-            with (input_dir / filename).open("w") as f:
-                json.dump(data, f)
+class TestCreateBoxplotSummary:
+    """create_boxplot_summary関数のテスト"""
 
+    @pytest.mark.parametrize(
+        ("summary_dir", "log_scale", "query_order"),
+        [
+            pytest.param("two_queries", False, None, id="multiple_files"),
+            pytest.param("single", False, None, id="single_file"),
+            pytest.param("single_wide_range", True, None, id="log_scale"),
+            pytest.param("single", False, None, id="linear_scale"),
+            # 順序を指定: id_222 -> id_10 -> id_18
+            pytest.param("three_queries", False, ["id_222", "id_10", "id_18"], id="query_order"),
+            # 2つだけ指定（id_18は含まれない）
+            pytest.param("three_queries", False, ["id_10", "id_222"], id="partial_query_order"),
+        ],
+        indirect=["summary_dir"],
+    )
+    def test_create_boxplot_summary(
+        self,
+        tmp_path: Path,
+        summary_dir: Path,
+        log_scale: bool,
+        query_order: list[str] | None,
+    ) -> None:
+        """入力ファイル数・スケール・クエリ順序の組み合わせで箱ひげ図を生成できること"""
         output_path = tmp_path / "boxplot.png"
 
-        # 箱ひげ図を生成
-        create_boxplot_summary(input_dir, output_path)
+        create_boxplot_summary(summary_dir, output_path, log_scale=log_scale, query_order=query_order)
 
         # ファイルが作成されたことを確認
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
-        # matplotlibのクリーンアップ
-        plt.close("all")
-
     def test_create_boxplot_summary_empty_directory(self, tmp_path: Path) -> None:
         """空のディレクトリに対してエラーが発生すること"""
         input_dir = tmp_path / "empty_summary"
@@ -106,129 +144,18 @@ class TestCreateBoxplotSummary:
         with pytest.raises(ValueError, match="No JSON files found"):
             create_boxplot_summary(input_dir, output_path)
 
-        plt.close("all")
-
-    def test_create_boxplot_summary_output_directory_creation(self, tmp_path: Path) -> None:
-        """出力ディレクトリの自動作成テスト"""
-        input_dir = tmp_path / "summary"
-        input_dir.mkdir()
-
-        test_data = {"query_id": "id_10", "total_projects": 2, "results": {"p1": 10, "p2": 20}}
-        with (input_dir / "test.json").open("w") as f:
-            json.dump(test_data, f)
+    @pytest.mark.parametrize("summary_dir", ["single"], indirect=True)
+    def test_create_boxplot_summary_output_directory_creation(
+        self, tmp_path: Path, summary_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """出力ディレクトリの自動作成テスト（PNGの描画は省略する）"""
+        monkeypatch.setattr(boxplot_module, "save_figure", _write_png_sentinel)
 
         # ネストされた出力パス
         nested_output_path = tmp_path / "nested" / "dir" / "boxplot.png"
 
-        create_boxplot_summary(input_dir, nested_output_path)
+        create_boxplot_summary(summary_dir, nested_output_path)
 
         # ディレクトリが自動作成され、ファイルが存在することを確認
         assert nested_output_path.exists()
         assert nested_output_path.stat().st_size > 0
-
-        plt.close("all")
-
-    def test_create_boxplot_summary_single_file(self, tmp_path: Path) -> None:
-        """単一のJSONファイルでの処理テスト"""
-        input_dir = tmp_path / "summary"
-        input_dir.mkdir()
-
-        test_data = {"query_id": "id_10", "total_projects": 3, "results": {"p1": 10, "p2": 20, "p3": 5}}
-        with (input_dir / "single.json").open("w") as f:
-            json.dump(test_data, f)
-
-        output_path = tmp_path / "boxplot_single.png"
-
-        create_boxplot_summary(input_dir, output_path)
-
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-
-        plt.close("all")
-
-    def test_create_boxplot_summary_with_log_scale(self, tmp_path: Path) -> None:
-        """対数スケールでの箱ひげ図生成テスト"""
-        input_dir = tmp_path / "summary"
-        input_dir.mkdir()
-
-        test_data = {"query_id": "id_10", "total_projects": 3, "results": {"p1": 10, "p2": 100, "p3": 1000}}
-        with (input_dir / "test.json").open("w") as f:
-            json.dump(test_data, f)
-
-        output_path = tmp_path / "boxplot_log.png"
-
-        create_boxplot_summary(input_dir, output_path, log_scale=True)
-
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-
-        plt.close("all")
-
-    def test_create_boxplot_summary_without_log_scale(self, tmp_path: Path) -> None:
-        """線形スケールでの箱ひげ図生成テスト（デフォルト）"""
-        input_dir = tmp_path / "summary"
-        input_dir.mkdir()
-
-        test_data = {"query_id": "id_10", "total_projects": 2, "results": {"p1": 10, "p2": 20}}
-        with (input_dir / "test.json").open("w") as f:
-            json.dump(test_data, f)
-
-        output_path = tmp_path / "boxplot_linear.png"
-
-        create_boxplot_summary(input_dir, output_path, log_scale=False)
-
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-
-        plt.close("all")
-
-    def test_create_boxplot_summary_with_query_order(self, tmp_path: Path) -> None:
-        """クエリIDの順序指定テスト"""
-        input_dir = tmp_path / "summary"
-        input_dir.mkdir()
-
-        # 3つのクエリファイルを作成
-        test_files = [
-            ("id_10_limit_1.json", {"query_id": "id_10", "total_projects": 2, "results": {"p1": 10, "p2": 20}}),
-            ("id_18_limit_1.json", {"query_id": "id_18", "total_projects": 2, "results": {"p1": 30, "p2": 40}}),
-            ("id_222_limit_1.json", {"query_id": "id_222", "total_projects": 2, "results": {"p1": 50, "p2": 60}}),
-        ]
-
-        for filename, data in test_files:
-            with (input_dir / filename).open("w") as f:
-                json.dump(data, f)
-
-        output_path = tmp_path / "boxplot_ordered.png"
-
-        # 順序を指定: id_222 -> id_10 -> id_18
-        create_boxplot_summary(input_dir, output_path, query_order=["id_222", "id_10", "id_18"])
-
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-
-        plt.close("all")
-
-    def test_create_boxplot_summary_with_partial_query_order(self, tmp_path: Path) -> None:
-        """一部のクエリIDのみ指定した場合のテスト"""
-        input_dir = tmp_path / "summary"
-        input_dir.mkdir()
-
-        test_files = [
-            ("id_10_limit_1.json", {"query_id": "id_10", "total_projects": 2, "results": {"p1": 10, "p2": 20}}),
-            ("id_18_limit_1.json", {"query_id": "id_18", "total_projects": 2, "results": {"p1": 30, "p2": 40}}),
-            ("id_222_limit_1.json", {"query_id": "id_222", "total_projects": 2, "results": {"p1": 50, "p2": 60}}),
-        ]
-
-        for filename, data in test_files:
-            with (input_dir / filename).open("w") as f:
-                json.dump(data, f)
-
-        output_path = tmp_path / "boxplot_partial.png"
-
-        # 2つだけ指定（id_18は含まれない）
-        create_boxplot_summary(input_dir, output_path, query_order=["id_10", "id_222"])
-
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-
-        plt.close("all")
@@ -2,10 +2,19 @@
 
 from pathlib import Path
 
-import matplotlib.pyplot as plt
+import numpy as np
 import pytest
 
-from mb_scanner.adapters.gateways.visualization.scatter_plot import create_hexbin_plot
+from mb_scanner.adapters.gateways.visualization import scatter_plot as scatter_plot_module
+from mb_scanner.adapters.gateways.visualization.scatter_plot import (
+    create_hexbin_plot,
+    create_hexbin_plot_from_arrays,
+)
+
+
+def _write_png_sentinel(_fig: object, output_path: Path) -> None:
+    """描画を行わず、PNGシグネチャのみを書き込む（出力先の扱いだけを確認するテスト用）"""
+    output_path.write_bytes(b"\x89PNG\r\n\x1a\n")
 
 
 class TestCreateHexbinPlot:
@@ -28,8 +37,6 @@ class TestCreateHexbinPlot:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
-        plt.close("all")
-
     def test_create_hexbin_plot_with_gridsize(self, tmp_path: Path) -> None:
         """gridsizeのカスタマイズテスト"""
         data = [
@@ -44,8 +51,6 @@ class TestCreateHexbinPlot:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
-        plt.close("all")
-
     def test_create_hexbin_plot_with_cmap(self, tmp_path: Path) -> None:
         """カラーマップのカスタマイズテスト"""
         data = [
@@ -60,8 +65,6 @@ class TestCreateHexbinPlot:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
-        plt.close("all")
-
     def test_create_hexbin_plot_with_log_scale_x(self, tmp_path: Path) -> None:
         """X軸対数軸でのhexbinプロット生成テスト"""
         data = [
@@ -76,8 +79,6 @@ class TestCreateHexbinPlot:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
-        plt.close("all")
-
     def test_create_hexbin_plot_with_log_scale_y(self, tmp_path: Path) -> None:
         """Y軸対数軸でのhexbinプロット生成テスト"""
         data = [
@@ -92,8 +93,6 @@ class TestCreateHexbinPlot:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
-        plt.close("all")
-
     def test_create_hexbin_plot_with_log_scale_both(self, tmp_path: Path) -> None:
         """両軸対数軸でのhexbinプロット生成テスト"""
         data = [
@@ -108,8 +107,6 @@ class TestCreateHexbinPlot:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
-        plt.close("all")
-
     def test_create_hexbin_plot_empty_data(self, tmp_path: Path) -> None:
         """空データのエラーハンドリングテスト"""
         data: list[tuple[int, int, str]] = []
@@ -118,8 +115,6 @@ class TestCreateHexbinPlot:
         with pytest.raises(ValueError, match="データが空です"):
             create_hexbin_plot(data, output_path)
 
-        plt.close("all")
-
     def test_create_hexbin_plot_single_point(self, tmp_path: Path) -> None:
         """単一データポイントの処理テスト"""
         data = [(1000, 10, "test/repo1")]
@@ -131,8 +126,6 @@ class TestCreateHexbinPlot:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
-        plt.close("all")
-
     def test_create_hexbin_plot_with_custom_labels(self, tmp_path: Path) -> None:
         """カスタムラベルでのhexbinプロット生成テスト"""
         data = [
@@ -153,10 +146,10 @@ class TestCreateHexbinPlot:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
-        plt.close("all")
+    def test_create_hexbin_plot_creates_output_directory(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """出力ディレクトリが自動作成されるテスト（PNGの描画は省略する）"""
+        monkeypatch.setattr(scatter_plot_module, "save_figure", _write_png_sentinel)
 
-    def test_create_hexbin_plot_creates_output_directory(self, tmp_path: Path) -> None:
-        """出力ディレクトリが自動作成されるテスト"""
         data = [
             (1000, 10, "test/repo1"),
             (2000, 25, "test/repo2"),
@@ -168,8 +161,6 @@ class TestCreateHexbinPlot:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
-        plt.close("all")
-
     def test_create_hexbin_plot_with_correlation(self, tmp_path: Path) -> None:
         """相関係数表示のテスト"""
         data = [
@@ -185,8 +176,6 @@ class TestCreateHexbinPlot:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
-        plt.close("all")
-
     def test_create_hexbin_plot_with_regression(self, tmp_path: Path) -> None:
         """回帰直線表示のテスト"""
         data = [
@@ -202,8 +191,6 @@ class TestCreateHexbinPlot:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
-        plt.close("all")
-
     def test_create_hexbin_plot_with_correlation_and_regression(self, tmp_path: Path) -> None:
         """相関係数と回帰直線の両方を表示するテスト"""
         data = [
@@ -219,8 +206,6 @@ class TestCreateHexbinPlot:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
-        plt.close("all")
-
     def test_create_hexbin_plot_regression_with_log_scale(self, tmp_path: Path) -> None:
         """対数軸での回帰直線表示テスト"""
         data = [
@@ -235,8 +220,6 @@ class TestCreateHexbinPlot:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
-        plt.close("all")
-
     def test_create_hexbin_plot_correlation_with_single_point(self, tmp_path: Path) -> None:
         """単一ポイントでの相関係数（計算されない）のテスト"""
         data = [(1000, 10, "test/repo1")]
@@ -248,8 +231,6 @@ class TestCreateHexbinPlot:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
-        plt.close("all")
-
     def test_create_hexbin_plot_regression_with_single_point(self, tmp_path: Path) -> None:
         """単一ポイントでの回帰直線（計算されない）のテスト"""
         data = [(1000, 10, "test/repo1")]
@@ -261,4 +242,53 @@ class TestCreateHexbinPlot:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
-        plt.close("all")
+
+class TestCreateHexbinPlotFromArrays:
+    """create_hexbin_plot_from_arrays関数のテスト"""
+
+    def test_create_hexbin_plot_from_arrays(self, tmp_path: Path) -> None:
+        """NumPy配列から回帰直線・相関係数付きのhexbinプロットを生成できること"""
+        x_data = np.array([1000, 2000, 1500, 3000, 2500])
+        y_data = np.array([10, 25, 5, 50, 30])
+        output_path = tmp_path / "hexbin_arrays.png"
+
+        create_hexbin_plot_from_arrays(
+            x_data,
+            y_data,
+            output_path,
+            log_scale_x=True,
+            show_correlation=True,
+            show_regression=True,
+        )
+
+        assert output_path.exists()
+        assert output_path.stat().st_size > 0
+
+    def test_create_hexbin_plot_delegates_to_arrays(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """タプルのリストが x・y の配列に分解されて渡されること"""
+        captured: dict[str, np.ndarray] = {}
+
+        def fake_from_arrays(x_data: np.ndarray, y_data: np.ndarray, output_path: Path, **_: object) -> None:
+            captured["x"] = x_data
+            captured["y"] = y_data
+
+        monkeypatch.setattr(scatter_plot_module, "create_hexbin_plot_from_arrays", fake_from_arrays)
+
+        create_hexbin_plot([(1000, 10, "test/repo1"), (2000, 25, "test/repo2")], tmp_path / "hexbin.png")
+
+        np.testing.assert_array_equal(captured["x"], [1000, 2000])
+        np.testing.assert_array_equal(captured["y"], [10, 25])
+
+    @pytest.mark.parametrize(
+        ("x_data", "y_data", "match"),
+        [
+            (np.array([], dtype=np.int64), np.array([], dtype=np.int64), "データが空です"),
+            (np.array([1, 2]), np.array([1]), "長さが一致しません"),
+        ],
+    )
+    def test_create_hexbin_plot_from_arrays_invalid(
+        self, tmp_path: Path, x_data: np.ndarray, y_data: np.ndarray, match: str
+    ) -> None:
+        """空データや長さの異なる配列でValueErrorが発生すること"""
+        with pytest.raises(ValueError, match=match):
+            create_hexbin_plot_from_arrays(x_data, y_data, tmp_path / "hexbin.png")
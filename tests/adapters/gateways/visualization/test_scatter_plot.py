@@ -1,79 +1,100 @@
 """散布図生成ライブラリのテストモジュール"""
 
 from pathlib import Path
+from typing import Any
 
-import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from scipy import stats
 
-from mb_scanner.adapters.gateways.visualization.scatter_plot import create_scatter_plot
+from mb_scanner.adapters.gateways.visualization import scatter_plot as scatter_plot_module
+from mb_scanner.adapters.gateways.visualization.scatter_plot import _regression_line, create_scatter_plot
 
 
-class TestCreateScatterPlot:
-    """create_scatter_plot関数のテスト"""
-
-    def test_create_scatter_plot_success(self, tmp_path: Path) -> None:
-        """正常な散布図生成テスト"""
-        data = [
-            (1000, 10, "test/repo1"),
-            (2000, 25, "test/repo2"),
-            (1500, 5, "test/repo3"),
-            (3000, 50, "test/repo4"),
-        ]
-        output_path = tmp_path / "scatter.png"
-
-        create_scatter_plot(data, output_path)
-
-        # ファイルが作成されたことを確認
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
+def _write_png_sentinel(_fig: object, output_path: Path) -> None:
+    """描画を行わず、PNGシグネチャのみを書き込む（出力先の扱いだけを確認するテスト用）"""
+    output_path.write_bytes(b"\x89PNG\r\n\x1a\n")
 
-        # matplotlibのクリーンアップ
-        plt.close("all")
 
-    def test_create_scatter_plot_empty_data(self, tmp_path: Path) -> None:
-        """空データの処理テスト"""
-        data: list[tuple[int, int, str]] = []
-        output_path = tmp_path / "scatter_empty.png"
+# テストで使うデータセット（点数・値域の違いごと）
+TWO_POINTS = [(1000, 10, "test/repo1"), (2000, 25, "test/repo2")]
+FOUR_POINTS = [(1000, 10, "test/repo1"), (2000, 25, "test/repo2"), (1500, 15, "test/repo3"), (3000, 35, "test/repo4")]
+WIDE_X = [(100, 10, "test/repo1"), (1000, 25, "test/repo2"), (10000, 50, "test/repo3")]
+WIDE_Y = [(1000, 10, "test/repo1"), (2000, 100, "test/repo2"), (3000, 1000, "test/repo3")]
+WIDE_XY = [(100, 10, "test/repo1"), (1000, 100, "test/repo2"), (10000, 1000, "test/repo3")]
+SINGLE_POINT = [(1000, 10, "test/repo1")]
+EMPTY: list[tuple[int, int, str]] = []
 
-        create_scatter_plot(data, output_path)
 
-        # 空データでもファイルが作成されることを確認
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-
-        plt.close("all")
-
-    def test_create_scatter_plot_single_point(self, tmp_path: Path) -> None:
-        """単一データポイントの処理テスト"""
-        data = [(1000, 10, "test/repo1")]
-        output_path = tmp_path / "scatter_single.png"
-
-        create_scatter_plot(data, output_path)
-
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-
-        plt.close("all")
+class TestCreateScatterPlot:
+    """create_scatter_plot関数のテスト"""
 
-    def test_create_scatter_plot_custom_labels(self, tmp_path: Path) -> None:
-        """カスタムラベルの適用テスト"""
-        data = [
-            (1000, 10, "test/repo1"),
-            (2000, 25, "test/repo2"),
-        ]
-        output_path = tmp_path / "scatter_custom.png"
-        custom_title = "Custom Title"
-        custom_xlabel = "Custom X Label"
-        custom_ylabel = "Custom Y Label"
+    @pytest.mark.parametrize(
+        ("data", "kwargs"),
+        [
+            pytest.param(
+                [(1000, 10, "test/repo1"), (2000, 25, "test/repo2"), (1500, 5, "test/repo3"), (3000, 50, "test/repo4")],
+                {},
+                id="success",
+            ),
+            # 空データ・単一データポイントでもファイルが作成されること
+            pytest.param(EMPTY, {}, id="empty_data"),
+            pytest.param(SINGLE_POINT, {}, id="single_point"),
+            pytest.param(
+                TWO_POINTS,
+                {"title": "Custom Title", "xlabel": "Custom X Label", "ylabel": "Custom Y Label"},
+                id="custom_labels",
+            ),
+            # 対数軸
+            pytest.param(WIDE_X, {"log_scale_x": True}, id="log_scale_x"),
+            pytest.param(TWO_POINTS, {"log_scale_x": False}, id="linear_x"),
+            pytest.param(WIDE_Y, {"log_scale_y": True}, id="log_scale_y"),
+            pytest.param(TWO_POINTS, {"log_scale_y": False}, id="linear_y"),
+            pytest.param(WIDE_XY, {"log_scale_x": True, "log_scale_y": True}, id="log_scale_both"),
+            # スピアマン相関係数（点数が足りない場合もエラーにならないこと）
+            pytest.param(FOUR_POINTS, {"show_correlation": True}, id="correlation"),
+            pytest.param(TWO_POINTS, {"show_correlation": False}, id="without_correlation"),
+            pytest.param(SINGLE_POINT, {"show_correlation": True}, id="correlation_single_point"),
+            pytest.param(EMPTY, {"show_correlation": True}, id="correlation_empty_data"),
+            # 回帰直線（点数が足りない場合もエラーにならないこと）
+            pytest.param(FOUR_POINTS, {"show_regression": True}, id="regression"),
+            pytest.param(TWO_POINTS, {"show_regression": False}, id="without_regression"),
+            pytest.param(WIDE_X, {"log_scale_x": True, "show_regression": True}, id="regression_log_x"),
+            pytest.param(WIDE_Y, {"log_scale_y": True, "show_regression": True}, id="regression_log_y"),
+            pytest.param(
+                WIDE_XY, {"log_scale_x": True, "log_scale_y": True, "show_regression": True}, id="regression_log_both"
+            ),
+            pytest.param(SINGLE_POINT, {"show_regression": True}, id="regression_single_point"),
+            # x がすべて同じ値だと傾きが定まらないが、エラーにならず直線を省略すること
+            pytest.param(
+                [(1000, 10, "test/repo1"), (1000, 25, "test/repo2")],
+                {"show_regression": True},
+                id="regression_constant_x",
+            ),
+            pytest.param(EMPTY, {"show_regression": True}, id="regression_empty_data"),
+            pytest.param(
+                FOUR_POINTS, {"show_correlation": True, "show_regression": True}, id="correlation_and_regression"
+            ),
+        ],
+    )
+    def test_create_scatter_plot(
+        self, tmp_path: Path, data: list[tuple[int, int, str]], kwargs: dict[str, Any]
+    ) -> None:
+        """データセットとオプションの組み合わせで散布図を生成できること"""
+        output_path = tmp_path / "scatter.png"
 
-        create_scatter_plot(data, output_path, title=custom_title, xlabel=custom_xlabel, ylabel=custom_ylabel)
+        create_scatter_plot(data, output_path, **kwargs)
 
+        # ファイルが作成されたことを確認
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
-        plt.close("all")
+    def test_create_scatter_plot_output_directory_creation(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """出力ディレクトリの自動作成テスト（PNGの描画は省略する）"""
+        monkeypatch.setattr(scatter_plot_module, "save_figure", _write_png_sentinel)
 
-    def test_create_scatter_plot_output_directory_creation(self, tmp_path: Path) -> None:
-        """出力ディレクトリの自動作成テスト"""
         nested_output_path = tmp_path / "nested" / "dir" / "scatter.png"
 
         data = [(1000, 10, "test/repo1")]
@@ -84,269 +105,57 @@ class TestCreateScatterPlot:
         assert nested_output_path.exists()
         assert nested_output_path.stat().st_size > 0
 
-        plt.close("all")
-
-    def test_create_scatter_plot_with_log_scale_x(self, tmp_path: Path) -> None:
-        """x軸を対数軸にした散布図生成テスト"""
-        data = [
-            (100, 10, "test/repo1"),
-            (1000, 25, "test/repo2"),
-            (10000, 50, "test/repo3"),
-        ]
-        output_path = tmp_path / "scatter_log_scale.png"
-
-        create_scatter_plot(data, output_path, log_scale_x=True)
-
-        # ファイルが作成されたことを確認
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-
-        plt.close("all")
-
-    def test_create_scatter_plot_without_log_scale_x(self, tmp_path: Path) -> None:
-        """x軸を線形軸（デフォルト）にした散布図生成テスト"""
-        data = [
-            (1000, 10, "test/repo1"),
-            (2000, 25, "test/repo2"),
-        ]
-        output_path = tmp_path / "scatter_linear.png"
-
-        # log_scale_xを明示的にFalseで指定
-        create_scatter_plot(data, output_path, log_scale_x=False)
-
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-
-        plt.close("all")
-
-    def test_create_scatter_plot_with_log_scale_y(self, tmp_path: Path) -> None:
-        """y軸を対数軸にした散布図生成テスト"""
-        data = [
-            (1000, 10, "test/repo1"),
-            (2000, 100, "test/repo2"),
-            (3000, 1000, "test/repo3"),
-        ]
-        output_path = tmp_path / "scatter_log_scale_y.png"
-
-        create_scatter_plot(data, output_path, log_scale_y=True)
-
-        # ファイルが作成されたことを確認
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-
-        plt.close("all")
-
-    def test_create_scatter_plot_without_log_scale_y(self, tmp_path: Path) -> None:
-        """y軸を線形軸（デフォルト）にした散布図生成テスト"""
-        data = [
-            (1000, 10, "test/repo1"),
-            (2000, 25, "test/repo2"),
-        ]
-        output_path = tmp_path / "scatter_linear_y.png"
-
-        # log_scale_yを明示的にFalseで指定
-        create_scatter_plot(data, output_path, log_scale_y=False)
-
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-
-        plt.close("all")
-
-    def test_create_scatter_plot_with_both_log_scales(self, tmp_path: Path) -> None:
-        """x軸とy軸の両方を対数軸にした散布図生成テスト"""
-        data = [
-            (100, 10, "test/repo1"),
-            (1000, 100, "test/repo2"),
-            (10000, 1000, "test/repo3"),
-        ]
-        output_path = tmp_path / "scatter_log_both.png"
-
-        create_scatter_plot(data, output_path, log_scale_x=True, log_scale_y=True)
-
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-
-        plt.close("all")
-
-    def test_create_scatter_plot_with_correlation(self, tmp_path: Path) -> None:
-        """スピアマン相関係数を表示した散布図生成テスト"""
-        data = [
-            (1000, 10, "test/repo1"),
-            (2000, 25, "test/repo2"),
-            (1500, 15, "test/repo3"),
-            (3000, 35, "test/repo4"),
-        ]
-        output_path = tmp_path / "scatter_correlation.png"
-
-        create_scatter_plot(data, output_path, show_correlation=True)
-
-        # ファイルが作成されたことを確認
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-
-        plt.close("all")
-
-    def test_create_scatter_plot_without_correlation(self, tmp_path: Path) -> None:
-        """スピアマン相関係数なしで散布図生成テスト"""
-        data = [
-            (1000, 10, "test/repo1"),
-            (2000, 25, "test/repo2"),
-        ]
-        output_path = tmp_path / "scatter_no_correlation.png"
-
-        create_scatter_plot(data, output_path, show_correlation=False)
-
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-
-        plt.close("all")
-
-    def test_create_scatter_plot_correlation_with_single_point(self, tmp_path: Path) -> None:
-        """1点のみのデータで相関係数表示を試みた場合のテスト"""
-        data = [(1000, 10, "test/repo1")]
-        output_path = tmp_path / "scatter_single_corr.png"
-
-        # エラーにならず、グラフが生成されることを確認
-        create_scatter_plot(data, output_path, show_correlation=True)
-
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-
-        plt.close("all")
-
-    def test_create_scatter_plot_correlation_with_empty_data(self, tmp_path: Path) -> None:
-        """空データで相関係数表示を試みた場合のテスト"""
-        data: list[tuple[int, int, str]] = []
-        output_path = tmp_path / "scatter_empty_corr.png"
-
-        # エラーにならず、グラフが生成されることを確認
-        create_scatter_plot(data, output_path, show_correlation=True)
-
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-
-        plt.close("all")
-
-    def test_create_scatter_plot_with_regression(self, tmp_path: Path) -> None:
-        """回帰直線を表示した散布図生成テスト"""
-        data = [
-            (1000, 10, "test/repo1"),
-            (2000, 25, "test/repo2"),
-            (1500, 15, "test/repo3"),
-            (3000, 35, "test/repo4"),
-        ]
-        output_path = tmp_path / "scatter_regression.png"
-
-        create_scatter_plot(data, output_path, show_regression=True)
-
-        # ファイルが作成されたことを確認
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-
-        plt.close("all")
-
-    def test_create_scatter_plot_without_regression(self, tmp_path: Path) -> None:
-        """回帰直線なしで散布図生成テスト"""
-        data = [
-            (1000, 10, "test/repo1"),
-            (2000, 25, "test/repo2"),
-        ]
-        output_path = tmp_path / "scatter_no_regression.png"
-
-        create_scatter_plot(data, output_path, show_regression=False)
-
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-
-        plt.close("all")
-
-    def test_create_scatter_plot_with_regression_log_scale_x(self, tmp_path: Path) -> None:
-        """x軸対数スケール + 回帰直線の散布図生成テスト"""
-        data = [
-            (100, 10, "test/repo1"),
-            (1000, 25, "test/repo2"),
-            (10000, 50, "test/repo3"),
-        ]
-        output_path = tmp_path / "scatter_regression_log_x.png"
-
-        create_scatter_plot(data, output_path, log_scale_x=True, show_regression=True)
-
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-
-        plt.close("all")
-
-    def test_create_scatter_plot_with_regression_log_scale_y(self, tmp_path: Path) -> None:
-        """y軸対数スケール + 回帰直線の散布図生成テスト"""
-        data = [
-            (1000, 10, "test/repo1"),
-            (2000, 100, "test/repo2"),
-            (3000, 1000, "test/repo3"),
-        ]
-        output_path = tmp_path / "scatter_regression_log_y.png"
-
-        create_scatter_plot(data, output_path, log_scale_y=True, show_regression=True)
-
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-
-        plt.close("all")
-
-    def test_create_scatter_plot_with_regression_both_log_scales(self, tmp_path: Path) -> None:
-        """両軸対数スケール + 回帰直線の散布図生成テスト"""
-        data = [
-            (100, 10, "test/repo1"),
-            (1000, 100, "test/repo2"),
-            (10000, 1000, "test/repo3"),
-        ]
-        output_path = tmp_path / "scatter_regression_log_both.png"
-
-        create_scatter_plot(data, output_path, log_scale_x=True, log_scale_y=True, show_regression=True)
-
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-
-        plt.close("all")
-
-    def test_create_scatter_plot_regression_with_single_point(self, tmp_path: Path) -> None:
-        """1点のみのデータで回帰直線表示を試みた場合のテスト"""
-        data = [(1000, 10, "test/repo1")]
-        output_path = tmp_path / "scatter_single_regression.png"
-
-        # エラーにならず、グラフが生成されることを確認
-        create_scatter_plot(data, output_path, show_regression=True)
-
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-
-        plt.close("all")
-
-    def test_create_scatter_plot_regression_with_empty_data(self, tmp_path: Path) -> None:
-        """空データで回帰直線表示を試みた場合のテスト"""
-        data: list[tuple[int, int, str]] = []
-        output_path = tmp_path / "scatter_empty_regression.png"
-
-        # エラーにならず、グラフが生成されることを確認
-        create_scatter_plot(data, output_path, show_regression=True)
-
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-
-        plt.close("all")
-
-    def test_create_scatter_plot_with_correlation_and_regression(self, tmp_path: Path) -> None:
-        """相関係数と回帰直線を同時表示するテスト"""
-        data = [
-            (1000, 10, "test/repo1"),
-            (2000, 25, "test/repo2"),
-            (1500, 15, "test/repo3"),
-            (3000, 35, "test/repo4"),
-        ]
-        output_path = tmp_path / "scatter_corr_and_regression.png"
-
-        create_scatter_plot(data, output_path, show_correlation=True, show_regression=True)
-
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
 
-        plt.close("all")
+def _linregress_line(
+    x_data: np.ndarray, y_data: np.ndarray, x_ends: np.ndarray, *, log_scale_x: bool, log_scale_y: bool
+) -> np.ndarray:
+    """scipy.stats.linregress で求めた回帰直線の、x_ends（元のスケール）における y を返す"""
+    x_calc = np.log10(x_data) if log_scale_x else x_data
+    y_calc = np.log10(y_data) if log_scale_y else y_data
+    result = stats.linregress(x_calc, y_calc)
+    x_line = np.log10(x_ends) if log_scale_x else x_ends
+    y_line = result.slope * x_line + result.intercept
+    return 10**y_line if log_scale_y else y_line
+
+
+class TestRegressionLine:
+    """_regression_line関数のテスト"""
+
+    @pytest.mark.parametrize("log_scale_x", [False, True])
+    @pytest.mark.parametrize("log_scale_y", [False, True])
+    def test_matches_linregress(self, log_scale_x: bool, log_scale_y: bool) -> None:
+        """端点が scipy.stats.linregress による回帰直線と一致することを確認"""
+        rng = np.random.default_rng(0)
+        x_data = rng.uniform(1, 10000, size=50)
+        y_data = rng.uniform(1, 1000, size=50)
+
+        line = _regression_line(x_data, y_data, log_scale_x=log_scale_x, log_scale_y=log_scale_y, xlim=None)
+
+        assert line is not None
+        x_line, y_line = line
+        assert np.allclose(x_line, [x_data.min(), x_data.max()])
+        expected = _linregress_line(x_data, y_data, x_line, log_scale_x=log_scale_x, log_scale_y=log_scale_y)
+        assert np.allclose(y_line, expected)
+
+    @pytest.mark.parametrize("log_scale_x", [False, True])
+    def test_xlim_sets_endpoints(self, log_scale_x: bool) -> None:
+        """`xlim` を指定すると、その範囲の両端に直線が引かれることを確認"""
+        rng = np.random.default_rng(1)
+        x_data = rng.uniform(10, 1000, size=20)
+        y_data = 2 * x_data + rng.normal(0, 5, size=20)
+
+        line = _regression_line(x_data, y_data, log_scale_x=log_scale_x, log_scale_y=False, xlim=(1.0, 5000.0))
+
+        assert line is not None
+        x_line, y_line = line
+        assert np.allclose(x_line, [1.0, 5000.0])
+        expected = _linregress_line(x_data, y_data, x_line, log_scale_x=log_scale_x, log_scale_y=False)
+        assert np.allclose(y_line, expected)
+
+    def test_identical_x_returns_none(self) -> None:
+        """すべての x が同じ値で傾きが定まらない場合は None を返すことを確認"""
+        x_data = np.array([1000.0, 1000.0, 1000.0])
+        y_data = np.array([10.0, 20.0, 30.0])
+
+        assert _regression_line(x_data, y_data, log_scale_x=False, log_scale_y=False, xlim=None) is None
+        assert _regression_line(x_data, y_data, log_scale_x=True, log_scale_y=True, xlim=None) is None
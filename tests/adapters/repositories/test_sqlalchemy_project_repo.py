@@ -4,11 +4,37 @@
 特に topics との連携が正しく動作することを重点的に確認します。
 """
 
-from datetime import datetime
+from datetime import UTC, datetime, timedelta, timezone
+from unittest.mock import patch
 
 import pytest
+from sqlalchemy.exc import IntegrityError
 
 from mb_scanner.adapters.repositories.sqlalchemy_project_repo import SqlAlchemyProjectRepository
+from mb_scanner.domain.entities.project import Project, Topic
+from mb_scanner.infrastructure.orm.tables import TopicORM
+
+
+def _two_projects() -> list[Project]:
+    """一覧・件数系のテストで使う2件のプロジェクト"""
+    return [
+        Project(
+            full_name="facebook/react",
+            url="https://github.com/facebook/react",
+            stars=250000,
+            language="JavaScript",
+            description="React",
+            last_commit_date=datetime(2025, 10, 1),
+        ),
+        Project(
+            full_name="vuejs/vue",
+            url="https://github.com/vuejs/vue",
+            stars=210000,
+            language="JavaScript",
+            description="Vue",
+            last_commit_date=datetime(2025, 9, 15),
+        ),
+    ]
 
 
 def test_save_project_new(project_service: SqlAlchemyProjectRepository) -> None:
@@ -40,6 +66,40 @@ def test_save_project_new(project_service: SqlAlchemyProjectRepository) -> None:
     assert saved_project.full_name == "facebook/react"
 
 
+def test_save_project_returns_same_datetimes_as_get(project_service: SqlAlchemyProjectRepository) -> None:
+    """保存直後の返り値と DB から取得した値で日時（naive）が一致することを確認"""
+    jst = timezone(timedelta(hours=9))
+    project = project_service.save_project(
+        full_name="facebook/react",
+        url="https://github.com/facebook/react",
+        stars=250000,
+        language="JavaScript",
+        description=None,
+        last_commit_date=datetime(2025, 10, 1, 9, 0, tzinfo=jst),
+    )
+    saved_project = project_service.get_project_by_full_name("facebook/react")
+
+    assert saved_project is not None
+    assert project.last_commit_date == saved_project.last_commit_date == datetime(2025, 10, 1, 9, 0)
+    assert project.fetched_at == saved_project.fetched_at
+    assert project.fetched_at is not None
+    assert project.fetched_at.tzinfo is None
+
+    [batch_saved] = project_service.save_projects(
+        [
+            Project(
+                full_name="vuejs/vue",
+                url="https://github.com/vuejs/vue",
+                stars=210000,
+                last_commit_date=datetime(2025, 9, 15, tzinfo=UTC),
+            )
+        ]
+    )
+    assert batch_saved.last_commit_date == datetime(2025, 9, 15)
+    assert batch_saved.fetched_at is not None
+    assert batch_saved.fetched_at.tzinfo is None
+
+
 def test_save_project_duplicate_skip(project_service: SqlAlchemyProjectRepository) -> None:
     """重複プロジェクトのスキップテスト
 
@@ -74,8 +134,7 @@ def test_save_project_duplicate_skip(project_service: SqlAlchemyProjectRepositor
     assert second_project.description == "First description"  # 元の値
 
     # DBには1件のみ存在
-    all_projects = project_service.get_all_projects()
-    assert len(all_projects) == 1
+    assert project_service.count_projects() == 1
 
 
 def test_save_project_update_if_exists(project_service: SqlAlchemyProjectRepository) -> None:
@@ -113,8 +172,7 @@ def test_save_project_update_if_exists(project_service: SqlAlchemyProjectReposit
     assert updated_project.description == "New description"
 
     # DBには1件のみ存在
-    all_projects = project_service.get_all_projects()
-    assert len(all_projects) == 1
+    assert project_service.count_projects() == 1
 
 
 def test_save_project_with_topics(project_service: SqlAlchemyProjectRepository) -> None:
@@ -201,6 +259,202 @@ def test_save_project_update_topics(project_service: SqlAlchemyProjectRepository
     assert topic_names == {"react", "frontend", "ui"}
 
 
+def test_save_projects_new(project_service: SqlAlchemyProjectRepository) -> None:
+    """複数プロジェクト一括保存のテスト
+
+    まとめて渡したプロジェクトが入力順に保存され、IDが採番されることを確認します。
+    """
+    # 実行
+    saved = project_service.save_projects(_two_projects())
+
+    # 検証
+    assert [project.full_name for project in saved] == ["facebook/react", "vuejs/vue"]
+    assert all(project.id is not None for project in saved)
+    assert all(project.fetched_at is not None for project in saved)
+    assert project_service.count_projects() == 2
+
+
+def test_save_projects_skips_existing(project_service: SqlAlchemyProjectRepository) -> None:
+    """一括保存で既存・重複プロジェクトをスキップするテスト
+
+    DBに既に存在するfull_nameと、入力内で重複するfull_nameが保存されないことを確認します。
+    """
+    # 事前準備
+    project_service.save_project(
+        full_name="facebook/react",
+        url="https://github.com/facebook/react",
+        stars=1,
+        language="JavaScript",
+        description="React",
+        last_commit_date=None,
+    )
+    projects = _two_projects()
+
+    # 実行
+    saved = project_service.save_projects([*projects, projects[1]])
+
+    # 検証
+    assert [project.full_name for project in saved] == ["vuejs/vue"]
+    assert project_service.count_projects() == 2
+    react = project_service.get_project_by_full_name("facebook/react")
+    assert react is not None
+    assert react.stars == 1
+
+
+def test_save_projects_without_existing_check(project_service: SqlAlchemyProjectRepository) -> None:
+    """既存判定を省略した一括保存のテスト
+
+    check_existing=False の場合、既存full_nameの検索を行わずに保存されることを確認します。
+    """
+    # 実行
+    with patch.object(project_service, "existing_full_names") as mock_existing:
+        saved = project_service.save_projects(_two_projects(), check_existing=False)
+
+    # 検証
+    mock_existing.assert_not_called()
+    assert [project.full_name for project in saved] == ["facebook/react", "vuejs/vue"]
+    assert project_service.count_projects() == 2
+
+
+def test_save_projects_rolls_back_on_failure(project_service: SqlAlchemyProjectRepository) -> None:
+    """一括保存失敗時のロールバックのテスト
+
+    保存に失敗しても、同じセッションで以降の保存を続けられることを確認します。
+    """
+    # 事前準備
+    react, vue = _two_projects()
+    project_service.save_projects([react])
+
+    # 実行: 既存判定を省略して同じ full_name を保存すると一意制約違反になる
+    with pytest.raises(IntegrityError):
+        project_service.save_projects([react], check_existing=False)
+    saved = project_service.save_projects([vue])
+
+    # 検証
+    assert [project.full_name for project in saved] == ["vuejs/vue"]
+    assert project_service.count_projects() == 2
+
+
+def _failing_topic_flush(project_service: SqlAlchemyProjectRepository):
+    """並行実行との競合で topic の INSERT が一意制約違反になる状況を再現する side_effect を返す"""
+
+    def side_effect(topic_names: list[str]) -> list[TopicORM]:
+        project_service.db.add_all([TopicORM(name=topic_names[0]), TopicORM(name=topic_names[0])])
+        project_service.db.flush()
+        return []
+
+    return side_effect
+
+
+def test_save_projects_rolls_back_on_topic_flush_failure(project_service: SqlAlchemyProjectRepository) -> None:
+    """一括保存で topic の flush が失敗しても、ロールバックされて次のチャンクを保存できることを確認します。"""
+    # 事前準備
+    react, vue = _two_projects()
+    react = react.model_copy(update={"topics": [Topic(name="javascript")]})
+
+    # 実行
+    with (
+        patch.object(
+            project_service.topic_repo,
+            "get_or_create_topic_orms",
+            side_effect=_failing_topic_flush(project_service),
+        ),
+        pytest.raises(IntegrityError),
+    ):
+        project_service.save_projects([react])
+    saved = project_service.save_projects([vue])
+
+    # 検証
+    assert [project.full_name for project in saved] == ["vuejs/vue"]
+    assert project_service.count_projects() == 1
+
+
+def test_save_project_rolls_back_on_topic_flush_failure(project_service: SqlAlchemyProjectRepository) -> None:
+    """save_project でも topic の flush 失敗後にセッションが使える状態に戻ることを確認します。"""
+    # 実行
+    with (
+        patch.object(
+            project_service.topic_repo,
+            "get_or_create_topic_orms",
+            side_effect=_failing_topic_flush(project_service),
+        ),
+        pytest.raises(IntegrityError),
+    ):
+        project_service.save_project(
+            full_name="facebook/react",
+            url="https://github.com/facebook/react",
+            stars=250000,
+            language="JavaScript",
+            description=None,
+            last_commit_date=None,
+            topics=["javascript"],
+        )
+    project = project_service.save_project(
+        full_name="vuejs/vue",
+        url="https://github.com/vuejs/vue",
+        stars=210000,
+        language="JavaScript",
+        description=None,
+        last_commit_date=None,
+        topics=["vue"],
+    )
+
+    # 検証
+    assert project.id is not None
+    assert [topic.name for topic in project.topics] == ["vue"]
+    assert project_service.count_projects() == 1
+
+
+def test_existing_full_names(project_service: SqlAlchemyProjectRepository) -> None:
+    """既存full_nameの一括判定テスト
+
+    与えたfull_nameのうち、DBに存在するものだけが返されることを確認します。
+    """
+    # 事前準備
+    project_service.save_projects(_two_projects())
+
+    # 実行・検証
+    assert project_service.existing_full_names(["facebook/react", "angular/angular", "vuejs/vue"]) == {
+        "facebook/react",
+        "vuejs/vue",
+    }
+    assert project_service.existing_full_names(["angular/angular"]) == set()
+    assert project_service.existing_full_names([]) == set()
+
+
+def test_save_projects_with_topics(project_service: SqlAlchemyProjectRepository) -> None:
+    """一括保存でtopicを共有するテスト
+
+    複数プロジェクトで同じtopicを指定した場合、topicが1件だけ作成され共有されることを確認します。
+    """
+    # 準備
+    react, vue = _two_projects()
+    react.topics = [Topic(name="javascript"), Topic(name="react")]
+    vue.topics = [Topic(name="javascript"), Topic(name="vue")]
+
+    # 実行
+    saved = project_service.save_projects([react, vue])
+
+    # 検証
+    assert [topic.name for topic in saved[0].topics] == ["javascript", "react"]
+    assert [topic.name for topic in saved[1].topics] == ["javascript", "vue"]
+    assert saved[0].topics[0].id == saved[1].topics[0].id
+    assert project_service.topic_repo.count_topics() == 3
+
+
+def test_save_projects_empty(project_service: SqlAlchemyProjectRepository) -> None:
+    """一括保存（空リスト）のテスト
+
+    空リストを指定した場合、何も保存されず空リストが返されることを確認します。
+    """
+    # 実行
+    saved = project_service.save_projects([])
+
+    # 検証
+    assert saved == []
+    assert project_service.count_projects() == 0
+
+
 def test_get_project_by_full_name_exists(project_service: SqlAlchemyProjectRepository) -> None:
     """full_nameでプロジェクト取得（存在する場合）のテスト
 
@@ -243,22 +497,7 @@ def test_get_all_projects(project_service: SqlAlchemyProjectRepository) -> None:
     複数のプロジェクトを作成後、全件取得できることを確認します。
     """
     # 事前準備
-    project_service.save_project(
-        full_name="facebook/react",
-        url="https://github.com/facebook/react",
-        stars=250000,
-        language="JavaScript",
-        description="React",
-        last_commit_date=datetime(2025, 10, 1),
-    )
-    project_service.save_project(
-        full_name="vuejs/vue",
-        url="https://github.com/vuejs/vue",
-        stars=210000,
-        language="JavaScript",
-        description="Vue",
-        last_commit_date=datetime(2025, 9, 15),
-    )
+    project_service.save_projects(_two_projects())
 
     # 実行
     all_projects = project_service.get_all_projects()
@@ -287,22 +526,7 @@ def test_count_projects(project_service: SqlAlchemyProjectRepository) -> None:
     プロジェクトの件数が正しくカウントされることを確認します。
     """
     # 事前準備
-    project_service.save_project(
-        full_name="facebook/react",
-        url="https://github.com/facebook/react",
-        stars=250000,
-        language="JavaScript",
-        description="React",
-        last_commit_date=datetime(2025, 10, 1),
-    )
-    project_service.save_project(
-        full_name="vuejs/vue",
-        url="https://github.com/vuejs/vue",
-        stars=210000,
-        language="JavaScript",
-        description="Vue",
-        last_commit_date=datetime(2025, 9, 15),
-    )
+    project_service.save_projects(_two_projects())
 
     # 実行
     count = project_service.count_projects()
@@ -23,8 +23,7 @@ def test_get_or_create_topics_all_new(topic_service: SqlAlchemyTopicRepository)
     assert topics[2].name == "frontend"
 
     # DBに保存されていることを確認
-    all_topics = topic_service.get_all_topics()
-    assert len(all_topics) == 3
+    assert topic_service.count_topics() == 3
 
 
 def test_get_or_create_topics_all_existing(topic_service: SqlAlchemyTopicRepository) -> None:
@@ -46,8 +45,7 @@ def test_get_or_create_topics_all_existing(topic_service: SqlAlchemyTopicReposit
     assert second_topics[0].name == "react"
 
     # DBには2件のみ存在
-    all_topics = topic_service.get_all_topics()
-    assert len(all_topics) == 2
+    assert topic_service.count_topics() == 2
 
 
 def test_get_or_create_topics_mixed(topic_service: SqlAlchemyTopicRepository) -> None:
@@ -68,8 +66,7 @@ def test_get_or_create_topics_mixed(topic_service: SqlAlchemyTopicRepository) ->
     assert topics[2].name == "angular"
 
     # DBには3件存在
-    all_topics = topic_service.get_all_topics()
-    assert len(all_topics) == 3
+    assert topic_service.count_topics() == 3
 
 
 def test_get_or_create_topics_empty(topic_service: SqlAlchemyTopicRepository) -> None:
@@ -84,8 +81,7 @@ def test_get_or_create_topics_empty(topic_service: SqlAlchemyTopicRepository) ->
     assert len(topics) == 0
 
     # DBにも何も保存されていない
-    all_topics = topic_service.get_all_topics()
-    assert len(all_topics) == 0
+    assert topic_service.count_topics() == 0
 
 
 def test_get_topic_by_name_exists(topic_service: SqlAlchemyTopicRepository) -> None:
@@ -170,3 +166,19 @@ def test_count_topics_empty(topic_service: SqlAlchemyTopicRepository) -> None:
 
     # 検証
     assert count == 0
+
+
+def test_get_or_create_topics_duplicate_names(topic_service: SqlAlchemyTopicRepository) -> None:
+    """重複名を含むテスト
+
+    同じtopic名が複数回含まれていても1件だけ作成され、入力と同じ順序で返されることを確認します。
+    """
+    # 実行
+    topics = topic_service.get_or_create_topics(["react", "vue", "react"])
+
+    # 検証
+    assert [topic.name for topic in topics] == ["react", "vue", "react"]
+    assert topics[0].id == topics[2].id
+
+    # DBには2件のみ存在
+    assert topic_service.count_topics() == 2
@@ -4,44 +4,75 @@
 """
 
 from collections.abc import Generator
+import sqlite3
+
+import matplotlib
+
+# pyplot の初回 import で GUI バックエンドを探索しないよう、テスト全体で非対話の Agg を使う
+matplotlib.use("Agg", force=True)
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import Connection, Engine, create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from mb_scanner.adapters.repositories.sqlalchemy_project_repo import SqlAlchemyProjectRepository
 from mb_scanner.adapters.repositories.sqlalchemy_topic_repo import SqlAlchemyTopicRepository
 from mb_scanner.infrastructure.orm.base import Base
 
 
-@pytest.fixture(scope="function")
-def test_db() -> Generator[Session]:
-    """テスト用のインメモリDBセッションを提供するフィクスチャ
+@pytest.fixture(scope="session")
+def test_engine() -> Generator[Engine]:
+    """テストセッション全体で共有するインメモリSQLiteエンジンを提供するフィクスチャ
 
-    各テスト関数ごとに新しいDBインスタンスを作成し、テスト終了後にクリーンアップします。
-    scope="function" により、各テストが独立した環境で実行されます。
+    テーブル作成はセッション開始時の1回だけ行います。
+    StaticPool により全テストが同じ接続（= 同じインメモリDB）を使います。
 
     Yields:
-        Session: テスト用のSQLAlchemyセッション
+        Engine: テスト用のSQLAlchemyエンジン
     """
-    # インメモリSQLiteエンジンを作成
-    engine = create_engine("sqlite:///:memory:", echo=False)
+    engine = create_engine("sqlite://", poolclass=StaticPool, echo=False)
+
+    # pysqlite は BEGIN の発行を遅延させるため、SAVEPOINT が最外トランザクションになってしまう。
+    # ドライバのトランザクション制御を切り、SQLAlchemy の begin で明示的に BEGIN を発行する
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transaction_handling(dbapi_connection: sqlite3.Connection, _record: object) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn: Connection) -> None:
+        conn.exec_driver_sql("BEGIN")
 
-    # テーブルを作成
     Base.metadata.create_all(bind=engine)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
 
-    # セッションファクトリを作成
-    test_session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-    # セッションを作成して提供
-    db = test_session_local()
+@pytest.fixture(scope="function")
+def test_db(test_engine: Engine) -> Generator[Session]:
+    """テスト用のインメモリDBセッションを提供するフィクスチャ
+
+    各テスト関数を1つのトランザクションで包み、テスト終了後にロールバックします。
+    リポジトリ内の commit() は SAVEPOINT の解放になるため、テスト間でデータは残りません。
+
+    Args:
+        test_engine: セッション共有のテスト用エンジン
+
+    Yields:
+        Session: テスト用のSQLAlchemyセッション
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    db = Session(bind=connection, autoflush=False, join_transaction_mode="create_savepoint")
 
     try:
         yield db
     finally:
         db.close()
-        # テーブルを削除（クリーンアップ）
-        Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture
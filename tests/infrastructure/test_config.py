@@ -81,6 +81,15 @@ def test_codeql_default_output_format():
     assert settings.codeql_default_output_format == "sarifv2.1.0"
 
 
+def test_codeql_default_threads():
+    """クエリ実行のデフォルトスレッド数が全コア（0）になっていることを確認する"""
+    # Arrange & Act
+    settings = Settings()
+
+    # Assert
+    assert settings.codeql_default_threads == 0
+
+
 def test_effective_codeql_clone_dir_default(tmp_path: Path):
     """デフォルトで data/repositories が返されることを確認する"""
     # Arrange
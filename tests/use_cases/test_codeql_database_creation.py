@@ -4,24 +4,76 @@ from pathlib import Path
 import subprocess
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from mb_scanner.use_cases.codeql_database_creation import CodeQLDatabaseCreationWorkflow
 
 
+@pytest.fixture(scope="session")
+def clone_base_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """全テストで共有するクローン先ディレクトリ（モックなので実際には書き込まれない）"""
+    return tmp_path_factory.mktemp("clones", numbered=False)
+
+
+@pytest.fixture
+def mock_cloner() -> MagicMock:
+    """RepositoryClonerPort の代わりに渡すモック"""
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_db_manager() -> MagicMock:
+    """CodeQLDatabaseManagerPort の代わりに渡すモック"""
+    return MagicMock()
+
+
 class TestCodeQLDatabaseCreationWorkflow:
     """CodeQLDatabaseCreationWorkflowのテスト"""
 
-    def test_create_database_for_project_success(self, tmp_path: Path) -> None:
-        """データベース作成が成功し、クローンディレクトリが削除されない（残存する）ことを確認"""
+    @pytest.mark.parametrize(
+        ("clone_exists", "create_error", "expected_status"),
+        [
+            pytest.param(False, None, "created", id="success"),
+            # 既存のクローンがある場合も skip_if_exists=True で cloner に任せ、再クローンせずに進む
+            pytest.param(True, None, "created", id="skip_existing_clone"),
+            pytest.param(
+                False,
+                subprocess.CalledProcessError(
+                    returncode=1,
+                    cmd=["codeql", "database", "create"],
+                    stderr="Database creation failed",
+                ),
+                "error",
+                id="database_creation_failure",
+            ),
+        ],
+    )
+    def test_create_database_for_project(
+        self,
+        *,
+        request: pytest.FixtureRequest,
+        clone_base_dir: Path,
+        mock_cloner: MagicMock,
+        mock_db_manager: MagicMock,
+        clone_exists: bool,
+        create_error: Exception | None,
+        expected_status: str,
+    ) -> None:
+        """クローンとDB作成を経た結果を確認（クローンディレクトリは削除されず残存する）"""
         # Arrange
-        clone_base_dir = tmp_path / "clones"
+        # 実際に mkdir するケースがあるため、テストごとに固有のサブディレクトリを使う
+        clone_base_dir = clone_base_dir / request.node.name
         clone_path = clone_base_dir / "facebook-react"
+        if clone_exists:
+            clone_path.mkdir(parents=True)  # 既存クローンをシミュレート
+        db_path = clone_base_dir / "db" / "facebook-react"
 
-        mock_cloner = MagicMock()
         mock_cloner.clone.return_value = clone_path
-
-        mock_db_manager = MagicMock()
         mock_db_manager.database_exists.return_value = False
-        mock_db_manager.create_database.return_value = tmp_path / "db" / "facebook-react"
+        if create_error is None:
+            mock_db_manager.create_database.return_value = db_path
+        else:
+            mock_db_manager.create_database.side_effect = create_error
 
         workflow = CodeQLDatabaseCreationWorkflow(
             cloner=mock_cloner,
@@ -39,10 +91,13 @@ class TestCodeQLDatabaseCreationWorkflow:
         )
 
         # Assert
-        assert result["status"] == "created"
-        assert result["db_path"] == str(tmp_path / "db" / "facebook-react")
+        assert result["status"] == expected_status
+        if create_error is None:
+            assert result["db_path"] == str(db_path)
+        else:
+            assert "returned non-zero exit status" in result["error"]
 
-        # クローンが呼ばれたことを確認
+        # skip_if_exists=True でクローンが呼ばれたことを確認
         mock_cloner.clone.assert_called_once_with(
             "https://github.com/facebook/react.git",
             clone_path,
@@ -57,54 +112,14 @@ class TestCodeQLDatabaseCreationWorkflow:
             force=False,
         )
 
-    def test_create_database_for_project_skip_existing_clone(self, tmp_path: Path) -> None:
-        """既存のクローンがある場合、再クローンせずに進むことを確認"""
-        # Arrange
-        clone_base_dir = tmp_path / "clones"
-        existing_clone_path = clone_base_dir / "facebook-react"
-        existing_clone_path.mkdir(parents=True)  # 既存クローンをシミュレート
-
-        mock_cloner = MagicMock()
-        mock_cloner.clone.return_value = existing_clone_path  # 既存パスを返す
-
-        mock_db_manager = MagicMock()
-        mock_db_manager.database_exists.return_value = False
-        mock_db_manager.create_database.return_value = tmp_path / "db" / "facebook-react"
-
-        workflow = CodeQLDatabaseCreationWorkflow(
-            cloner=mock_cloner,
-            db_manager=mock_db_manager,
-            clone_base_dir=clone_base_dir,
-        )
-
-        # Act
-        result = workflow.create_database_for_project(
-            project_full_name="facebook/react",
-            repository_url="https://github.com/facebook/react.git",
-            language="javascript",
-            skip_if_exists=False,
-            force=False,
-        )
-
-        # Assert
-        assert result["status"] == "created"
-
-        # skip_if_exists=True でクローンが呼ばれたことを確認
-        mock_cloner.clone.assert_called_once_with(
-            "https://github.com/facebook/react.git",
-            existing_clone_path,
-            skip_if_exists=True,
-        )
-
-    def test_create_database_for_project_skip_if_exists(self, tmp_path: Path) -> None:
+    def test_create_database_for_project_skip_if_exists(
+        self, clone_base_dir: Path, mock_cloner: MagicMock, mock_db_manager: MagicMock
+    ) -> None:
         """既存DBがある場合スキップすることを確認"""
         # Arrange
-        clone_base_dir = tmp_path / "clones"
-
-        mock_cloner = MagicMock()
-        mock_db_manager = MagicMock()
+        db_path = clone_base_dir / "db" / "facebook-react"
         mock_db_manager.database_exists.return_value = True
-        mock_db_manager.get_database_path.return_value = tmp_path / "db" / "facebook-react"
+        mock_db_manager.get_database_path.return_value = db_path
 
         workflow = CodeQLDatabaseCreationWorkflow(
             cloner=mock_cloner,
@@ -123,25 +138,23 @@ class TestCodeQLDatabaseCreationWorkflow:
 
         # Assert
         assert result["status"] == "skipped"
-        assert result["db_path"] == str(tmp_path / "db" / "facebook-react")
+        assert result["db_path"] == str(db_path)
 
         # クローンもDB作成も呼ばれないことを確認
         mock_cloner.clone.assert_not_called()
         mock_db_manager.create_database.assert_not_called()
 
-    def test_create_database_for_project_clone_failure(self, tmp_path: Path) -> None:
+    def test_create_database_for_project_clone_failure(
+        self, clone_base_dir: Path, mock_cloner: MagicMock, mock_db_manager: MagicMock
+    ) -> None:
         """クローンに失敗した場合にエラーが返されることを確認"""
         # Arrange
-        clone_base_dir = tmp_path / "clones"
-
-        mock_cloner = MagicMock()
         mock_cloner.clone.side_effect = subprocess.CalledProcessError(
             returncode=128,
             cmd=["git", "clone"],
             stderr="fatal: repository not found",
         )
 
-        mock_db_manager = MagicMock()
         mock_db_manager.database_exists.return_value = False
 
         workflow = CodeQLDatabaseCreationWorkflow(
@@ -166,52 +179,16 @@ class TestCodeQLDatabaseCreationWorkflow:
         # DB作成は呼ばれないことを確認
         mock_db_manager.create_database.assert_not_called()
 
-    def test_create_database_for_project_database_creation_failure(self, tmp_path: Path) -> None:
-        """データベース作成に失敗した場合にエラーが返されることを確認"""
-        # Arrange
-        clone_base_dir = tmp_path / "clones"
-        clone_path = clone_base_dir / "facebook-react"
-
-        mock_cloner = MagicMock()
-        mock_cloner.clone.return_value = clone_path
-
-        mock_db_manager = MagicMock()
-        mock_db_manager.database_exists.return_value = False
-        mock_db_manager.create_database.side_effect = subprocess.CalledProcessError(
-            returncode=1,
-            cmd=["codeql", "database", "create"],
-            stderr="Database creation failed",
-        )
-
-        workflow = CodeQLDatabaseCreationWorkflow(
-            cloner=mock_cloner,
-            db_manager=mock_db_manager,
-            clone_base_dir=clone_base_dir,
-        )
-
-        # Act
-        result = workflow.create_database_for_project(
-            project_full_name="facebook/react",
-            repository_url="https://github.com/facebook/react.git",
-            language="javascript",
-            skip_if_exists=False,
-            force=False,
-        )
-
-        # Assert
-        assert result["status"] == "error"
-        assert "returned non-zero exit status" in result["error"]
-
-    def test_create_databases_batch(self, tmp_path: Path) -> None:
+    def test_create_databases_batch(
+        self, clone_base_dir: Path, mock_cloner: MagicMock, mock_db_manager: MagicMock
+    ) -> None:
         """バッチ処理が正しく動作することを確認"""
         # Arrange
-        mock_cloner = MagicMock()
-        mock_db_manager = MagicMock()
 
         workflow = CodeQLDatabaseCreationWorkflow(
             cloner=mock_cloner,
             db_manager=mock_db_manager,
-            clone_base_dir=tmp_path / "clones",
+            clone_base_dir=clone_base_dir,
         )
 
         projects = [
@@ -240,16 +217,16 @@ class TestCodeQLDatabaseCreationWorkflow:
         assert stats["failed"] == 0
         assert mock_create.call_count == 2
 
-    def test_create_databases_batch_partial_failure(self, tmp_path: Path) -> None:
+    def test_create_databases_batch_partial_failure(
+        self, clone_base_dir: Path, mock_cloner: MagicMock, mock_db_manager: MagicMock
+    ) -> None:
         """一部のプロジェクトが失敗しても継続することを確認"""
         # Arrange
-        mock_cloner = MagicMock()
-        mock_db_manager = MagicMock()
 
         workflow = CodeQLDatabaseCreationWorkflow(
             cloner=mock_cloner,
             db_manager=mock_db_manager,
-            clone_base_dir=tmp_path / "clones",
+            clone_base_dir=clone_base_dir,
         )
 
         projects = [
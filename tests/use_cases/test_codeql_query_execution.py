@@ -2,37 +2,73 @@
 
 from pathlib import Path
 import subprocess
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
 
 from mb_scanner.use_cases.codeql_query_execution import CodeQLQueryExecutionWorkflow
 
 
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    """テスト用のデータベースパス"""
+    return tmp_path / "test-db"
+
+
+@pytest.fixture
+def mock_cli() -> SimpleNamespace:
+    """CodeQL CLIのスタブ（検証に使う analyze_database だけを Mock にする）"""
+    return SimpleNamespace(analyze_database=Mock())
+
+
+@pytest.fixture
+def mock_db_manager(db_path: Path) -> SimpleNamespace:
+    """常にデータベースが存在すると応答するDBマネージャーのスタブ"""
+    return SimpleNamespace(
+        database_exists=Mock(return_value=True),
+        get_database_path=Mock(return_value=db_path),
+    )
+
+
+@pytest.fixture
+def mock_analyzer() -> SimpleNamespace:
+    """結果アナライザーのスタブ"""
+    return SimpleNamespace(count_results=Mock(return_value=0), split_results_by_rule=Mock())
+
+
+@pytest.fixture
+def workflow(
+    mock_cli: SimpleNamespace,
+    mock_db_manager: SimpleNamespace,
+    mock_analyzer: SimpleNamespace,
+) -> CodeQLQueryExecutionWorkflow:
+    """スタブを注入したワークフロー"""
+    return CodeQLQueryExecutionWorkflow(
+        codeql_cli=mock_cli,
+        db_manager=mock_db_manager,
+        result_analyzer=mock_analyzer,
+    )
+
+
 class TestCodeQLQueryExecutionWorkflow:
     """CodeQLQueryExecutionWorkflowのテスト"""
 
-    def test_execute_query_for_project_success(self, tmp_path: Path) -> None:
+    def test_execute_query_for_project_success(
+        self,
+        tmp_path: Path,
+        workflow: CodeQLQueryExecutionWorkflow,
+        mock_cli: SimpleNamespace,
+        mock_db_manager: SimpleNamespace,
+        mock_analyzer: SimpleNamespace,
+    ) -> None:
         """正常にクエリを実行できることを確認"""
         # Arrange
-        db_path = tmp_path / "test-db"
-        db_path.mkdir()
         output_base_dir = tmp_path / "outputs"
         query_file = tmp_path / "id_10.ql"
         query_file.touch()
-
-        mock_cli = MagicMock()
-        mock_db_manager = MagicMock()
-        mock_db_manager.database_exists.return_value = True
-        mock_db_manager.get_database_path.return_value = db_path
-
-        mock_analyzer = MagicMock()
         mock_analyzer.count_results.return_value = 42
 
-        workflow = CodeQLQueryExecutionWorkflow(
-            codeql_cli=mock_cli,
-            db_manager=mock_db_manager,
-            result_analyzer=mock_analyzer,
-        )
-
         # Act
         result = workflow.execute_query_for_project(
             project_full_name="facebook/react",
@@ -48,31 +84,22 @@ class TestCodeQLQueryExecutionWorkflow:
         mock_db_manager.database_exists.assert_called_once_with("facebook/react")
         mock_cli.analyze_database.assert_called_once()
 
-    def test_execute_query_for_project_multiple_queries(self, tmp_path: Path) -> None:
-        """複数のクエリファイルが正常に実行できることを確認"""
+    def test_execute_query_for_project_multiple_queries(
+        self,
+        tmp_path: Path,
+        workflow: CodeQLQueryExecutionWorkflow,
+        mock_cli: SimpleNamespace,
+        mock_analyzer: SimpleNamespace,
+    ) -> None:
+        """メタデータに @id の無い複数のクエリファイルが1つずつ実行されることを確認"""
         # Arrange
-        db_path = tmp_path / "test-db"
-        db_path.mkdir()
         output_base_dir = tmp_path / "outputs"
         query_file1 = tmp_path / "id_10.ql"
         query_file2 = tmp_path / "id_20.ql"
         query_file1.touch()
         query_file2.touch()
-
-        mock_cli = MagicMock()
-        mock_db_manager = MagicMock()
-        mock_db_manager.database_exists.return_value = True
-        mock_db_manager.get_database_path.return_value = db_path
-
-        mock_analyzer = MagicMock()
         mock_analyzer.count_results.side_effect = [10, 20]
 
-        workflow = CodeQLQueryExecutionWorkflow(
-            codeql_cli=mock_cli,
-            db_manager=mock_db_manager,
-            result_analyzer=mock_analyzer,
-        )
-
         # Act
         result = workflow.execute_query_for_project(
             project_full_name="facebook/react",
@@ -88,24 +115,122 @@ class TestCodeQLQueryExecutionWorkflow:
         assert result["results"][1]["query_file"] == "id_20.ql"
         assert result["results"][1]["result_count"] == 20
         assert mock_cli.analyze_database.call_count == 2
+        # 後続クエリがある間だけキャッシュを保持し、最後の実行で通常どおり削減させる
+        first_call, second_call = mock_cli.analyze_database.call_args_list
+        assert first_call.kwargs["keep_full_cache"] is True
+        assert second_call.kwargs["keep_full_cache"] is False
+
+    def test_execute_query_for_project_multiple_queries_combined(
+        self,
+        tmp_path: Path,
+        workflow: CodeQLQueryExecutionWorkflow,
+        mock_cli: SimpleNamespace,
+        mock_analyzer: SimpleNamespace,
+    ) -> None:
+        """重複しない @id を持つ複数クエリは1回の analyze にまとめられ、結果がクエリごとに分割されることを確認"""
+        # Arrange
+        output_base_dir = tmp_path / "outputs"
+        query_file1 = tmp_path / "id_10.ql"
+        query_file2 = tmp_path / "id_20.ql"
+        query_file1.write_text("/**\n * @name Query 10\n * @kind problem\n * @id js/id-10\n */\n")
+        query_file2.write_text("/**\n * @name Query 20\n * @kind problem\n * @id js/id-20\n */\n")
+        mock_analyzer.split_results_by_rule.return_value = {"js/id-10": 10, "js/id-20": 20}
 
-    def test_execute_query_for_project_database_not_found(self, tmp_path: Path) -> None:
+        # Act
+        result = workflow.execute_query_for_project(
+            project_full_name="facebook/react",
+            query_files=[query_file1, query_file2],
+            output_base_dir=output_base_dir,
+        )
+
+        # Assert
+        assert result["status"] == "success"
+        assert [r["result_count"] for r in result["results"]] == [10, 20]
+        assert result["results"][1]["output_path"] == str(output_base_dir / "id_20" / "facebook-react.sarif")
+
+        mock_cli.analyze_database.assert_called_once()
+        kwargs = mock_cli.analyze_database.call_args.kwargs
+        assert kwargs["query_files"] == [query_file1, query_file2]
+        combined_path = output_base_dir / "facebook-react.combined.sarif"
+        assert kwargs["output_path"] == combined_path
+
+        mock_analyzer.split_results_by_rule.assert_called_once_with(
+            combined_path,
+            {
+                "js/id-10": output_base_dir / "id_10" / "facebook-react.sarif",
+                "js/id-20": output_base_dir / "id_20" / "facebook-react.sarif",
+            },
+        )
+        mock_analyzer.count_results.assert_not_called()
+
+    def test_execute_query_for_project_ignores_id_outside_metadata(
+        self,
+        tmp_path: Path,
+        workflow: CodeQLQueryExecutionWorkflow,
+        mock_cli: SimpleNamespace,
+        mock_analyzer: SimpleNamespace,
+    ) -> None:
+        """先頭のメタデータコメント以外にある @id は使わず、クエリが1つずつ実行されることを確認"""
+        # Arrange: id_20.ql はメタデータに @id が無く、本文の文字列とコメントにだけ @id がある
+        query_file1 = tmp_path / "id_10.ql"
+        query_file2 = tmp_path / "id_20.ql"
+        query_file1.write_text("// Copyright\n/**\n * @name Query 10\n * @id js/id-10\n */\nimport javascript\n")
+        query_file2.write_text(
+            '/**\n * @name Query 20\n */\nimport javascript\n// @id js/id-20\nselect "@id js/id-20"\n'
+        )
+        mock_analyzer.count_results.side_effect = [10, 20]
+
+        # Act
+        result = workflow.execute_query_for_project(
+            project_full_name="facebook/react",
+            query_files=[query_file1, query_file2],
+            output_base_dir=tmp_path / "outputs",
+        )
+
+        # Assert
+        assert result["status"] == "success"
+        assert mock_cli.analyze_database.call_count == 2
+        mock_analyzer.split_results_by_rule.assert_not_called()
+
+    def test_execute_query_for_project_forwards_threads_and_ram(
+        self,
+        tmp_path: Path,
+        workflow: CodeQLQueryExecutionWorkflow,
+        mock_cli: SimpleNamespace,
+    ) -> None:
+        """指定した threads / ram が analyze_database にそのまま渡されることを確認"""
+        # Arrange
+        query_file = tmp_path / "id_10.ql"
+        query_file.touch()
+
+        # Act
+        result = workflow.execute_query_for_project(
+            project_full_name="facebook/react",
+            query_files=[query_file],
+            output_base_dir=tmp_path / "outputs",
+            threads=0,
+            ram=8192,
+        )
+
+        # Assert
+        assert result["status"] == "success"
+        kwargs = mock_cli.analyze_database.call_args.kwargs
+        assert kwargs["threads"] == 0
+        assert kwargs["ram"] == 8192
+
+    def test_execute_query_for_project_database_not_found(
+        self,
+        tmp_path: Path,
+        workflow: CodeQLQueryExecutionWorkflow,
+        mock_cli: SimpleNamespace,
+        mock_db_manager: SimpleNamespace,
+    ) -> None:
         """データベースが存在しない場合にエラーが返されることを確認"""
         # Arrange
         output_base_dir = tmp_path / "outputs"
         query_file = tmp_path / "test.ql"
         query_file.touch()
-
-        mock_cli = MagicMock()
-        mock_db_manager = MagicMock()
         mock_db_manager.database_exists.return_value = False
-        mock_analyzer = MagicMock()
-
-        workflow = CodeQLQueryExecutionWorkflow(
-            codeql_cli=mock_cli,
-            db_manager=mock_db_manager,
-            result_analyzer=mock_analyzer,
-        )
 
         # Act
         result = workflow.execute_query_for_project(
@@ -119,26 +244,67 @@ class TestCodeQLQueryExecutionWorkflow:
         assert "Database does not exist" in result["error"]
         mock_cli.analyze_database.assert_not_called()
 
-    def test_execute_query_for_project_query_file_not_found(self, tmp_path: Path) -> None:
+    def test_execute_query_for_project_caches_database_lookup(
+        self,
+        tmp_path: Path,
+        workflow: CodeQLQueryExecutionWorkflow,
+        mock_db_manager: SimpleNamespace,
+    ) -> None:
+        """同じプロジェクトを2回実行してもDBの存在確認は1回だけ行われることを確認"""
+        # Arrange
+        query_file = tmp_path / "id_10.ql"
+        query_file.touch()
+
+        # Act
+        for _ in range(2):
+            result = workflow.execute_query_for_project(
+                project_full_name="facebook/react",
+                query_files=[query_file],
+                output_base_dir=tmp_path / "outputs",
+            )
+            assert result["status"] == "success"
+
+        # Assert
+        mock_db_manager.database_exists.assert_called_once_with("facebook/react")
+        mock_db_manager.get_database_path.assert_called_once_with("facebook/react")
+
+    def test_execute_query_for_project_rechecks_missing_database(
+        self,
+        tmp_path: Path,
+        workflow: CodeQLQueryExecutionWorkflow,
+        mock_db_manager: SimpleNamespace,
+    ) -> None:
+        """存在しなかったDBはキャッシュされず、作成後の実行で検出されることを確認"""
+        # Arrange
+        query_file = tmp_path / "id_10.ql"
+        query_file.touch()
+        mock_db_manager.database_exists.side_effect = [False, True]
+
+        # Act
+        results = [
+            workflow.execute_query_for_project(
+                project_full_name="facebook/react",
+                query_files=[query_file],
+                output_base_dir=tmp_path / "outputs",
+            )
+            for _ in range(2)
+        ]
+
+        # Assert
+        assert [r["status"] for r in results] == ["error", "success"]
+        assert mock_db_manager.database_exists.call_count == 2
+
+    def test_execute_query_for_project_query_file_not_found(
+        self,
+        tmp_path: Path,
+        workflow: CodeQLQueryExecutionWorkflow,
+        mock_cli: SimpleNamespace,
+    ) -> None:
         """クエリファイルが存在しない場合にエラーが返されることを確認"""
         # Arrange
-        db_path = tmp_path / "test-db"
-        db_path.mkdir()
         output_base_dir = tmp_path / "outputs"
         nonexistent_query = tmp_path / "nonexistent.ql"
 
-        mock_cli = MagicMock()
-        mock_db_manager = MagicMock()
-        mock_db_manager.database_exists.return_value = True
-        mock_db_manager.get_database_path.return_value = db_path
-        mock_analyzer = MagicMock()
-
-        workflow = CodeQLQueryExecutionWorkflow(
-            codeql_cli=mock_cli,
-            db_manager=mock_db_manager,
-            result_analyzer=mock_analyzer,
-        )
-
         # Act
         result = workflow.execute_query_for_project(
             project_full_name="facebook/react",
@@ -151,33 +317,23 @@ class TestCodeQLQueryExecutionWorkflow:
         assert "Query file does not exist" in result["error"]
         mock_cli.analyze_database.assert_not_called()
 
-    def test_execute_query_for_project_analysis_failure(self, tmp_path: Path) -> None:
+    def test_execute_query_for_project_analysis_failure(
+        self,
+        tmp_path: Path,
+        workflow: CodeQLQueryExecutionWorkflow,
+        mock_cli: SimpleNamespace,
+    ) -> None:
         """クエリ実行に失敗した場合にエラーが返されることを確認"""
         # Arrange
-        db_path = tmp_path / "test-db"
-        db_path.mkdir()
         output_base_dir = tmp_path / "outputs"
         query_file = tmp_path / "test.ql"
         query_file.touch()
-
-        mock_cli = MagicMock()
         mock_cli.analyze_database.side_effect = subprocess.CalledProcessError(
             returncode=1,
             cmd=["codeql", "database", "analyze"],
             stderr="Analysis failed",
         )
 
-        mock_db_manager = MagicMock()
-        mock_db_manager.database_exists.return_value = True
-        mock_db_manager.get_database_path.return_value = db_path
-        mock_analyzer = MagicMock()
-
-        workflow = CodeQLQueryExecutionWorkflow(
-            codeql_cli=mock_cli,
-            db_manager=mock_db_manager,
-            result_analyzer=mock_analyzer,
-        )
-
         # Act
         result = workflow.execute_query_for_project(
             project_full_name="facebook/react",
@@ -189,22 +345,12 @@ class TestCodeQLQueryExecutionWorkflow:
         assert result["status"] == "error"
         assert "returned non-zero exit status" in result["error"]
 
-    def test_execute_queries_batch_success(self, tmp_path: Path) -> None:
+    def test_execute_queries_batch_success(self, tmp_path: Path, workflow: CodeQLQueryExecutionWorkflow) -> None:
         """複数プロジェクトで正常に実行できることを確認"""
         # Arrange
         query_file = tmp_path / "test.ql"
         query_file.touch()
 
-        mock_cli = MagicMock()
-        mock_db_manager = MagicMock()
-        mock_analyzer = MagicMock()
-
-        workflow = CodeQLQueryExecutionWorkflow(
-            codeql_cli=mock_cli,
-            db_manager=mock_db_manager,
-            result_analyzer=mock_analyzer,
-        )
-
         # Act
         with patch.object(workflow, "execute_query_for_project") as mock_execute:
             mock_execute.return_value = {"status": "success", "results": []}
@@ -221,22 +367,14 @@ class TestCodeQLQueryExecutionWorkflow:
         assert stats["failed"] == 0
         assert mock_execute.call_count == 2
 
-    def test_execute_queries_batch_partial_failure(self, tmp_path: Path) -> None:
+    def test_execute_queries_batch_partial_failure(
+        self, tmp_path: Path, workflow: CodeQLQueryExecutionWorkflow
+    ) -> None:
         """一部のプロジェクトが失敗しても継続することを確認"""
         # Arrange
         query_file = tmp_path / "test.ql"
         query_file.touch()
 
-        mock_cli = MagicMock()
-        mock_db_manager = MagicMock()
-        mock_analyzer = MagicMock()
-
-        workflow = CodeQLQueryExecutionWorkflow(
-            codeql_cli=mock_cli,
-            db_manager=mock_db_manager,
-            result_analyzer=mock_analyzer,
-        )
-
         # Act
         call_count = 0
 
@@ -258,3 +396,97 @@ class TestCodeQLQueryExecutionWorkflow:
         assert stats["total"] == 2
         assert stats["success"] == 1
         assert stats["failed"] == 1
+
+    def test_execute_queries_batch_parallel(self, tmp_path: Path, workflow: CodeQLQueryExecutionWorkflow) -> None:
+        """並列実行（workers > 1）でも全プロジェクトが1回ずつ処理され、統計が正しく集計されることを確認"""
+        # Arrange
+        query_file = tmp_path / "test.ql"
+        query_file.touch()
+        projects = [f"owner/repo-{i}" for i in range(6)]
+        failing = {"owner/repo-1", "owner/repo-4"}
+
+        def mock_execute(*, project_full_name: str, **kwargs):
+            if project_full_name in failing:
+                return {"status": "error", "error": "Test error"}
+            return {"status": "success", "results": []}
+
+        # Act
+        with patch.object(workflow, "execute_query_for_project", side_effect=mock_execute) as mock_method:
+            stats = workflow.execute_queries_batch(
+                projects=projects,
+                query_files=[query_file],
+                output_base_dir=tmp_path,
+                workers=3,
+            )
+
+        # Assert
+        assert stats == {"total": 6, "success": 4, "failed": 2}
+        called = sorted(call.kwargs["project_full_name"] for call in mock_method.call_args_list)
+        assert called == projects
+
+    def test_execute_queries_batch_orders_by_db_path(
+        self,
+        tmp_path: Path,
+        workflow: CodeQLQueryExecutionWorkflow,
+        mock_db_manager: SimpleNamespace,
+    ) -> None:
+        """プロジェクトがDBパスの辞書順で処理されることを確認"""
+        # Arrange
+        query_file = tmp_path / "test.ql"
+        query_file.touch()
+        mock_db_manager.get_database_path.side_effect = lambda name: tmp_path / "dbs" / name.replace("/", "-")
+
+        # Act
+        with patch.object(workflow, "execute_query_for_project") as mock_execute:
+            mock_execute.return_value = {"status": "success", "results": []}
+            workflow.execute_queries_batch(
+                projects=["microsoft/vscode", "facebook/react", "nodejs/node"],
+                query_files=[query_file],
+                output_base_dir=tmp_path,
+            )
+
+        # Assert
+        called = [call.kwargs["project_full_name"] for call in mock_execute.call_args_list]
+        assert called == ["facebook/react", "microsoft/vscode", "nodejs/node"]
+
+    def test_execute_queries_batch_validates_queries_once(
+        self, tmp_path: Path, workflow: CodeQLQueryExecutionWorkflow
+    ) -> None:
+        """クエリファイルの存在確認がプロジェクト数によらず1回ずつで済むことを確認"""
+        # Arrange
+        query_files = [tmp_path / "id_10.ql", tmp_path / "id_20.ql"]
+        for query_file in query_files:
+            query_file.touch()
+
+        # Act
+        with patch.object(Path, "exists", autospec=True, side_effect=lambda path: path.is_file()) as mock_exists:
+            stats = workflow.execute_queries_batch(
+                projects=["facebook/react", "microsoft/vscode", "nodejs/node"],
+                query_files=query_files,
+                output_base_dir=tmp_path / "outputs",
+            )
+
+        # Assert
+        assert stats == {"total": 3, "success": 3, "failed": 0}
+        checked = [call.args[0] for call in mock_exists.call_args_list if call.args[0] in query_files]
+        assert checked == query_files
+
+    def test_execute_queries_batch_missing_query_file(
+        self,
+        tmp_path: Path,
+        workflow: CodeQLQueryExecutionWorkflow,
+        mock_cli: SimpleNamespace,
+    ) -> None:
+        """クエリファイルが存在しない場合、どのプロジェクトも実行せずに全件失敗とすることを確認"""
+        # Act
+        with patch.object(workflow, "execute_query_for_project") as mock_execute:
+            stats = workflow.execute_queries_batch(
+                projects=["facebook/react", "microsoft/vscode"],
+                query_files=[tmp_path / "nonexistent.ql"],
+                output_base_dir=tmp_path,
+            )
+
+        # Assert
+        assert stats == {"total": 2, "success": 0, "failed": 2}
+        mock_execute.assert_not_called()
+        mock_cli.analyze_database.assert_not_called()
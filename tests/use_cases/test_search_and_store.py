@@ -1,7 +1,7 @@
 """SearchAndStoreWorkflow のテスト"""
 
 from datetime import UTC, datetime
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from sqlalchemy.orm import Session
@@ -35,10 +35,21 @@ def mock_github_repositories():
     ]
 
 
-def test_workflow_initialization(test_db: Session, project_service):
+@pytest.fixture
+def mock_client() -> Mock:
+    """GitHubクライアントのモック（search_repositories の戻り値は各テストで設定する）"""
+    return Mock()
+
+
+@pytest.fixture
+def workflow(mock_client: Mock, project_service) -> SearchAndStoreWorkflow:
+    """モッククライアントを注入したワークフロー"""
+    return SearchAndStoreWorkflow(github_client=mock_client, project_repo=project_service)
+
+
+def test_workflow_initialization(test_db: Session, project_service, mock_client):
     """SearchAndStoreWorkflowが正しく初期化されることを確認する"""
     # Arrange & Act
-    mock_client = Mock()
     workflow = SearchAndStoreWorkflow(github_client=mock_client, project_repo=project_service)
 
     # Assert
@@ -46,17 +57,15 @@ def test_workflow_initialization(test_db: Session, project_service):
     assert workflow.project_repo is project_service
 
 
-def test_workflow_execute_success(test_db: Session, project_service, mock_github_repositories):
+def test_workflow_execute_success(test_db: Session, project_service, mock_github_repositories, mock_client, workflow):
     """SearchAndStoreWorkflowが正常に実行されることを確認する"""
     # Arrange
-    mock_client = Mock()
     mock_client.search_repositories.return_value = mock_github_repositories
-
-    workflow = SearchAndStoreWorkflow(github_client=mock_client, project_repo=project_service)
     criteria = SearchCriteria(language="JavaScript", min_stars=100, max_days_since_commit=365)
 
     # Act
-    stats = workflow.execute(criteria, max_results=10, update_if_exists=False)
+    with patch.object(project_service, "save_projects", wraps=project_service.save_projects) as mock_save:
+        stats = workflow.execute(criteria, max_results=10, update_if_exists=False)
 
     # Assert
     assert stats["total"] == 2
@@ -65,11 +74,22 @@ def test_workflow_execute_success(test_db: Session, project_service, mock_github
     assert stats["skipped"] == 0
     assert stats["failed"] == 0
 
+    # 新規プロジェクトは1回の save_projects でまとめて保存される
+    mock_save.assert_called_once()
+    (saved_projects,) = mock_save.call_args.args
+    assert [p.full_name for p in saved_projects] == ["facebook/react", "vuejs/vue"]
+    assert project_service.count_projects() == 2
+    saved = project_service.get_project_by_full_name("facebook/react")
+    assert saved is not None
+    assert {t.name for t in saved.topics} == {"react", "javascript"}
+
     # GitHubClientのメソッドが呼ばれたことを確認
     mock_client.search_repositories.assert_called_once_with(criteria=criteria, max_results=10)
 
 
-def test_workflow_execute_with_existing_projects(test_db: Session, mock_github_repositories, project_service):
+def test_workflow_execute_with_existing_projects(
+    test_db: Session, mock_github_repositories, project_service, mock_client, workflow
+):
     """既存プロジェクトがある場合にスキップされることを確認する"""
     # Arrange: 事前に1つのプロジェクトを保存
     project_service.save_project(
@@ -82,14 +102,12 @@ def test_workflow_execute_with_existing_projects(test_db: Session, mock_github_r
         topics=["react"],
     )
 
-    mock_client = Mock()
     mock_client.search_repositories.return_value = mock_github_repositories
-
-    workflow = SearchAndStoreWorkflow(github_client=mock_client, project_repo=project_service)
     criteria = SearchCriteria(language="JavaScript", min_stars=100, max_days_since_commit=365)
 
     # Act
-    stats = workflow.execute(criteria, max_results=10, update_if_exists=False)
+    with patch.object(project_service, "get_project_by_full_name") as mock_get:
+        stats = workflow.execute(criteria, max_results=10, update_if_exists=False)
 
     # Assert
     assert stats["total"] == 2
@@ -97,9 +115,13 @@ def test_workflow_execute_with_existing_projects(test_db: Session, mock_github_r
     assert stats["updated"] == 0
     assert stats["skipped"] == 1  # facebook/react はスキップ
     assert stats["failed"] == 0
+    # 既存判定は existing_full_names の1回の問い合わせで行い、1件ずつの検索はしない
+    mock_get.assert_not_called()
 
 
-def test_workflow_execute_with_update(test_db: Session, mock_github_repositories, project_service):
+def test_workflow_execute_with_update(
+    test_db: Session, mock_github_repositories, project_service, mock_client, workflow
+):
     """update_if_existsがTrueの場合に更新されることを確認する"""
     # Arrange: 事前に1つのプロジェクトを保存
     project_service.save_project(
@@ -112,10 +134,7 @@ def test_workflow_execute_with_update(test_db: Session, mock_github_repositories
         topics=["react"],
     )
 
-    mock_client = Mock()
     mock_client.search_repositories.return_value = mock_github_repositories
-
-    workflow = SearchAndStoreWorkflow(github_client=mock_client, project_repo=project_service)
     criteria = SearchCriteria(language="JavaScript", min_stars=100, max_days_since_commit=365)
 
     # Act
@@ -135,7 +154,59 @@ def test_workflow_execute_with_update(test_db: Session, mock_github_repositories
     assert updated_project.description == "A declarative JavaScript library"
 
 
-def test_workflow_execute_with_partial_failure(test_db: Session, project_service):
+def test_workflow_execute_streams_in_chunks(test_db: Session, project_service, mock_client, workflow):
+    """検索結果がイテレータで届いても、チャンク単位でまとめて保存されることを確認する"""
+    # Arrange: 250件を1件ずつ返すジェネレータ
+    repositories = (
+        GitHubRepositoryDTO(
+            full_name=f"user/repo{i}",
+            html_url=f"https://github.com/user/repo{i}",
+            stargazers_count=100,
+            topics=["javascript"],
+        )
+        for i in range(250)
+    )
+    mock_client.search_repositories.return_value = repositories
+    criteria = SearchCriteria(language="JavaScript", min_stars=100, max_days_since_commit=365)
+
+    # Act
+    with patch.object(project_service, "save_projects", wraps=project_service.save_projects) as mock_save:
+        stats = workflow.execute(criteria, max_results=None, update_if_exists=False)
+
+    # Assert
+    assert stats["total"] == 250
+    assert stats["saved"] == 250
+    assert stats["failed"] == 0
+    # 100件ずつ保存される
+    assert [len(call.args[0]) for call in mock_save.call_args_list] == [100, 100, 50]
+    assert project_service.count_projects() == 250
+
+
+def test_workflow_execute_dedupes_by_full_name(
+    test_db: Session, project_service, mock_github_repositories, mock_client, workflow
+):
+    """検索結果に同じリポジトリが重複して含まれても1件として扱われることを確認する"""
+    # Arrange: ページをまたいで facebook/react が2回返るケース
+    react = mock_github_repositories[0]
+    mock_client.search_repositories.return_value = [react, react]
+    criteria = SearchCriteria(language="JavaScript", min_stars=100, max_days_since_commit=365)
+
+    # Act
+    with patch.object(
+        project_service, "existing_full_names", wraps=project_service.existing_full_names
+    ) as mock_existing:
+        stats = workflow.execute(criteria, max_results=10, update_if_exists=False)
+
+    # Assert
+    assert stats["total"] == 1
+    assert stats["saved"] == 1
+    assert stats["skipped"] == 0
+    # DB への既存判定にも重複は渡らず、保存時に同じ判定を繰り返さない
+    mock_existing.assert_called_once_with(["facebook/react"])
+    assert project_service.count_projects() == 1
+
+
+def test_workflow_execute_with_partial_failure(test_db: Session, mock_client, workflow):
     """一部のリポジトリ保存に失敗した場合の動作を確認する"""
     # Arrange: モックリポジトリを作成（1つは不正なデータ）
     valid_repo = GitHubRepositoryDTO(
@@ -152,10 +223,7 @@ def test_workflow_execute_with_partial_failure(test_db: Session, project_service
     invalid_repo = Mock(spec=GitHubRepositoryDTO)
     invalid_repo.full_name = None  # 不正なデータ
 
-    mock_client = Mock()
     mock_client.search_repositories.return_value = [valid_repo, invalid_repo]
-
-    workflow = SearchAndStoreWorkflow(github_client=mock_client, project_repo=project_service)
     criteria = SearchCriteria(language="JavaScript", min_stars=100, max_days_since_commit=365)
 
     # Act
@@ -167,12 +235,39 @@ def test_workflow_execute_with_partial_failure(test_db: Session, project_service
     assert stats["failed"] == 1  # invalid_repo は失敗
 
 
-def test_workflow_close(test_db: Session, project_service):
-    """SearchAndStoreWorkflowが正しくクローズできることを確認する"""
-    # Arrange
-    mock_client = Mock()
-    workflow = SearchAndStoreWorkflow(github_client=mock_client, project_repo=project_service)
+def test_workflow_execute_retries_failed_chunk_one_by_one(
+    test_db: Session, project_service, mock_github_repositories, mock_client, workflow
+):
+    """一括保存に失敗したチャンクは1件ずつ保存し直され、失敗したリポジトリだけが failed になることを確認する"""
+    # Arrange: bad/repo を含む保存だけが失敗する
+    bad_repo = GitHubRepositoryDTO(full_name="bad/repo", html_url="https://github.com/bad/repo", stargazers_count=100)
+    react, vue = mock_github_repositories
+    mock_client.search_repositories.return_value = [react, bad_repo, vue]
+    criteria = SearchCriteria(language="JavaScript", min_stars=100, max_days_since_commit=365)
+    save_projects = project_service.save_projects
+
+    def failing_save(projects, **kwargs):
+        if any(project.full_name == "bad/repo" for project in projects):
+            msg = "invalid row"
+            raise ValueError(msg)
+        return save_projects(projects, **kwargs)
 
+    # Act
+    with patch.object(project_service, "save_projects", side_effect=failing_save):
+        stats = workflow.execute(criteria, max_results=10, update_if_exists=False)
+
+    # Assert
+    assert stats["total"] == 3
+    assert stats["saved"] == 2
+    assert stats["failed"] == 1
+    assert project_service.existing_full_names(["facebook/react", "bad/repo", "vuejs/vue"]) == {
+        "facebook/react",
+        "vuejs/vue",
+    }
+
+
+def test_workflow_close(test_db: Session, mock_client, workflow):
+    """SearchAndStoreWorkflowが正しくクローズできることを確認する"""
     # Act
     workflow.close()
 
@@ -180,13 +275,10 @@ def test_workflow_close(test_db: Session, project_service):
     mock_client.close.assert_called_once()
 
 
-def test_workflow_execute_requires_criteria(test_db: Session, project_service, mock_github_repositories):
+def test_workflow_execute_requires_criteria(test_db: Session, mock_github_repositories, mock_client, workflow):
     """SearchAndStoreWorkflowがcriteriaを受け取って実行されることを確認する"""
     # Arrange
-    mock_client = Mock()
     mock_client.search_repositories.return_value = mock_github_repositories
-
-    workflow = SearchAndStoreWorkflow(github_client=mock_client, project_repo=project_service)
     criteria = SearchCriteria(language="Python", min_stars=50, max_days_since_commit=180)
 
     # Act
@@ -6,6 +6,7 @@ from pathlib import Path
 
 from pydantic import ValidationError
 import pytest
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from mb_scanner.adapters.repositories.sqlalchemy_project_repo import SqlAlchemyProjectRepository
@@ -37,70 +38,73 @@ def sample_projects(test_db: Session) -> list[Project]:
     Returns:
         list[Project]: 作成されたプロジェクトのリスト
     """
-    projects = [
-        Project(
-            full_name="test/repo1",
-            url="https://github.com/test/repo1",
-            stars=100,
-            language="JavaScript",
-            description="Test repo 1",
-            last_commit_date=datetime.now(UTC),
-            js_lines_count=1000,
-        ),
-        Project(
-            full_name="test/repo2",
-            url="https://github.com/test/repo2",
-            stars=200,
-            language="JavaScript",
-            description="Test repo 2",
-            last_commit_date=datetime.now(UTC),
-            js_lines_count=2000,
-        ),
-        Project(
-            full_name="test/repo3",
-            url="https://github.com/test/repo3",
-            stars=150,
-            language="JavaScript",
-            description="Test repo 3",
-            last_commit_date=datetime.now(UTC),
-            js_lines_count=1500,
-        ),
-        Project(
-            full_name="test/repo4",
-            url="https://github.com/test/repo4",
-            stars=300,
-            language="JavaScript",
-            description="Test repo 4",
-            last_commit_date=datetime.now(UTC),
-            js_lines_count=3000,
-        ),
-        Project(
-            full_name="test/repo5",
-            url="https://github.com/test/repo5",
-            stars=50,
-            language="JavaScript",
-            description="Test repo 5 with null js_lines_count",
-            last_commit_date=datetime.now(UTC),
-            js_lines_count=None,  # Nullケース
-        ),
+    now = datetime.now(UTC)
+    rows = [
+        {
+            "full_name": "test/repo1",
+            "url": "https://github.com/test/repo1",
+            "stars": 100,
+            "language": "JavaScript",
+            "description": "Test repo 1",
+            "last_commit_date": now,
+            "js_lines_count": 1000,
+        },
+        {
+            "full_name": "test/repo2",
+            "url": "https://github.com/test/repo2",
+            "stars": 200,
+            "language": "JavaScript",
+            "description": "Test repo 2",
+            "last_commit_date": now,
+            "js_lines_count": 2000,
+        },
+        {
+            "full_name": "test/repo3",
+            "url": "https://github.com/test/repo3",
+            "stars": 150,
+            "language": "JavaScript",
+            "description": "Test repo 3",
+            "last_commit_date": now,
+            "js_lines_count": 1500,
+        },
+        {
+            "full_name": "test/repo4",
+            "url": "https://github.com/test/repo4",
+            "stars": 300,
+            "language": "JavaScript",
+            "description": "Test repo 4",
+            "last_commit_date": now,
+            "js_lines_count": 3000,
+        },
+        {
+            "full_name": "test/repo5",
+            "url": "https://github.com/test/repo5",
+            "stars": 50,
+            "language": "JavaScript",
+            "description": "Test repo 5 with null js_lines_count",
+            "last_commit_date": now,
+            "js_lines_count": None,  # Nullケース
+        },
     ]
-    for project in projects:
-        test_db.add(project)
+    # 1件ずつ add せず、ORM の一括 INSERT（RETURNING で作成済みの行を受け取る）で投入する
+    projects = list(test_db.scalars(insert(Project).returning(Project), rows))
     test_db.commit()
     return projects
 
 
-@pytest.fixture
-def sample_json_path(tmp_path: Path) -> Path:
+@pytest.fixture(scope="module")
+def sample_json_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """テスト用のJSONファイルパスを提供するフィクスチャ
 
+    読み取り専用のため、モジュール内で1回だけ作成して共有します。
+
     Args:
-        tmp_path: pytestが提供する一時ディレクトリ
+        tmp_path_factory: pytestが提供する一時ディレクトリのファクトリ
 
     Returns:
         Path: 作成されたJSONファイルのパス
     """
-    json_file = tmp_path / "sample_query_result.json"
+    json_file = tmp_path_factory.mktemp("query_result") / "sample_query_result.json"
     data = {
         "query_id": "id_test_001",
         "total_projects": 5,
@@ -114,7 +118,29 @@ def sample_json_path(tmp_path: Path) -> Path:
         "generated_at": "2025-01-15T00:00:00.000000+00:00",
         "threshold": 0,
     }
-    json_file.write_text(json.dumps(data, indent=2))
+    json_file.write_text(json.dumps(data))
+    return json_file
+
+
+@pytest.fixture(scope="module")
+def empty_json_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """結果が空のクエリ結果JSONファイルパスを提供するフィクスチャ（モジュール内で1回だけ作成）
+
+    Args:
+        tmp_path_factory: pytestが提供する一時ディレクトリのファクトリ
+
+    Returns:
+        Path: 作成されたJSONファイルのパス
+    """
+    json_file = tmp_path_factory.mktemp("empty_query_result") / "empty_results.json"
+    data = {
+        "query_id": "id_empty",
+        "total_projects": 0,
+        "results": {},
+        "generated_at": "2025-01-15T00:00:00.000000+00:00",
+        "threshold": 0,
+    }
+    json_file.write_text(json.dumps(data))
     return json_file
 
 
@@ -217,19 +243,9 @@ class TestGetScatterData:
         self,
         visualization_service: VisualizationService,
         sample_projects: list[Project],
-        tmp_path: Path,
+        empty_json_path: Path,
     ) -> None:
         """空の結果の処理テスト"""
-        empty_json_file = tmp_path / "empty_results.json"
-        data = {
-            "query_id": "id_empty",
-            "total_projects": 0,
-            "results": {},
-            "generated_at": "2025-01-15T00:00:00.000000+00:00",
-            "threshold": 0,
-        }
-        empty_json_file.write_text(json.dumps(data))
-
-        result = visualization_service.get_scatter_data(empty_json_file)
+        result = visualization_service.get_scatter_data(empty_json_path)
 
         assert len(result) == 0